@@ -0,0 +1,279 @@
+"""
+ALCANZABILIDAD Y COMPONENTES FUERTEMENTE CONEXAS
+Descomposición en componentes fuertemente conexas (Tarjan iterativo) y su grafo
+de condensación, que es acíclico. Con la condensación (Condensacion) calculada
+una vez por el llamador y pasada a los motores en cada consulta:
+- los motores pueden limitarse a los nodos alcanzables desde el origen
+- SSSP puede recorrer las componentes en orden topológico: las componentes de
+  un solo nodo se relajan en tiempo lineal y sólo las que tienen ciclos
+  necesitan Dijkstra (o SPFA si contienen pesos negativos)
+"""
+
+import heapq
+import time
+from collections import deque
+
+from bellman_ford_spfa import _spfa
+from perfilado import perfilar
+from resultado_disperso import DistanciasDispersas, PredecesoresDispersos
+
+def componentes_fuertes(grafo):
+    """
+    Componentes fuertemente conexas con el algoritmo de Tarjan, sin recursión
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+
+    Retorna:
+    Lista de componentes (listas de nodos) en orden topológico: toda arista
+    entre componentes va de una componente a otra posterior
+    """
+    indice = {}
+    bajo = {}
+    en_pila = set()
+    pila = []
+    componentes = []
+    contador = 0
+
+    for raiz in grafo:
+        if raiz in indice:
+            continue
+
+        indice[raiz] = bajo[raiz] = contador
+        contador += 1
+        pila.append(raiz)
+        en_pila.add(raiz)
+        llamadas = [(raiz, iter(grafo[raiz]))]
+
+        while llamadas:
+            nodo, vecinos = llamadas[-1]
+            avanzo = False
+            for vecino in vecinos:
+                if vecino not in indice:
+                    indice[vecino] = bajo[vecino] = contador
+                    contador += 1
+                    pila.append(vecino)
+                    en_pila.add(vecino)
+                    llamadas.append((vecino, iter(grafo[vecino])))
+                    avanzo = True
+                    break
+                if vecino in en_pila and indice[vecino] < bajo[nodo]:
+                    bajo[nodo] = indice[vecino]
+            if avanzo:
+                continue
+
+            # Todos los vecinos de nodo explorados: volver al padre
+            llamadas.pop()
+            if llamadas:
+                padre = llamadas[-1][0]
+                if bajo[nodo] < bajo[padre]:
+                    bajo[padre] = bajo[nodo]
+
+            if bajo[nodo] == indice[nodo]:
+                componente = []
+                while True:
+                    miembro = pila.pop()
+                    en_pila.discard(miembro)
+                    componente.append(miembro)
+                    if miembro == nodo:
+                        break
+                componentes.append(componente)
+
+    # Tarjan produce las componentes en orden topológico inverso
+    componentes.reverse()
+    return componentes
+
+class Condensacion:
+    """
+    Grafo de condensación: un nodo por componente fuertemente conexa
+
+    Atributos:
+    componentes: listas de nodos, en orden topológico
+    componente: diccionario nodo -> número de su componente
+    sucesores: conjunto de componentes destino de cada componente
+    ciclica: True si la componente tiene algún ciclo (más de un nodo o un lazo)
+    """
+
+    def __init__(self, grafo):
+        self.componentes = componentes_fuertes(grafo)
+        self.componente = {nodo: c for c, nodos in enumerate(self.componentes) for nodo in nodos}
+        self.sucesores = [set() for _ in self.componentes]
+        self.ciclica = [len(nodos) > 1 for nodos in self.componentes]
+
+        for nodo, vecinos in grafo.items():
+            c = self.componente[nodo]
+            for vecino in vecinos:
+                d = self.componente[vecino]
+                if d != c:
+                    self.sucesores[c].add(d)
+                elif vecino == nodo:
+                    self.ciclica[c] = True
+
+    def componentes_alcanzables(self, origen):
+        """
+        Componentes alcanzables desde el nodo origen, en orden topológico
+        """
+        inicio = self.componente[origen]
+        visitadas = {inicio}
+        cola = deque([inicio])
+        while cola:
+            for d in self.sucesores[cola.popleft()]:
+                if d not in visitadas:
+                    visitadas.add(d)
+                    cola.append(d)
+        # La numeración de las componentes ya es un orden topológico
+        return sorted(visitadas)
+
+    def nodos_alcanzables(self, origen):
+        """
+        Nodos alcanzables desde origen (incluido), agrupados por componente
+        """
+        return [nodo for c in self.componentes_alcanzables(origen) for nodo in self.componentes[c]]
+
+def nodos_alcanzables(grafo, origen, condensacion=None):
+    """
+    Nodos alcanzables desde origen (incluido)
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+    origen: nodo de inicio
+    condensacion: Condensacion(grafo) para consultas repetidas sobre el mismo
+                  grafo (si el grafo cambia, el llamador debe recalcularla);
+                  sin ella se hace un BFS que sólo recorre lo alcanzable
+    """
+    if condensacion is not None:
+        return condensacion.nodos_alcanzables(origen)
+
+    visitados = {origen}
+    orden = [origen]
+    for nodo in orden:
+        for vecino in grafo[nodo]:
+            if vecino not in visitados:
+                visitados.add(vecino)
+                orden.append(vecino)
+    return orden
+
+@perfilar
+def sssp_por_componentes(grafo, origen, disperso=False, condensacion=None):
+    """
+    SSSP recorriendo las componentes alcanzables en orden topológico
+
+    Las componentes sin ciclos (un solo nodo) se resuelven relajando sus
+    aristas una vez; las cíclicas con Dijkstra restringido a la componente,
+    sembrado con las distancias que llegan de componentes anteriores (o con
+    SPFA si tienen pesos negativos internos). Las aristas entre componentes
+    pueden ser negativas.
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+    origen: nodo de inicio
+    disperso: si es True, sólo se guardan los nodos alcanzados
+    condensacion: Condensacion(grafo) precalculada, para consultas repetidas
+
+    Retorna:
+    distancias, predecesores (igual que dijkstra_original)
+
+    Lanza:
+    CicloNegativoError si una componente alcanzable tiene un ciclo negativo
+    """
+    cond = condensacion if condensacion is not None else Condensacion(grafo)
+    componente = cond.componente
+
+    if disperso:
+        distancias = DistanciasDispersas()
+        predecesores = PredecesoresDispersos()
+    else:
+        distancias = {nodo: float('inf') for nodo in grafo}
+        predecesores = {nodo: None for nodo in grafo}
+    distancias[origen] = 0
+    inf = float('inf')
+
+    for c in cond.componentes_alcanzables(origen):
+        nodos = cond.componentes[c]
+
+        if cond.ciclica[c]:
+            internos = {nodo: {v: w for v, w in grafo[nodo].items() if componente[v] == c} for nodo in nodos}
+
+            if any(w < 0 for vecinos in internos.values() for w in vecinos.values()):
+                # Pesos negativos dentro de la componente: SPFA sobre el subgrafo
+                locales = {nodo: distancias[nodo] for nodo in nodos}
+                previos = {nodo: None for nodo in nodos}
+                _spfa(internos, locales, previos, deque(nodo for nodo in nodos if locales[nodo] < inf))
+                for nodo in nodos:
+                    if previos[nodo] is not None:
+                        distancias[nodo] = locales[nodo]
+                        predecesores[nodo] = previos[nodo]
+            else:
+                # Dijkstra dentro de la componente, sembrado con las distancias de entrada
+                heap = [(distancias[nodo], nodo) for nodo in nodos if distancias[nodo] < inf]
+                heapq.heapify(heap)
+                procesados = set()
+                while heap:
+                    distancia_actual, nodo_actual = heapq.heappop(heap)
+                    if nodo_actual in procesados:
+                        continue
+                    procesados.add(nodo_actual)
+                    for vecino, peso in internos[nodo_actual].items():
+                        nueva_distancia = distancia_actual + peso
+                        if nueva_distancia < distancias[vecino]:
+                            distancias[vecino] = nueva_distancia
+                            predecesores[vecino] = nodo_actual
+                            heapq.heappush(heap, (nueva_distancia, vecino))
+
+        # Distancias de la componente finales: relajar las aristas hacia componentes posteriores
+        for nodo in nodos:
+            distancia_actual = distancias[nodo]
+            if distancia_actual == inf:
+                continue
+            for vecino, peso in grafo[nodo].items():
+                if componente[vecino] != c and distancia_actual + peso < distancias[vecino]:
+                    distancias[vecino] = distancia_actual + peso
+                    predecesores[vecino] = nodo
+
+    return distancias, predecesores
+
+def ejecutar_prueba_alcanzabilidad():
+    """
+    Compara dijkstra_original, sssp_por_componentes y AlgoritmoNuevoSSSP con y
+    sin poda de nodos inalcanzables en un grafo dirigido disperso
+    """
+    import random
+    from algoritmo_nuevo import AlgoritmoNuevoSSSP
+    from dijkstra_original import dijkstra_original
+
+    generador = random.Random(0)
+    n = 50000
+    grafo = {i: {} for i in range(n)}
+    for i in range(n):
+        for _ in range(generador.randint(0, 2)):
+            j = generador.randrange(n)
+            if i != j:
+                grafo[i][j] = generador.randint(1, 100)
+
+    inicio = time.time()
+    cond = Condensacion(grafo)
+    tiempo_condensacion = time.time() - inicio
+    ciclicas = sum(cond.ciclica)
+    alcanzables = cond.nodos_alcanzables(0)
+    print(f"GRAFO DIRIGIDO: n={n}, m={sum(len(v) for v in grafo.values())}")
+    print(f"Condensación: {len(cond.componentes)} componentes ({ciclicas} cíclicas) "
+          f"en {tiempo_condensacion:.4f} segundos; {len(alcanzables)} nodos alcanzables desde 0")
+
+    inicio = time.time()
+    referencia, _ = dijkstra_original(grafo, 0)
+    print(f"dijkstra_original:          {time.time() - inicio:.4f} segundos")
+
+    inicio = time.time()
+    distancias, _ = sssp_por_componentes(grafo, 0, condensacion=cond)
+    print(f"sssp_por_componentes:       {time.time() - inicio:.4f} segundos, iguales: {distancias == referencia}")
+
+    resultados = {}
+    for solo_alcanzables in (False, True):
+        inicio = time.time()
+        resultados[solo_alcanzables], _ = AlgoritmoNuevoSSSP().resolver(grafo, 0, solo_alcanzables=solo_alcanzables,
+                                                                        condensacion=cond)
+        print(f"AlgoritmoNuevoSSSP (poda={solo_alcanzables}): {time.time() - inicio:.4f} segundos")
+    print(f"Mismo resultado con y sin poda: {resultados[False] == resultados[True]}")
+
+if __name__ == "__main__":
+    ejecutar_prueba_alcanzabilidad()
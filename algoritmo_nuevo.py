@@ -8,6 +8,10 @@ import math
 import time
 from collections import defaultdict
 
+from alcanzabilidad import nodos_alcanzables
+from perfilado import fase, perfilar
+from resultado_disperso import DistanciasDispersas, PredecesoresDispersos
+
 class AlgoritmoNuevoSSSP:
     """
     Implementación del algoritmo con complejidad O(m log^{2/3} n)
@@ -18,50 +22,70 @@ class AlgoritmoNuevoSSSP:
         self.distancias = None
         self.predecesores = None
     
-    def resolver(self, grafo, origen):
+    @perfilar(nombre='algoritmo_nuevo')
+    def resolver(self, grafo, origen, disperso=False, solo_alcanzables=True, condensacion=None):
         """
         Resuelve el problema SSSP usando el nuevo algoritmo
         
         Parámetros:
         grafo: diccionario de diccionarios {nodo: {vecino: peso}}
         origen: nodo de inicio
+        disperso: si es True, sólo se guardan los nodos alcanzados
+                  (DistanciasDispersas / PredecesoresDispersos)
+        solo_alcanzables: si es True, sólo se agrupan y procesan los nodos
+                          alcanzables desde origen; el resultado es el mismo
+        condensacion: Condensacion(grafo) de alcanzabilidad.py, para no volver
+                      a buscar los alcanzables en consultas repetidas
         
         Retorna:
         distancias: diccionario con distancias mínimas
         predecesores: diccionario para reconstruir caminos
         """
-        n = len(grafo)
-        m = sum(len(vecinos) for vecinos in grafo.values())
-        
-        # Calcular parámetro L = log^{2/3} n
-        if n <= 1:
-            L = 1
-        else:
-            L = int(math.pow(math.log2(n), 2/3))
-            L = max(L, 1)  # Asegurar que sea al menos 1
+        with fase('inicializacion'):
+            n = len(grafo)
+            m = sum(len(vecinos) for vecinos in grafo.values())
+            
+            # Calcular parámetro L = log^{2/3} n
+            if n <= 1:
+                L = 1
+            else:
+                L = int(math.pow(math.log2(n), 2/3))
+                L = max(L, 1)  # Asegurar que sea al menos 1
+            
+            # Inicializar estructuras
+            if disperso:
+                self.distancias = DistanciasDispersas()
+                self.predecesores = PredecesoresDispersos()
+            else:
+                self.distancias = {nodo: float('inf') for nodo in grafo}
+                self.predecesores = {nodo: None for nodo in grafo}
+            self.distancias[origen] = 0
         
-        # Inicializar estructuras
-        self.distancias = {nodo: float('inf') for nodo in grafo}
-        self.predecesores = {nodo: None for nodo in grafo}
-        self.distancias[origen] = 0
+        # Los nodos inalcanzables nunca entran en la cola de ningún nivel
+        nodos = grafo
+        if solo_alcanzables:
+            with fase('alcanzables'):
+                nodos = nodos_alcanzables(grafo, origen, condensacion)
         
         # Dividir vértices en clusters basados en distancia inicial
-        clusters = self._crear_clusters(grafo, L, origen)
+        with fase('crear_clusters'):
+            clusters = self._crear_clusters(nodos, L, origen)
         
         # Procesar por niveles/clusters
         for nivel in range(L):
-            self._procesar_nivel(grafo, clusters, nivel)
+            with fase('procesar_nivel'):
+                self._procesar_nivel(grafo, clusters, nivel)
         
         return self.distancias, self.predecesores
     
-    def _crear_clusters(self, grafo, L, origen):
+    def _crear_clusters(self, nodos, L, origen):
         """
         Crea clusters de nodos basados en distancias iniciales
         """
         clusters = [[] for _ in range(L)]
         
         # Asignar cada nodo a un cluster basado en hash simple
-        for nodo in grafo:
+        for nodo in nodos:
             if nodo == origen:
                 cluster_id = 0
             else:
@@ -90,38 +114,41 @@ class AlgoritmoNuevoSSSP:
                 cola_nivel.append((self.distancias[nodo], nodo))
         
         # Ordenar por distancia (simulación de heap)
-        cola_nivel.sort()
+        with fase('ordenar'):
+            cola_nivel.sort()
         
-        # Procesar nodos en este nivel
+        # Procesar nodos en este nivel (la fase cubre el bucle completo,
+        # incluidos los reordenamientos tras cada inserción)
         procesados = set()
         
-        while cola_nivel:
-            distancia_actual, nodo_actual = cola_nivel.pop(0)
-            
-            if nodo_actual in procesados:
-                continue
-            
-            procesados.add(nodo_actual)
-            
-            # Relajar aristas
-            for vecino, peso in grafo[nodo_actual].items():
-                nueva_distancia = distancia_actual + peso
+        with fase('relajar'):
+            while cola_nivel:
+                distancia_actual, nodo_actual = cola_nivel.pop(0)
                 
-                if nueva_distancia < self.distancias[vecino]:
-                    self.distancias[vecino] = nueva_distancia
-                    self.predecesores[vecino] = nodo_actual
-                    
-                    # Determinar en qué cluster está el vecino
-                    if isinstance(vecino, str):
-                        hash_val = sum(ord(c) for c in vecino)
-                    else:
-                        hash_val = vecino
+                if nodo_actual in procesados:
+                    continue
+                
+                procesados.add(nodo_actual)
+                
+                # Relajar aristas
+                for vecino, peso in grafo[nodo_actual].items():
+                    nueva_distancia = distancia_actual + peso
                     
-                    # Solo agregar si está en un nivel igual o mayor
-                    cluster_vecino = hash_val % len(clusters)
-                    if cluster_vecino >= nivel:
-                        cola_nivel.append((nueva_distancia, vecino))
-                        cola_nivel.sort()
+                    if nueva_distancia < self.distancias[vecino]:
+                        self.distancias[vecino] = nueva_distancia
+                        self.predecesores[vecino] = nodo_actual
+                        
+                        # Determinar en qué cluster está el vecino
+                        if isinstance(vecino, str):
+                            hash_val = sum(ord(c) for c in vecino)
+                        else:
+                            hash_val = vecino
+                        
+                        # Solo agregar si está en un nivel igual o mayor
+                        cluster_vecino = hash_val % len(clusters)
+                        if cluster_vecino >= nivel:
+                            cola_nivel.append((nueva_distancia, vecino))
+                            cola_nivel.sort()
 
 def reconstruir_camino_nuevo(predecesores, destino):
     """
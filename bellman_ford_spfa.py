@@ -0,0 +1,196 @@
+"""
+BELLMAN-FORD CON COLA (SPFA) PARA PESOS NEGATIVOS
+Variante de Bellman-Ford que sólo relaja aristas de nodos cuya distancia cambió,
+con las heurísticas SLF (Small Label First) y LLL (Large Label Last) para el
+orden de la cola, y detección de ciclos negativos con reporte del ciclo
+Complejidad: O(n·m) en el peor caso, cercana a O(m) en la práctica
+"""
+
+import time
+from collections import deque
+
+from perfilado import perfilar
+
+class CicloNegativoError(ValueError):
+    """
+    El grafo contiene un ciclo de peso negativo alcanzable; ciclo es la
+    lista de nodos del ciclo en el orden de las aristas
+    """
+
+    def __init__(self, ciclo):
+        self.ciclo = ciclo
+        super().__init__(f"El grafo contiene un ciclo negativo: {ciclo}")
+
+def _buscar_ciclo(predecesores):
+    """
+    Busca un ciclo en el grafo de predecesores (todo ciclo allí es negativo)
+
+    Retorna:
+    Lista de nodos del ciclo en el orden de las aristas, o None
+    """
+    estado = {}  # nodo -> número del recorrido en que se visitó
+
+    for inicio in predecesores:
+        if inicio in estado:
+            continue
+        nodo = inicio
+        while nodo is not None and nodo not in estado:
+            estado[nodo] = inicio
+            nodo = predecesores[nodo]
+
+        # El recorrido actual se cerró sobre sí mismo: hay ciclo
+        if nodo is not None and estado[nodo] == inicio:
+            ciclo = [nodo]
+            actual = predecesores[nodo]
+            while actual != nodo:
+                ciclo.append(actual)
+                actual = predecesores[actual]
+            ciclo.reverse()
+            return ciclo
+
+    return None
+
+def _spfa(grafo, distancias, predecesores, cola):
+    """
+    Núcleo de SPFA: relaja desde los nodos de la cola hasta que no haya cambios
+
+    Modifica distancias y predecesores en sitio. Lanza CicloNegativoError si
+    algún camino mejorado alcanza n aristas.
+    """
+    n = len(grafo)
+    en_cola = set(cola)
+    longitud = {nodo: 0 for nodo in cola}  # Aristas del camino actual
+    suma_cola = sum(distancias[nodo] for nodo in cola)
+
+    while cola:
+        # LLL: mandar al final los nodos con etiqueta mayor que el promedio
+        for _ in range(len(cola)):
+            if distancias[cola[0]] * len(cola) <= suma_cola:
+                break
+            cola.rotate(-1)
+
+        nodo_actual = cola.popleft()
+        en_cola.discard(nodo_actual)
+        distancia_actual = distancias[nodo_actual]
+        suma_cola -= distancia_actual
+
+        for vecino, peso in grafo[nodo_actual].items():
+            nueva_distancia = distancia_actual + peso
+
+            if nueva_distancia < distancias[vecino]:
+                if vecino in en_cola:
+                    suma_cola += nueva_distancia - distancias[vecino]
+                distancias[vecino] = nueva_distancia
+                predecesores[vecino] = nodo_actual
+                longitud[vecino] = longitud[nodo_actual] + 1
+
+                # Un camino simple tiene como máximo n - 1 aristas
+                if longitud[vecino] >= n:
+                    ciclo = _buscar_ciclo(predecesores)
+                    if ciclo is not None:
+                        raise CicloNegativoError(ciclo)
+
+                if vecino not in en_cola:
+                    # SLF: al frente si mejora a la cabeza de la cola
+                    if cola and nueva_distancia < distancias[cola[0]]:
+                        cola.appendleft(vecino)
+                    else:
+                        cola.append(vecino)
+                    en_cola.add(vecino)
+                    suma_cola += nueva_distancia
+
+@perfilar
+def spfa(grafo, origen):
+    """
+    Camino más corto desde un origen admitiendo pesos negativos
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+    origen: nodo de inicio
+
+    Retorna:
+    distancias: diccionario con la distancia mínima desde origen a cada nodo
+    predecesores: diccionario para reconstruir los caminos
+
+    Lanza:
+    CicloNegativoError si hay un ciclo negativo alcanzable desde origen
+    """
+    distancias = {nodo: float('inf') for nodo in grafo}
+    predecesores = {nodo: None for nodo in grafo}
+    distancias[origen] = 0
+
+    _spfa(grafo, distancias, predecesores, deque([origen]))
+
+    return distancias, predecesores
+
+def potenciales_johnson(grafo):
+    """
+    Potenciales h(v) = distancia desde un super-origen virtual unido con
+    peso 0 a todos los nodos; cumplen w(u, v) + h(u) - h(v) >= 0
+
+    Lanza:
+    CicloNegativoError si el grafo tiene algún ciclo negativo
+    """
+    potenciales = {nodo: 0 for nodo in grafo}
+    predecesores = {nodo: None for nodo in grafo}
+
+    _spfa(grafo, potenciales, predecesores, deque(grafo))
+
+    return potenciales
+
+def bellman_ford_ingenuo(grafo, origen):
+    """
+    Bellman-Ford clásico O(n·m): n - 1 rondas relajando todas las aristas
+    """
+    distancias = {nodo: float('inf') for nodo in grafo}
+    distancias[origen] = 0
+
+    for _ in range(len(grafo) - 1):
+        for nodo, vecinos in grafo.items():
+            if distancias[nodo] == float('inf'):
+                continue
+            for vecino, peso in vecinos.items():
+                if distancias[nodo] + peso < distancias[vecino]:
+                    distancias[vecino] = distancias[nodo] + peso
+
+    return distancias
+
+def ejecutar_prueba_spfa():
+    """
+    Compara SPFA con Bellman-Ford ingenuo en un grafo con rebajas de costo
+    y muestra la detección de un ciclo negativo
+    """
+    import random
+
+    n = 400
+    # Potenciales aleatorios: pesos negativos sin ciclos negativos
+    potencial = [random.randint(0, 50) for _ in range(n)]
+    grafo = {i: {} for i in range(n)}
+    for i in range(n):
+        for j in random.sample(range(n), 5):
+            if i != j:
+                grafo[i][j] = random.randint(1, 30) + potencial[i] - potencial[j]
+
+    inicio = time.time()
+    distancias, _ = spfa(grafo, 0)
+    tiempo_spfa = time.time() - inicio
+
+    inicio = time.time()
+    distancias_bf = bellman_ford_ingenuo(grafo, 0)
+    tiempo_bf = time.time() - inicio
+
+    print(f"GRAFO CON PESOS NEGATIVOS: n={n}, m={sum(len(v) for v in grafo.values())}")
+    print(f"SPFA (SLF/LLL):        {tiempo_spfa:.6f} segundos")
+    print(f"Bellman-Ford ingenuo:  {tiempo_bf:.6f} segundos")
+    print(f"Resultados iguales: {distancias == distancias_bf}")
+
+    grafo_ciclo = {'A': {'B': 1}, 'B': {'C': -3}, 'C': {'A': 1, 'D': 2}, 'D': {}}
+    try:
+        spfa(grafo_ciclo, 'A')
+    except CicloNegativoError as error:
+        print(f"Ciclo negativo detectado: {error.ciclo}")
+
+    return tiempo_spfa, distancias
+
+if __name__ == "__main__":
+    tiempo_spfa, distancias_spfa = ejecutar_prueba_spfa()
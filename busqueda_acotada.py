@@ -0,0 +1,120 @@
+"""
+BÚSQUEDAS TRUNCADAS: RADIO ACOTADO Y K MÁS CERCANOS
+Variantes de Dijkstra que se detienen al superar una distancia R o al procesar
+k nodos. No se inicializan diccionarios de tamaño n: sólo se guardan los nodos
+tocados, así que el costo depende de la bola explorada y no del tamaño del grafo.
+"""
+
+import heapq
+import time
+
+from perfilado import perfilar
+from resultado_disperso import DistanciasDispersas, PredecesoresDispersos
+
+def _dijkstra_truncado(grafo, origen, radio, k):
+    """
+    Dijkstra que se detiene al superar radio o tras procesar k nodos
+
+    Retorna:
+    distancias, predecesores: sólo de los nodos procesados (distancias finales)
+    """
+    tentativas = {origen: 0}
+    padres = {origen: None}
+    distancias = DistanciasDispersas()
+    predecesores = PredecesoresDispersos()
+
+    heap = [(0, origen)]
+
+    while heap and len(distancias) < k:
+        distancia_actual, nodo_actual = heapq.heappop(heap)
+
+        if nodo_actual in distancias:
+            continue
+
+        # El heap entrega distancias crecientes: nada más cae dentro del radio
+        if distancia_actual > radio:
+            break
+
+        distancias[nodo_actual] = distancia_actual
+        predecesores[nodo_actual] = padres[nodo_actual]
+
+        for vecino, peso in grafo[nodo_actual].items():
+            if vecino in distancias:
+                continue
+
+            nueva_distancia = distancia_actual + peso
+
+            if nueva_distancia <= radio and nueva_distancia < tentativas.get(vecino, float('inf')):
+                tentativas[vecino] = nueva_distancia
+                padres[vecino] = nodo_actual
+                heapq.heappush(heap, (nueva_distancia, vecino))
+
+    return distancias, predecesores
+
+@perfilar
+def dijkstra_radio(grafo, origen, radio):
+    """
+    Nodos a distancia <= radio del origen
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+    origen: nodo de inicio
+    radio: distancia máxima
+
+    Retorna:
+    distancias: DistanciasDispersas sólo con los nodos dentro del radio
+    predecesores: diccionario para reconstruir los caminos de esos nodos
+    """
+    return _dijkstra_truncado(grafo, origen, radio, float('inf'))
+
+@perfilar
+def dijkstra_k_cercanos(grafo, origen, k):
+    """
+    Los k nodos más cercanos al origen (incluido el propio origen)
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+    origen: nodo de inicio
+    k: número de nodos
+
+    Retorna:
+    distancias: DistanciasDispersas con hasta k nodos, en orden de distancia
+    predecesores: diccionario para reconstruir los caminos de esos nodos
+    """
+    return _dijkstra_truncado(grafo, origen, float('inf'), k)
+
+def ejecutar_prueba_acotada():
+    """
+    Compara las búsquedas truncadas con dijkstra_original en un grafo grande
+    """
+    import random
+    from dijkstra_original import dijkstra_original
+
+    n = 100000
+    grafo = {i: {} for i in range(n)}
+    for i in range(n):
+        for j in random.sample(range(n), 4):
+            if i != j:
+                grafo[i][j] = random.randint(1, 100)
+
+    inicio = time.time()
+    completas, _ = dijkstra_original(grafo, 0)
+    tiempo_completo = time.time() - inicio
+
+    inicio = time.time()
+    en_radio, _ = dijkstra_radio(grafo, 0, 100)
+    tiempo_radio = time.time() - inicio
+
+    inicio = time.time()
+    cercanos, _ = dijkstra_k_cercanos(grafo, 0, 50)
+    tiempo_k = time.time() - inicio
+
+    print(f"GRAFO ALEATORIO n={n}")
+    print(f"dijkstra_original:       {tiempo_completo:.4f} segundos")
+    print(f"Radio 100 ({len(en_radio)} nodos): {tiempo_radio:.4f} segundos, "
+          f"iguales: {all(completas[v] == d for v, d in en_radio.items())}")
+    print(f"50 más cercanos:          {tiempo_k:.4f} segundos, "
+          f"iguales: {all(completas[v] == d for v, d in cercanos.items())}")
+
+if __name__ == "__main__":
+    ejecutar_prueba_acotada()
@@ -0,0 +1,331 @@
+"""
+CACHÉ DE ARTEFACTOS DIRECCIONADA POR CONTENIDO
+Guarda en disco, en formato binario compacto (.npz / .npy de NumPy):
+- grafos generados, por (generador, parámetros, semilla)
+- distancias de referencia, por (hash del grafo, origen)
+- tiempos medidos y su comprobación contra la referencia, por (código del
+  motor y de las funciones y clases del proyecto que usa, hash del grafo,
+  origen, repeticiones, máquina)
+Así una nueva ejecución de la matriz de experimentos no regenera grafos ni
+recalcula referencias, y sólo vuelve a medir y comprobar los motores cuyo
+código cambió.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+from dijkstra_original import dijkstra_original
+from generadores_grafos import generar
+from grafo_compacto import GrafoCompacto
+
+def _hash(*partes):
+    """
+    SHA-256 (hex, 32 caracteres) de una lista de valores serializables a JSON
+    """
+    texto = json.dumps(partes, sort_keys=True, default=str)
+    return hashlib.sha256(texto.encode()).hexdigest()[:32]
+
+def _arreglos_grafo(grafo):
+    """
+    Arreglos compactos que representan el grafo (y que se guardan en disco)
+    """
+    compacto = GrafoCompacto.desde_dict(grafo)
+
+    pesos = compacto.pesos
+    if len(pesos) and np.all(pesos == np.round(pesos)) and np.abs(pesos).max() < 2 ** 31:
+        pesos = pesos.astype(np.int32)
+
+    indices = compacto.indices
+    if compacto.n < 2 ** 31:
+        indices = indices.astype(np.int32)
+
+    return {
+        'indptr': compacto.indptr,
+        'indices': indices,
+        'pesos': pesos,
+        'nodos': np.array(json.dumps(compacto.nodos)),
+    }
+
+def hash_grafo(grafo):
+    """
+    Hash del contenido del grafo (nodos en orden, aristas y pesos)
+    """
+    sha = hashlib.sha256()
+    for nombre, arreglo in sorted(_arreglos_grafo(grafo).items()):
+        sha.update(nombre.encode())
+        sha.update(str(arreglo.dtype).encode())
+        sha.update(arreglo.tobytes())
+    return sha.hexdigest()[:32]
+
+# Directorio del proyecto: sólo el código de aquí entra en la huella de un motor
+_DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Constantes de módulo cuyo valor entra en la huella (umbrales, coeficientes...)
+_CONSTANTES = (bool, int, float, complex, str, bytes, tuple, list, dict, set, frozenset)
+
+def _es_del_proyecto(objeto):
+    """
+    True si la función, clase o módulo está definido en un archivo del proyecto
+    """
+    if not inspect.ismodule(objeto):
+        objeto = sys.modules.get(getattr(objeto, '__module__', None) or '')
+    archivo = getattr(objeto, '__file__', None)
+    return archivo is not None and os.path.dirname(os.path.abspath(archivo)) == _DIRECTORIO
+
+def _nombres_usados(codigo):
+    """
+    Nombres globales y atributos que usa un objeto de código, incluidos los de
+    sus funciones anidadas, lambdas y comprensiones
+    """
+    nombres = set(codigo.co_names)
+    for constante in codigo.co_consts:
+        if inspect.iscode(constante):
+            nombres |= _nombres_usados(constante)
+    return nombres
+
+def _fuente(objeto):
+    try:
+        return inspect.getsource(objeto)
+    except (OSError, TypeError):
+        # Sin fuente disponible (p. ej. definido en un notebook): el bytecode
+        return getattr(getattr(objeto, '__code__', None), 'co_code', b'').hex()
+
+def _codigo_usado(motor):
+    """
+    Fuente de la función y de las funciones y clases del proyecto que usa,
+    directa o indirectamente, más las constantes de módulo que lee
+
+    Se siguen los nombres globales del código, los atributos de los módulos
+    del proyecto que usa (modulo.funcion, también con import dentro de la
+    función si el módulo ya está cargado), las variables de clausura y los
+    valores por defecto. Una clase entra completa, con lo que usan sus métodos.
+
+    Retorna:
+    Lista ordenada de (módulo, nombre, fuente o repr)
+    """
+    partes = set()
+    vistos = set()
+    pendientes = [motor]
+    while pendientes:
+        objeto = inspect.unwrap(pendientes.pop())
+        if id(objeto) in vistos:
+            continue
+        vistos.add(id(objeto))
+        partes.add((getattr(objeto, '__module__', ''), getattr(objeto, '__qualname__', ''), _fuente(objeto)))
+
+        if inspect.isclass(objeto):
+            pendientes.extend(base for base in objeto.__bases__ if _es_del_proyecto(base))
+            for atributo in vars(objeto).values():
+                if isinstance(atributo, (staticmethod, classmethod)):
+                    atributo = atributo.__func__
+                elif isinstance(atributo, property):
+                    atributo = atributo.fget
+                if inspect.isfunction(atributo):
+                    pendientes.extend(_usados_por_funcion(atributo, partes))
+        elif inspect.isfunction(objeto):
+            pendientes.extend(_usados_por_funcion(objeto, partes))
+
+    return sorted(partes)
+
+def _usados_por_funcion(funcion, partes):
+    """
+    Funciones y clases del proyecto que usa una función; las constantes de
+    módulo que lee se añaden directamente a partes
+    """
+    nombres = _nombres_usados(funcion.__code__)
+    candidatos = list(funcion.__defaults__ or ()) + list((funcion.__kwdefaults__ or {}).values())
+    candidatos += [celda.cell_contents for celda in funcion.__closure__ or ()
+                   if celda.cell_contents is not None]
+
+    # Espacios de nombres donde buscar: los globales de la función y los
+    # módulos del proyecto que usa (modulo.funcion o import dentro de la función)
+    espacios = [(funcion.__module__, funcion.__globals__)]
+    for nombre in nombres:
+        valor = funcion.__globals__.get(nombre, sys.modules.get(nombre))
+        if inspect.ismodule(valor) and _es_del_proyecto(valor):
+            espacios.append((valor.__name__, vars(valor)))
+
+    for modulo, espacio in espacios:
+        for nombre in nombres:
+            if nombre not in espacio:
+                continue
+            valor = espacio[nombre]
+            if isinstance(valor, _CONSTANTES):
+                if _es_del_proyecto(sys.modules.get(modulo)):
+                    partes.add((modulo, nombre, repr(valor)))
+            else:
+                candidatos.append(valor)
+
+    return [valor for valor in candidatos
+            if (inspect.isfunction(valor) or inspect.isclass(valor)) and _es_del_proyecto(valor)]
+
+def huella_motor(motor, version=None):
+    """
+    Hash del código de un motor: cambia cuando cambia su fuente o la de alguna
+    función o clase del proyecto que usa (GrafoCompacto, conversiones, etc.),
+    pero no cuando cambia otra parte de los mismos archivos
+
+    Parámetros:
+    motor: función del motor
+    version: clave adicional del llamador, para dependencias que no se ven
+             desde el código (p. ej. imports de módulos aún no cargados)
+    """
+    return _hash(getattr(motor, '__module__', ''), getattr(motor, '__qualname__', ''),
+                 _codigo_usado(motor), version)
+
+def huella_maquina():
+    """
+    Identifica la máquina y el intérprete en que se midieron los tiempos
+    """
+    return {
+        'maquina': platform.node(),
+        'procesador': platform.processor() or platform.machine(),
+        'sistema': platform.platform(),
+        'python': sys.version.split()[0],
+    }
+
+class CacheArtefactos:
+    """
+    Caché en disco de grafos, distancias de referencia y tiempos
+    """
+
+    def __init__(self, directorio='cache_artefactos'):
+        self.directorio = directorio
+        for subdirectorio in ('grafos', 'referencias', 'tiempos'):
+            os.makedirs(os.path.join(directorio, subdirectorio), exist_ok=True)
+        self.aciertos = 0
+        self.fallos = 0
+
+    def _ruta(self, subdirectorio, clave, extension):
+        return os.path.join(self.directorio, subdirectorio, clave + extension)
+
+    def _escribir(self, ruta, guardar):
+        """
+        Escritura atómica: se escribe a un temporal y se renombra
+        """
+        temporal = ruta + f'.{os.getpid()}.tmp'
+        with open(temporal, 'wb') as archivo:
+            guardar(archivo)
+        os.replace(temporal, ruta)
+
+    def obtener_grafo(self, generador, semilla, **parametros):
+        """
+        Grafo generado por generadores_grafos.generar, leído de la caché si existe
+
+        Parámetros:
+        generador: nombre del generador en generadores_grafos.GENERADORES
+        semilla: semilla del generador
+        parametros: argumentos del generador
+
+        Retorna:
+        Diccionario de diccionarios {nodo: {vecino: peso}}
+        """
+        ruta = self._ruta('grafos', _hash(generador, semilla, parametros), '.npz')
+
+        if os.path.exists(ruta):
+            self.aciertos += 1
+            with np.load(ruta) as datos:
+                nodos = json.loads(str(datos['nodos']))
+                compacto = GrafoCompacto(nodos, datos['indptr'], datos['indices'], datos['pesos'])
+                return compacto.a_dict()
+
+        self.fallos += 1
+        grafo = generar(generador, semilla, **parametros)
+        arreglos = _arreglos_grafo(grafo)
+        self._escribir(ruta, lambda archivo: np.savez_compressed(archivo, **arreglos))
+        return grafo
+
+    def distancias_referencia(self, grafo, origen, motor=dijkstra_original, clave_grafo=None):
+        """
+        Distancias desde origen calculadas por el motor de referencia, leídas
+        de la caché si ya se calcularon para este mismo grafo
+
+        Parámetros:
+        clave_grafo: hash_grafo(grafo) precalculado (opcional)
+
+        Retorna:
+        Diccionario {nodo: distancia} con inf en los nodos inalcanzables
+        """
+        if clave_grafo is None:
+            clave_grafo = hash_grafo(grafo)
+        ruta = self._ruta('referencias', _hash(clave_grafo, origen, huella_motor(motor)), '.npy')
+
+        if os.path.exists(ruta):
+            self.aciertos += 1
+            return dict(zip(grafo, np.load(ruta).tolist()))
+
+        self.fallos += 1
+        distancias, _ = motor(grafo, origen)
+        arreglo = np.array([distancias[nodo] for nodo in grafo], dtype=np.float64)
+        self._escribir(ruta, lambda archivo: np.save(archivo, arreglo))
+        return distancias
+
+    def tiempo_motor(self, motor, grafo, origen, repeticiones=10, clave_grafo=None, version=None):
+        """
+        Tiempo promedio de motor(grafo, origen); sólo se mide si el código del
+        motor (o de los módulos de los que depende), el grafo o la máquina
+        cambiaron desde la última medición
+
+        Parámetros:
+        version: clave adicional para huella_motor (opcional)
+
+        Retorna:
+        Tiempo promedio por ejecución en segundos
+        """
+        return self.medir_motor(motor, grafo, origen, repeticiones, clave_grafo, version)['tiempo']
+
+    def medir_motor(self, motor, grafo, origen, repeticiones=10, clave_grafo=None, version=None, referencia=None):
+        """
+        Como tiempo_motor, pero además comprueba las distancias del motor
+        contra una referencia. La comprobación se guarda en el mismo registro
+        que el tiempo, bajo la misma huella del motor, así que sólo se repite
+        si cambió el código del motor, el grafo, la máquina o la referencia
+
+        Parámetros:
+        referencia: diccionario {nodo: distancia} esperado (opcional); el
+                    motor puede retornar las distancias solas o en una tupla
+                    (distancias, predecesores)
+
+        Retorna:
+        Diccionario con motor, tiempo, repeticiones y, si se dio referencia,
+        coincide (True si las distancias son iguales a la referencia)
+        """
+        if clave_grafo is None:
+            clave_grafo = hash_grafo(grafo)
+        clave = _hash(huella_motor(motor, version), clave_grafo, origen, repeticiones, huella_maquina())
+        ruta = self._ruta('tiempos', clave, '.json')
+        huella_referencia = None if referencia is None else _hash(list(referencia.items()))
+
+        registro = None
+        if os.path.exists(ruta):
+            with open(ruta) as archivo:
+                registro = json.load(archivo)
+            if referencia is None or registro.get('referencia') == huella_referencia:
+                self.aciertos += 1
+                return registro
+
+        self.fallos += 1
+        if registro is None:
+            inicio = time.time()
+            for _ in range(repeticiones):
+                resultado = motor(grafo, origen)
+            tiempo = (time.time() - inicio) / repeticiones
+            registro = {'motor': motor.__name__, 'tiempo': tiempo, 'repeticiones': repeticiones}
+        else:
+            # El tiempo ya está medido; sólo falta la comprobación
+            resultado = motor(grafo, origen)
+
+        if referencia is not None:
+            distancias = resultado[0] if isinstance(resultado, tuple) else resultado
+            registro['coincide'] = distancias == referencia
+            registro['referencia'] = huella_referencia
+
+        self._escribir(ruta, lambda archivo: archivo.write(json.dumps(registro).encode()))
+        return registro
\ No newline at end of file
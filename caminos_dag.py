@@ -0,0 +1,150 @@
+"""
+CAMINOS MÁS CORTOS (Y MÁS LARGOS) EN GRAFOS ACÍCLICOS
+Para grafos dirigidos acíclicos (planificación, pipelines) basta con relajar
+las aristas una vez en orden topológico (algoritmo de Kahn): O(n + m), sin heap,
+admite pesos negativos y, cambiando mínimo por máximo, resuelve el camino más largo
+"""
+
+import time
+from collections import Counter
+from itertools import chain
+
+from perfilado import perfilar
+
+def orden_topologico(grafo):
+    """
+    Orden topológico con el algoritmo de Kahn
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+
+    Retorna:
+    Lista de nodos en orden topológico, o None si el grafo tiene ciclos
+    """
+    grado_entrada = dict.fromkeys(grafo, 0)
+    grado_entrada.update(Counter(chain.from_iterable(grafo.values())))
+
+    # La lista del orden hace de cola: se recorre mientras crece
+    orden = [nodo for nodo, grado in grado_entrada.items() if grado == 0]
+    for nodo in orden:
+        for vecino in grafo[nodo]:
+            grado = grado_entrada[vecino] - 1
+            grado_entrada[vecino] = grado
+            if grado == 0:
+                orden.append(vecino)
+
+    # Los nodos de un ciclo nunca llegan a grado de entrada 0
+    return orden if len(orden) == len(grafo) else None
+
+def es_aciclico(grafo):
+    """
+    True si el grafo no tiene ciclos dirigidos
+    """
+    return orden_topologico(grafo) is not None
+
+@perfilar
+def sssp_dag(grafo, origen, mas_largo=False, orden=None):
+    """
+    Caminos desde origen en un grafo acíclico, relajando en orden topológico
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}, acíclico;
+           los pesos pueden ser negativos
+    origen: nodo de inicio
+    mas_largo: si es True, calcula el camino más largo en lugar del más corto
+    orden: orden topológico precalculado (opcional, para consultas repetidas)
+
+    Retorna:
+    distancias: diccionario con la distancia desde origen a cada nodo
+                (inf, o -inf si mas_largo, para los inalcanzables)
+    predecesores: diccionario para reconstruir los caminos
+
+    Lanza:
+    ValueError si el grafo tiene ciclos
+    """
+    if orden is None:
+        orden = orden_topologico(grafo)
+        if orden is None:
+            raise ValueError("El grafo tiene ciclos: sssp_dag requiere un grafo acíclico")
+
+    inalcanzable = float('-inf') if mas_largo else float('inf')
+    distancias = {nodo: inalcanzable for nodo in grafo}
+    predecesores = {nodo: None for nodo in grafo}
+    distancias[origen] = 0
+
+    # Los nodos anteriores al origen en el orden no son alcanzables desde él
+    encontrado = False
+    for nodo in orden:
+        if not encontrado:
+            if nodo != origen:
+                continue
+            encontrado = True
+
+        distancia_actual = distancias[nodo]
+        if distancia_actual == inalcanzable:
+            continue
+
+        for vecino, peso in grafo[nodo].items():
+            nueva_distancia = distancia_actual + peso
+            if (nueva_distancia > distancias[vecino]) if mas_largo else (nueva_distancia < distancias[vecino]):
+                distancias[vecino] = nueva_distancia
+                predecesores[vecino] = nodo
+
+    return distancias, predecesores
+
+def camino_mas_largo(grafo, origen, orden=None):
+    """
+    Camino más largo desde origen en un grafo acíclico (p. ej. ruta crítica)
+    """
+    return sssp_dag(grafo, origen, mas_largo=True, orden=orden)
+
+def ejecutar_prueba_dag():
+    """
+    Compara sssp_dag con dijkstra_original y SPFA en un grafo acíclico aleatorio
+    """
+    import random
+    from bellman_ford_spfa import spfa
+    from dijkstra_original import dijkstra_original, reconstruir_camino
+
+    n = 20000
+    grafo = {i: {} for i in range(n)}
+    for i in range(n):
+        for j in random.sample(range(i + 1, n), min(6, n - i - 1)):
+            grafo[i][j] = random.randint(1, 100)
+
+    inicio = time.time()
+    orden = orden_topologico(grafo)
+    tiempo_orden = time.time() - inicio
+
+    inicio = time.time()
+    distancias, _ = sssp_dag(grafo, 0, orden=orden)
+    tiempo_dag = time.time() - inicio
+
+    inicio = time.time()
+    referencia, _ = dijkstra_original(grafo, 0)
+    tiempo_dijkstra = time.time() - inicio
+
+    print(f"GRAFO ACÍCLICO: n={n}, m={sum(len(v) for v in grafo.values())}")
+    print(f"Orden topológico (Kahn): {tiempo_orden:.4f} segundos")
+    print(f"sssp_dag:                {tiempo_dag:.4f} segundos, iguales: {distancias == referencia}")
+    print(f"dijkstra_original:       {tiempo_dijkstra:.4f} segundos")
+
+    # Pesos negativos: sólo SPFA sirve como referencia
+    for nodo in grafo:
+        for vecino in grafo[nodo]:
+            grafo[nodo][vecino] -= 60
+    inicio = time.time()
+    distancias, _ = sssp_dag(grafo, 0, orden=orden)
+    tiempo_dag = time.time() - inicio
+    inicio = time.time()
+    referencia, _ = spfa(grafo, 0)
+    print(f"Con pesos negativos: sssp_dag {tiempo_dag:.4f} s, spfa {time.time() - inicio:.4f} s, "
+          f"iguales: {distancias == referencia}")
+
+    tareas = {'inicio': {'diseño': 3, 'compras': 2}, 'diseño': {'construcción': 5},
+              'compras': {'construcción': 4}, 'construcción': {'fin': 2}, 'fin': {}}
+    largos, predecesores = camino_mas_largo(tareas, 'inicio')
+    print(f"Ruta crítica: {reconstruir_camino(predecesores, 'fin')} (duración {largos['fin']})")
+
+if __name__ == "__main__":
+    ejecutar_prueba_dag()
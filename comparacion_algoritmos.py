@@ -7,6 +7,8 @@ import time
 import matplotlib.pyplot as plt
 import numpy as np
 
+from alcanzabilidad import nodos_alcanzables
+
 # Importar los algoritmos de los scripts anteriores
 # Nota: En la práctica, estos estarían en módulos separados
 # Para este ejemplo, copiamos las funciones esenciales
@@ -62,10 +64,14 @@ def algoritmo_nuevo_simple(grafo, origen):
     predecesores = {nodo: None for nodo in grafo}
     distancias[origen] = 0
     
+    # Sólo los nodos alcanzables pueden activarse (en el orden del grafo)
+    alcanzables = set(nodos_alcanzables(grafo, origen))
+    candidatos = [nodo for nodo in grafo if nodo in alcanzables]
+    
     # Procesar en fases
     for iteracion in range(L):
         # En cada iteración, procesar todos los nodos activos
-        nodos_activos = [nodo for nodo in grafo if distancias[nodo] < float('inf')]
+        nodos_activos = [nodo for nodo in candidatos if distancias[nodo] < float('inf')]
         
         for nodo_actual in nodos_activos:
             for vecino, peso in grafo[nodo_actual].items():
@@ -271,6 +277,73 @@ def generar_graficos_comparacion(resultados):
     
     print("\nGráficos generados y guardados como 'comparacion_algoritmos.png'")
 
+def comparar_motores(grafos_prueba=None, repeticiones=3):
+    """
+    Compara los motores vectorizados con los algoritmos de este script
+
+    Las representaciones compactas (matriz densa, CSR) se construyen fuera de
+    la medición, como ocurre cuando se reutilizan entre consultas.
+    """
+    import random
+    from dijkstra_denso import dijkstra_denso, matriz_adyacencia
+    from delta_stepping import delta_stepping
+    from grafo_compacto import GrafoCompacto
+
+    print("\n" + "=" * 50)
+    print("COMPARACIÓN DE MOTORES")
+    print("=" * 50)
+
+    if grafos_prueba is None:
+        grafos_prueba = [
+            # (nombre, número de nodos, densidad)
+            ("Pequeño", 10, 0.3),
+            ("Grande", 100, 0.1),
+            ("Denso", 1000, 0.5),
+            ("Disperso", 20000, 0.0004),
+        ]
+
+    resultados = []
+
+    for nombre, n_nodos, densidad in grafos_prueba:
+        # Generar grafo aleatorio con aproximadamente densidad·n vecinos por nodo
+        grafo = {}
+        for i in range(n_nodos):
+            vecinos = random.sample(range(n_nodos), max(1, int(densidad * n_nodos)))
+            grafo[i] = {j: random.randint(1, 100) for j in vecinos if j != i}
+
+        compacto = GrafoCompacto.desde_dict(grafo)
+
+        motores = {
+            'dijkstra': lambda: dijkstra_simple(grafo, 0),
+            'nuevo': lambda: algoritmo_nuevo_simple(grafo, 0),
+            'delta_stepping': lambda: delta_stepping(compacto, 0),
+        }
+
+        # La matriz densa ocupa 8·n² bytes: sólo para grafos medianos
+        if n_nodos <= 5000:
+            matriz = matriz_adyacencia(grafo)
+            motores['denso'] = lambda: dijkstra_denso(grafo, 0, matriz)
+
+        referencia, _ = dijkstra_simple(grafo, 0)
+        fila = {'nombre': nombre, 'nodos': n_nodos,
+                'aristas': sum(len(vecinos) for vecinos in grafo.values())}
+
+        print(f"\nGrafo {nombre} ({fila['nodos']} nodos, {fila['aristas']} aristas):")
+        for motor, ejecutar in motores.items():
+            mejor = float('inf')
+            for _ in range(repeticiones):
+                inicio = time.time()
+                distancias, _ = ejecutar()
+                mejor = min(mejor, time.time() - inicio)
+            correcto = all(abs(distancias[v] - referencia[v]) <= 0.0001 or distancias[v] == referencia[v]
+                           for v in grafo)
+            fila[motor] = mejor
+            print(f"  {motor:<15} {mejor:.4f}s {'✅' if correcto else '❌'}")
+
+        resultados.append(fila)
+
+    return resultados
+
 def resumen_comparacion():
     """
     Genera un resumen completo de la comparación
@@ -313,4 +386,5 @@ def resumen_comparacion():
 
 if __name__ == "__main__":
     # Ejecutar comparación completa
-    resultados_finales = resumen_comparacion()
\ No newline at end of file
+    resultados_finales = resumen_comparacion()
+    resultados_motores = comparar_motores()
\ No newline at end of file
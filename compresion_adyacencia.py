@@ -0,0 +1,316 @@
+"""
+ADYACENCIA COMPRIMIDA (DIFERENCIAS + VARINT)
+Formato opcional para grafos que no caben cómodamente ni en CSR: los vecinos
+de cada nodo se ordenan y se guardan como diferencias (el primero relativo al
+propio nodo, en zigzag), cada número como varint de bytes alineados (LEB128:
+7 bits por byte, el bit alto indica que sigue otro byte). Los pesos enteros no
+negativos van en el mismo flujo tras los vecinos; si no, en un arreglo aparte.
+Dijkstra decodifica el bloque de bytes de cada nodo al procesarlo.
+"""
+
+import heapq
+import sys
+import time
+
+import numpy as np
+
+from grafo_compacto import GrafoCompacto, tipo_pesos_minimo
+from perfilado import perfilar
+
+def _codificar_varints(valores):
+    """
+    Codifica un arreglo de enteros no negativos como varints consecutivos
+
+    Retorna:
+    bytes: los varints concatenados
+    longitudes: bytes ocupados por cada valor
+    """
+    valores = np.asarray(valores, dtype=np.uint64)
+    longitudes = np.ones(len(valores), dtype=np.int64)
+    for k in range(1, 10):
+        longitudes += valores >= np.uint64(1) << np.uint64(7 * k)
+
+    fin = np.cumsum(longitudes)
+    inicio = fin - longitudes
+    salida = np.empty(int(fin[-1]) if len(fin) else 0, dtype=np.uint8)
+
+    # El byte k de cada valor: 7 bits, con el bit alto si quedan más bytes
+    for k in range(int(longitudes.max()) if len(longitudes) else 0):
+        activos = longitudes > k
+        septeto = (valores[activos] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        continua = (longitudes[activos] > k + 1).astype(np.uint64) << np.uint64(7)
+        salida[inicio[activos] + k] = (septeto | continua).astype(np.uint8)
+
+    return salida.tobytes(), longitudes
+
+def decodificar_bloque(datos, inicio, fin):
+    """
+    Decodifica los varints de datos[inicio:fin]
+
+    Retorna:
+    Lista de enteros
+    """
+    valores = []
+    valor = 0
+    corrimiento = 0
+    for byte in datos[inicio:fin]:
+        if byte < 0x80:
+            valores.append(valor | (byte << corrimiento))
+            valor = 0
+            corrimiento = 0
+        else:
+            valor |= (byte & 0x7F) << corrimiento
+            corrimiento += 7
+    return valores
+
+class AdyacenciaComprimida:
+    """
+    Grafo dirigido con listas de adyacencia comprimidas
+
+    Los varints del nodo en la posición u ocupan datos[desplazamientos[u]:desplazamientos[u + 1]]:
+    zigzag(v1 - u), v2 - v1, ..., vd - v(d-1) y, si los pesos son enteros, w1..wd.
+    Con pesos no enteros, los del nodo u son pesos[inicio_pesos[u]:inicio_pesos[u + 1]].
+    """
+
+    def __init__(self, nodos, datos, desplazamientos, pesos=None, inicio_pesos=None):
+        self.nodos = nodos
+        self.indice = {nodo: i for i, nodo in enumerate(nodos)}
+        self.datos = datos
+        self.desplazamientos = desplazamientos
+        self.pesos = pesos
+        self.inicio_pesos = inicio_pesos
+
+    @classmethod
+    def desde_compacto(cls, compacto):
+        """
+        Comprime un GrafoCompacto
+
+        Los pesos se guardan en el flujo de varints si son enteros no negativos
+        (tipo_pesos_minimo uint16/uint32); si no, en el tipo más pequeño exacto.
+        """
+        n = compacto.n
+        grados = compacto.grados()
+        origenes = np.repeat(np.arange(n, dtype=np.int64), grados)
+
+        # Vecinos ordenados dentro de cada nodo (junto con sus pesos)
+        orden = np.lexsort((compacto.indices, origenes))
+        vecinos = compacto.indices[orden].astype(np.int64)
+        pesos = compacto.pesos[orden]
+
+        # Diferencias: la primera respecto del propio nodo (zigzag), el resto respecto del anterior
+        diferencias = np.diff(vecinos, prepend=0)
+        primeros = compacto.indptr[:-1][grados > 0]
+        relativos = vecinos[primeros] - np.arange(n)[grados > 0]
+        diferencias[primeros] = np.where(relativos >= 0, 2 * relativos, -2 * relativos - 1)
+
+        tipo = tipo_pesos_minimo(np.asarray(pesos, dtype=np.float64))
+        pesos_en_flujo = np.issubdtype(tipo, np.integer)
+
+        # Flujo por nodo: sus diferencias y, si van en el flujo, sus pesos
+        if pesos_en_flujo:
+            tokens = np.empty(2 * len(vecinos), dtype=np.uint64)
+            nodo_token = np.repeat(origenes, 2)
+            # Para cada nodo: primero sus d diferencias y luego sus d pesos
+            posicion = np.arange(len(vecinos)) - compacto.indptr[origenes]
+            base = 2 * compacto.indptr[origenes]
+            tokens[base + posicion] = diferencias
+            tokens[base + grados[origenes] + posicion] = pesos.astype(np.uint64)
+        else:
+            tokens = diferencias.astype(np.uint64)
+            nodo_token = origenes
+
+        datos, longitudes = _codificar_varints(tokens)
+        bytes_por_nodo = np.bincount(nodo_token, weights=longitudes, minlength=n).astype(np.int64)
+        desplazamientos = np.zeros(n + 1, dtype=np.uint32 if len(datos) < 2 ** 32 else np.uint64)
+        np.cumsum(bytes_por_nodo, out=desplazamientos[1:])
+
+        if pesos_en_flujo:
+            return cls(compacto.nodos, datos, desplazamientos)
+        return cls(compacto.nodos, datos, desplazamientos,
+                   pesos.astype(tipo), compacto.indptr.copy())
+
+    @classmethod
+    def desde_dict(cls, grafo):
+        return cls.desde_compacto(GrafoCompacto.desde_dict(grafo))
+
+    @property
+    def n(self):
+        return len(self.nodos)
+
+    def vecinos(self, u):
+        """
+        Vecinos del nodo en la posición u
+
+        Retorna:
+        Lista de tuplas (posición del vecino, peso)
+        """
+        valores = decodificar_bloque(self.datos, self.desplazamientos[u], self.desplazamientos[u + 1])
+        if self.pesos is None:
+            grado = len(valores) // 2
+            pesos = valores[grado:]
+        else:
+            grado = len(valores)
+            pesos = self.pesos[self.inicio_pesos[u]:self.inicio_pesos[u + 1]].tolist()
+        if grado == 0:
+            return []
+
+        zigzag = valores[0]
+        vecino = u + (zigzag >> 1 if zigzag % 2 == 0 else -((zigzag + 1) >> 1))
+        resultado = [(vecino, pesos[0])]
+        for i in range(1, grado):
+            vecino += valores[i]
+            resultado.append((vecino, pesos[i]))
+        return resultado
+
+    def memoria(self):
+        """
+        Bytes ocupados por el flujo de varints y los arreglos auxiliares
+        """
+        total = len(self.datos) + self.desplazamientos.nbytes
+        if self.pesos is not None:
+            total += self.pesos.nbytes + self.inicio_pesos.nbytes
+        return total
+
+    def a_compacto(self):
+        """
+        Descomprime a GrafoCompacto (vecinos en orden creciente de posición)
+        """
+        grados = []
+        indices = []
+        pesos = []
+        for u in range(self.n):
+            aristas = self.vecinos(u)
+            grados.append(len(aristas))
+            indices.extend(v for v, _ in aristas)
+            pesos.extend(w for _, w in aristas)
+        indptr = np.zeros(self.n + 1, dtype=np.int64)
+        np.cumsum(grados, out=indptr[1:])
+        return GrafoCompacto(self.nodos, indptr, np.array(indices, dtype=np.int64),
+                             np.array(pesos, dtype=np.float64))
+
+@perfilar
+def dijkstra_comprimido(comprimida, origen):
+    """
+    Dijkstra con heap que decodifica los vecinos de cada nodo al procesarlo
+
+    Parámetros:
+    comprimida: AdyacenciaComprimida
+    origen: nodo de inicio (etiqueta original)
+
+    Retorna:
+    distancias: diccionario con la distancia mínima desde origen a cada nodo
+    predecesores: diccionario para reconstruir los caminos
+    """
+    n = comprimida.n
+    datos = comprimida.datos
+    desplazamientos = comprimida.desplazamientos.tolist()
+    pesos_aparte = comprimida.pesos
+    inicio_pesos = comprimida.inicio_pesos
+
+    fuente = comprimida.indice[origen]
+    dist = [float('inf')] * n
+    pred = [-1] * n
+    procesado = [False] * n
+    dist[fuente] = 0
+    heap = [(0, fuente)]
+
+    while heap:
+        distancia_actual, u = heapq.heappop(heap)
+        if procesado[u]:
+            continue
+        procesado[u] = True
+
+        inicio, fin = desplazamientos[u], desplazamientos[u + 1]
+        if inicio == fin:
+            continue
+
+        # Decodificación del bloque (igual que decodificar_bloque, en línea)
+        valores = []
+        valor = 0
+        corrimiento = 0
+        for byte in datos[inicio:fin]:
+            if byte < 0x80:
+                valores.append(valor | (byte << corrimiento))
+                valor = 0
+                corrimiento = 0
+            else:
+                valor |= (byte & 0x7F) << corrimiento
+                corrimiento += 7
+
+        if pesos_aparte is None:
+            grado = len(valores) // 2
+            pesos = valores[grado:]
+        else:
+            grado = len(valores)
+            pesos = pesos_aparte[inicio_pesos[u]:inicio_pesos[u + 1]].tolist()
+
+        zigzag = valores[0]
+        v = u + (zigzag >> 1 if zigzag % 2 == 0 else -((zigzag + 1) >> 1))
+        for i in range(grado):
+            if i:
+                v += valores[i]
+            if procesado[v]:
+                continue
+            nueva_distancia = distancia_actual + pesos[i]
+            if nueva_distancia < dist[v]:
+                dist[v] = nueva_distancia
+                pred[v] = u
+                heapq.heappush(heap, (nueva_distancia, v))
+
+    nodos = comprimida.nodos
+    distancias = dict(zip(nodos, dist))
+    predecesores = {nodo: (nodos[p] if p >= 0 else None) for nodo, p in zip(nodos, pred)}
+    return distancias, predecesores
+
+def memoria_dict(grafo):
+    """
+    Estimación de los bytes del diccionario de diccionarios: los diccionarios
+    y los objetos int/float de los pesos (los enteros pequeños de Python son
+    compartidos y no se cuentan)
+    """
+    total = sys.getsizeof(grafo)
+    for vecinos in grafo.values():
+        total += sys.getsizeof(vecinos)
+        for peso in vecinos.values():
+            if not (isinstance(peso, int) and -5 <= peso <= 256):
+                total += sys.getsizeof(peso)
+    return total
+
+def ejecutar_prueba_compresion():
+    """
+    Espacio y tiempo de Dijkstra con el diccionario de diccionarios, CSR y la
+    adyacencia comprimida, con y sin reordenamiento previo de los nodos
+    """
+    from dijkstra_original import dijkstra_original
+    from generadores_grafos import grafo_carreteras, grafo_vecinos_aleatorios
+    from reordenamiento import reordenar
+
+    grafos = [
+        ("Carreteras 300x300", grafo_carreteras(300, semilla=0)),
+        ("Aleatorio 100000n", grafo_vecinos_aleatorios(100000, 3, 8, semilla=0)),
+    ]
+
+    for nombre, grafo in grafos:
+        origen = next(iter(grafo))
+        compacto = GrafoCompacto.desde_dict(grafo)
+        print(f"\n{nombre}: n={compacto.n}, m={compacto.m}")
+
+        inicio = time.time()
+        referencia, _ = dijkstra_original(grafo, origen)
+        tiempo_dict = time.time() - inicio
+        print(f"{'Formato':<28} {'Memoria (MiB)':>14} {'Bytes/arista':>13} {'Dijkstra':>10}  Iguales")
+        print(f"{'dict de dicts':<28} {memoria_dict(grafo) / 2**20:>14.2f} "
+              f"{memoria_dict(grafo) / compacto.m:>13.2f} {tiempo_dict:>9.3f}s  -")
+        print(f"{'CSR (int64 + float64)':<28} {compacto.memoria() / 2**20:>14.2f} "
+              f"{compacto.memoria() / compacto.m:>13.2f} {'-':>10}  -")
+
+        for etiqueta, base in (("comprimida", compacto), ("comprimida + RCM", reordenar(compacto, 'rcm'))):
+            comprimida = AdyacenciaComprimida.desde_compacto(base)
+            inicio = time.time()
+            distancias, _ = dijkstra_comprimido(comprimida, origen)
+            tiempo = time.time() - inicio
+            print(f"{etiqueta:<28} {comprimida.memoria() / 2**20:>14.2f} "
+                  f"{comprimida.memoria() / compacto.m:>13.2f} {tiempo:>9.3f}s  {distancias == referencia}")
+
+if __name__ == "__main__":
+    ejecutar_prueba_compresion()
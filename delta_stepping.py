@@ -0,0 +1,261 @@
+"""
+DELTA-STEPPING PARA SSSP
+Algoritmo de Meyer y Sanders: los nodos se agrupan en cubetas de ancho Δ y todos
+los nodos de una cubeta se relajan a la vez. Las aristas livianas (peso <= Δ)
+se relajan repetidamente dentro de la cubeta; las pesadas, una vez al vaciarla.
+Cada fase se ejecuta como operaciones NumPy sobre el grafo compacto (CSR), de modo
+que el trabajo por arista ocurre en bucles de C y no en el intérprete.
+"""
+
+import time
+
+import numpy as np
+
+from grafo_compacto import GrafoCompacto
+from grafo_no_dirigido import GrafoNoDirigido
+from perfilado import fase, perfilar
+
+def delta_por_defecto(compacto):
+    """
+    Δ por defecto: el peso medio de las aristas
+
+    La heurística de Meyer y Sanders, Δ ≈ peso_máximo / grado_medio, reduce
+    las re-relajaciones, pero aquí cada cubeta tiene un costo fijo de
+    operaciones NumPy que pesa más: con Δ = peso medio las cubetas agrupan
+    suficientes nodos, y el peso medio no se dispara por una sola arista
+    enorme como el máximo.
+    """
+    if compacto.m == 0:
+        return 1.0
+    return max(float(compacto.pesos.mean()), 1e-9)
+
+def _relajar(compacto, fuentes, mascara_aristas, dist, pred):
+    """
+    Relaja las aristas de fuentes seleccionadas por mascara_aristas
+
+    Retorna:
+    Arreglo de nodos cuya distancia mejoró
+    """
+    origenes, posiciones = compacto.aristas_de(fuentes)
+    seleccion = mascara_aristas[posiciones]
+    origenes = origenes[seleccion]
+    posiciones = posiciones[seleccion]
+
+    destinos = compacto.indices[posiciones]
+    # dist es float64: con pesos uint16/uint32/float32 la suma se acumula en 64 bits
+    nuevas = dist[origenes] + compacto.pesos[posiciones]
+
+    # Sólo las aristas que mejoran la distancia actual
+    mejora = nuevas < dist[destinos]
+    if not mejora.any():
+        return destinos[:0]
+    destinos = destinos[mejora]
+    nuevas = nuevas[mejora]
+    origenes = origenes[mejora]
+
+    np.minimum.at(dist, destinos, nuevas)
+
+    # Predecesor: cualquier arista que alcanzó el nuevo mínimo
+    ganadoras = nuevas == dist[destinos]
+    pred[destinos[ganadoras]] = origenes[ganadoras]
+
+    return np.unique(destinos)
+
+def delta_stepping_compacto(compacto, fuente, delta=None):
+    """
+    Delta-stepping vectorizado sobre un GrafoCompacto
+
+    Parámetros:
+    compacto: GrafoCompacto con pesos no negativos
+    fuente: posición del nodo de origen
+    delta: ancho de cubeta (por defecto delta_por_defecto)
+
+    Retorna:
+    dist: arreglo float64 de distancias (inf = inalcanzable)
+    pred: arreglo int64 de predecesores (-1 = sin predecesor)
+
+    Lanza:
+    ValueError si hay pesos negativos
+    """
+    if compacto.m and compacto.pesos.min() < 0:
+        raise ValueError("delta_stepping requiere pesos no negativos")
+    if delta is None:
+        delta = delta_por_defecto(compacto)
+
+    n = compacto.n
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    dist[fuente] = 0
+
+    livianas = compacto.pesos <= delta
+    pesadas = ~livianas
+    resuelto = np.zeros(n, dtype=bool)
+
+    # Pendientes: nodos alcanzados y no resueltos (sin repetidos); sólo crece con
+    # los nodos cuya distancia mejora, así cada cubeta no recorre los n nodos
+    pendientes = np.array([fuente], dtype=np.int64)
+    en_pendientes = np.zeros(n, dtype=bool)
+    en_pendientes[fuente] = True
+
+    def agregar(pendientes, mejorados):
+        nuevos = mejorados[~en_pendientes[mejorados]]
+        if not len(nuevos):
+            return pendientes
+        en_pendientes[nuevos] = True
+        return np.concatenate((pendientes, nuevos))
+
+    while len(pendientes):
+        # Cubeta no vacía de menor índice entre los nodos no resueltos
+        tentativas = dist[pendientes]
+        cubeta = np.floor(tentativas.min() / delta)
+        limite = (cubeta + 1) * delta
+
+        frontera = pendientes[tentativas < limite]
+        vaciados = [frontera]
+
+        # Fase liviana: repetir mientras algún nodo (re)entre en la cubeta
+        with fase('fase_liviana'):
+            while len(frontera):
+                mejorados = _relajar(compacto, frontera, livianas, dist, pred)
+                pendientes = agregar(pendientes, mejorados)
+                frontera = mejorados[dist[mejorados] < limite]
+                vaciados.append(frontera)
+
+        # Fase pesada: una sola vez por los nodos que pasaron por la cubeta
+        with fase('fase_pesada'):
+            vaciados = np.unique(np.concatenate(vaciados))
+            resuelto[vaciados] = True
+            pendientes = pendientes[~resuelto[pendientes]]
+            pendientes = agregar(pendientes, _relajar(compacto, vaciados, pesadas, dist, pred))
+
+    return dist, pred
+
+@perfilar
+def delta_stepping(grafo, origen, delta=None, dtype_pesos=np.float64, verificar=False):
+    """
+    Delta-stepping con la misma interfaz que dijkstra_original
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}, GrafoCompacto
+           (para reutilizar la conversión entre consultas) o GrafoNoDirigido
+    origen: nodo de inicio
+    delta: ancho de cubeta (por defecto delta_por_defecto)
+    dtype_pesos: tipo de los pesos al convertir desde diccionario
+                 (ver GrafoCompacto.desde_dict; 'auto' elige el más pequeño exacto)
+    verificar: si es True, compara el resultado con dijkstra_original en float64
+
+    Retorna:
+    distancias: diccionario con la distancia mínima desde origen a cada nodo
+    predecesores: diccionario para reconstruir los caminos
+
+    Lanza:
+    ValueError si hay pesos negativos, o si verificar es True y alguna
+    distancia difiere de la referencia
+    """
+    if isinstance(grafo, GrafoCompacto):
+        compacto = grafo
+    elif isinstance(grafo, GrafoNoDirigido):
+        # Ambas direcciones en CSR; los pesos conservan el tipo elegido al importar
+        with fase('conversion'):
+            compacto = grafo.a_compacto()
+    else:
+        with fase('conversion'):
+            compacto = GrafoCompacto.desde_dict(grafo, dtype_pesos, exacto=not verificar)
+
+    dist, pred = delta_stepping_compacto(compacto, compacto.indice[origen], delta)
+    distancias, predecesores = compacto.resultado_a_dict(dist, pred)
+    distancias[origen] = 0
+
+    if verificar:
+        verificar_distancias(grafo, origen, dist, compacto)
+
+    return distancias, predecesores
+
+def verificar_distancias(grafo, origen, dist, compacto):
+    """
+    Compara dist (por posición en compacto) con dijkstra_original sobre los
+    pesos originales en float64: el diccionario grafo si se recibe uno, o los
+    pesos previos al redondeo que conserva compacto (pesos_exactos)
+
+    Con pesos enteros la coincidencia debe ser exacta; con pesos en coma
+    flotante se tolera el error relativo del redondeo de los pesos.
+
+    Lanza:
+    ValueError con el número de nodos distintos y el mayor error
+    """
+    from dijkstra_original import dijkstra_original
+
+    if not isinstance(grafo, dict):
+        # Mismo grafo que compacto, pero con los pesos sin redondear
+        grafo = GrafoCompacto(compacto.nodos, compacto.indptr, compacto.indices, compacto.pesos_exactos()).a_dict()
+    referencia, _ = dijkstra_original(grafo, origen)
+    esperado = np.array([referencia[nodo] for nodo in compacto.nodos], dtype=np.float64)
+
+    if np.issubdtype(compacto.pesos.dtype, np.integer):
+        distintos = esperado != dist
+    else:
+        rtol = float(np.finfo(compacto.pesos.dtype).eps) * 4
+        distintos = ~np.isclose(dist, esperado, rtol=rtol, atol=0)
+        distintos &= ~(np.isinf(dist) & np.isinf(esperado))
+
+    if distintos.any():
+        error = np.abs(dist[distintos] - esperado[distintos])
+        raise ValueError(f"{int(distintos.sum())} distancias difieren de dijkstra_original "
+                         f"(pesos {compacto.pesos.dtype}); error máximo {error.max()}")
+
+def ejecutar_prueba_delta():
+    """
+    Compara delta-stepping con dijkstra_original para varios valores de Δ
+    """
+    import random
+    from dijkstra_original import dijkstra_original
+
+    n = 20000
+    grafo = {i: {} for i in range(n)}
+    for i in range(n):
+        for j in random.sample(range(n), 8):
+            if i != j:
+                grafo[i][j] = random.randint(1, 100)
+
+    inicio = time.time()
+    referencia, _ = dijkstra_original(grafo, 0)
+    tiempo_dijkstra = time.time() - inicio
+    print(f"GRAFO ALEATORIO: n={n}, m={sum(len(v) for v in grafo.values())}")
+    print(f"dijkstra_original: {tiempo_dijkstra:.4f} segundos")
+
+    compacto = GrafoCompacto.desde_dict(grafo)
+    print(f"Δ por defecto: {delta_por_defecto(compacto):.2f}")
+    for delta in (None, 10, 50, 200):
+        inicio = time.time()
+        distancias, _ = delta_stepping(compacto, 0, delta)
+        tiempo = time.time() - inicio
+        print(f"delta_stepping (Δ={delta}): {tiempo:.4f} segundos, iguales: {distancias == referencia}")
+
+def ejecutar_prueba_pesos_compactos():
+    """
+    Memoria y tiempo de delta-stepping con pesos uint16 y float32 frente a float64
+    """
+    import random
+
+    n = 200000
+    grafo = {i: {} for i in range(n)}
+    for i in range(n):
+        for j in random.sample(range(n), 8):
+            if i != j:
+                grafo[i][j] = random.randint(1, 100)
+
+    print(f"\nGRAFO ALEATORIO: n={n}, m={sum(len(v) for v in grafo.values())}")
+    base = GrafoCompacto.desde_dict(grafo)
+    print(f"Tipo automático: {GrafoCompacto.desde_dict(grafo, 'auto').pesos.dtype}")
+    for dtype in (np.float64, np.float32, np.uint32, np.uint16):
+        compacto = base.con_pesos(dtype)
+        inicio = time.time()
+        dist, _ = delta_stepping_compacto(compacto, 0)
+        tiempo = time.time() - inicio
+        verificar_distancias(grafo, 0, dist, compacto)
+        print(f"{np.dtype(dtype).name:>8}: pesos {compacto.pesos.nbytes / 2**20:6.2f} MiB, "
+              f"total {compacto.memoria() / 2**20:6.2f} MiB, {tiempo:.4f} segundos, verificado")
+
+if __name__ == "__main__":
+    ejecutar_prueba_delta()
+    ejecutar_prueba_pesos_compactos()
@@ -0,0 +1,725 @@
+"""
+PRUEBAS DIFERENCIALES ENTRE MOTORES
+Genera grafos aleatorios de varias familias (caminos, estrellas, rejillas,
+completos, desconectados, pesos cero, pesos enormes, reales, negativos sin
+ciclos negativos, con posibles ciclos negativos, acíclicos, no dirigidos),
+corre cada motor aplicable y compara sus distancias con la referencia
+(dijkstra_original, o Bellman-Ford si hay pesos negativos). Si la referencia
+encuentra un ciclo negativo alcanzable, el motor debe lanzar CicloNegativoError
+con un ciclo negativo real. Cada caso fallido se reduce quitando nodos, aristas
+y simplificando pesos mientras el fallo se mantenga, para reportar el contraejemplo
+más chico posible.
+
+Los motores que no producen una tabla SSSP completa se comprueban con su
+propia referencia (COMPROBACIONES): búsquedas truncadas contra la referencia
+recortada, k caminos (costos, caminos simples y, en grafos chicos, contra la
+enumeración de todos los caminos), Dijkstra dependiente del tiempo con
+funciones por tramos contra un punto fijo de Bellman-Ford con np.interp, y
+frente_pareto contra un etiquetado bicriterio por rondas.
+
+No se incluyen: experimentacion.nuevo_algoritmo_simple (importar el módulo
+corre los experimentos), servidor_consultas (envuelve dijkstra_original en
+procesos) y estres (mide tiempos, no resultados).
+
+Uso:
+    python diferencial.py --casos 300 --semilla 0
+    python diferencial.py --motor delta_stepping --familia pesos_enormes
+Termina con código 1 si algún motor falla, salvo los que se pasen
+explícitamente con --permitir-inexactos.
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+
+import numpy as np
+
+from alcanzabilidad import sssp_por_componentes
+from bellman_ford_spfa import CicloNegativoError, bellman_ford_ingenuo, spfa
+from busqueda_acotada import dijkstra_k_cercanos, dijkstra_radio
+from caminos_dag import es_aciclico, sssp_dag
+from compresion_adyacencia import AdyacenciaComprimida, dijkstra_comprimido
+from delta_stepping import delta_stepping
+from dijkstra_denso import dijkstra_denso
+from dijkstra_dial import dijkstra_dial
+from dijkstra_lotes import dijkstra_lotes
+from dijkstra_original import dijkstra_original
+from grafo_no_dirigido import GrafoNoDirigido, es_simetrico
+from k_caminos import grafo_invertido, k_caminos_mas_cortos
+from multi_origen import dijkstra_multi_origen
+from muchos_a_muchos import TablaDistancias
+from pesos_dependientes import camino_pareto, dijkstra_dependiente, frente_pareto
+from reordenamiento import reordenar
+from seleccion_motor import SelectorMotor
+from todos_los_pares import distancias_todos_los_pares
+
+# ============================================================================
+# FAMILIAS DE GRAFOS: funcion(generador, n) -> {nodo: {vecino: peso}}
+# ============================================================================
+
+def _vacio(n):
+    return {i: {} for i in range(n)}
+
+def grafo_camino(generador, n):
+    grafo = _vacio(n)
+    for i in range(n - 1):
+        grafo[i][i + 1] = generador.randint(1, 20)
+        if generador.random() < 0.3:
+            grafo[i + 1][i] = generador.randint(1, 20)
+    return grafo
+
+def grafo_estrella(generador, n):
+    grafo = _vacio(n)
+    centro = generador.randrange(n)
+    for i in range(n):
+        if i != centro:
+            grafo[centro][i] = generador.randint(1, 20)
+            if generador.random() < 0.5:
+                grafo[i][centro] = generador.randint(1, 20)
+    return grafo
+
+def grafo_rejilla(generador, n):
+    lado = max(1, math.isqrt(n))
+    grafo = _vacio(lado * lado)
+    for i in range(lado * lado):
+        fila, columna = divmod(i, lado)
+        if columna + 1 < lado:
+            grafo[i][i + 1] = generador.randint(1, 20)
+            grafo[i + 1][i] = generador.randint(1, 20)
+        if fila + 1 < lado:
+            grafo[i][i + lado] = generador.randint(1, 20)
+            grafo[i + lado][i] = generador.randint(1, 20)
+    return grafo
+
+def grafo_completo(generador, n):
+    n = min(n, 15)
+    return {i: {j: generador.randint(1, 50) for j in range(n) if j != i} for i in range(n)}
+
+def grafo_aleatorio_disperso(generador, n, peso=lambda g: g.randint(1, 50)):
+    grafo = _vacio(n)
+    for _ in range(generador.randint(0, 3 * n)):
+        grafo[generador.randrange(n)][generador.randrange(n)] = peso(generador)
+    return grafo
+
+def grafo_desconectado(generador, n):
+    # Dos o más bloques sin aristas entre ellos, más nodos aislados
+    grafo = _vacio(n)
+    cortes = sorted(generador.sample(range(n + 1), min(n + 1, generador.randint(2, 4))))
+    for inicio, fin in zip(cortes, cortes[1:]):
+        for _ in range(2 * (fin - inicio)):
+            grafo[generador.randrange(inicio, fin)][generador.randrange(inicio, fin)] = generador.randint(1, 30)
+    return grafo
+
+def grafo_pesos_cero(generador, n):
+    return grafo_aleatorio_disperso(generador, n, lambda g: 0 if g.random() < 0.5 else g.randint(1, 5))
+
+def grafo_pesos_enormes(generador, n):
+    # Sumas por debajo de 2^53: exactas también en float64
+    return grafo_aleatorio_disperso(generador, n, lambda g: g.randint(2 ** 38, 2 ** 40))
+
+def grafo_pesos_reales(generador, n):
+    return grafo_aleatorio_disperso(generador, n, lambda g: g.uniform(0, 10))
+
+def grafo_negativos(generador, n):
+    # w(u, v) + p(u) - p(v) con w >= 0: pesos negativos sin ciclos negativos
+    base = grafo_aleatorio_disperso(generador, n)
+    potencial = [generador.randint(-40, 40) for _ in range(n)]
+    return {u: {v: w + potencial[u] - potencial[v] for v, w in vecinos.items()} for u, vecinos in base.items()}
+
+def grafo_ciclos_negativos(generador, n):
+    # Pesos negativos sin potencial: puede haber ciclos negativos (alcanzables o no)
+    return grafo_aleatorio_disperso(generador, n, lambda g: g.randint(-10, 30))
+
+def grafo_aciclico(generador, n):
+    grafo = _vacio(n)
+    for _ in range(generador.randint(0, 3 * n)):
+        i, j = sorted(generador.sample(range(n), 2)) if n > 1 else (0, 0)
+        if i != j:
+            grafo[i][j] = generador.randint(-20, 50)
+    return grafo
+
+def grafo_no_dirigido(generador, n):
+    grafo = _vacio(n)
+    for _ in range(generador.randint(0, 2 * n)):
+        u, v = generador.randrange(n), generador.randrange(n)
+        grafo[u][v] = grafo[v][u] = generador.randint(0, 30)
+    return grafo
+
+FAMILIAS = {
+    'camino': grafo_camino,
+    'estrella': grafo_estrella,
+    'rejilla': grafo_rejilla,
+    'completo': grafo_completo,
+    'aleatorio': grafo_aleatorio_disperso,
+    'desconectado': grafo_desconectado,
+    'pesos_cero': grafo_pesos_cero,
+    'pesos_enormes': grafo_pesos_enormes,
+    'pesos_reales': grafo_pesos_reales,
+    'negativos': grafo_negativos,
+    'ciclos_negativos': grafo_ciclos_negativos,
+    'aciclico': grafo_aciclico,
+    'no_dirigido': grafo_no_dirigido,
+}
+
+def generar_caso(familia, semilla, n_max=30):
+    """
+    Grafo y origen reproducibles para (familia, semilla)
+
+    Los nodos se renombran a una permutación aleatoria (a veces con etiquetas
+    de texto) y el orden del diccionario se baraja, para no favorecer a los
+    motores que asumen nodos 0..n-1 en orden.
+    """
+    generador = random.Random(f"{familia}-{semilla}")
+    base = FAMILIAS[familia](generador, generador.randint(1, n_max))
+
+    nodos = list(base)
+    etiquetas = list(range(len(nodos)))
+    generador.shuffle(etiquetas)
+    if generador.random() < 0.3:
+        etiquetas = [f"v{e}" for e in etiquetas]
+    nombre = dict(zip(nodos, etiquetas))
+    generador.shuffle(nodos)
+
+    grafo = {nombre[u]: {nombre[v]: w for v, w in base[u].items()} for u in nodos}
+    return grafo, generador.choice(list(grafo))
+
+# ============================================================================
+# MOTORES: nombre -> (funcion(grafo, origen) -> distancias, requisitos)
+# ============================================================================
+
+def propiedades(grafo):
+    """
+    Propiedades del grafo que condicionan qué motores son aplicables:
+    'no_negativos', 'sin_ciclos_negativos' (en todo el grafo, no sólo desde el
+    origen), 'enteros', 'pesos_pequenos' (<= 2^16, para las cubetas de Dial),
+    'aciclico', 'simetrico'
+    """
+    pesos = [w for vecinos in grafo.values() for w in vecinos.values()]
+    encontradas = set()
+    if all(w >= 0 for w in pesos):
+        encontradas.update(('no_negativos', 'sin_ciclos_negativos'))
+    elif not _relajacion_pendiente(grafo, _bellman_ford_todos(grafo)):
+        encontradas.add('sin_ciclos_negativos')
+    if all(w == int(w) for w in pesos):
+        encontradas.add('enteros')
+    if all(w <= 2 ** 16 for w in pesos):
+        encontradas.add('pesos_pequenos')
+    if es_aciclico(grafo):
+        encontradas.add('aciclico')
+    if es_simetrico(grafo):
+        encontradas.add('simetrico')
+    return encontradas
+
+def _bellman_ford_todos(grafo):
+    """
+    Bellman-Ford ingenuo desde un super-origen unido con peso 0 a todos los nodos
+    """
+    distancias = dict.fromkeys(grafo, 0)
+    for _ in range(len(grafo)):
+        for nodo, vecinos in grafo.items():
+            for vecino, peso in vecinos.items():
+                if distancias[nodo] + peso < distancias[vecino]:
+                    distancias[vecino] = distancias[nodo] + peso
+    return distancias
+
+def _relajacion_pendiente(grafo, distancias):
+    """
+    True si alguna arista desde un nodo alcanzado aún mejora una distancia
+    tras Bellman-Ford: hay un ciclo negativo alcanzable
+    """
+    return any(distancias[nodo] + peso < distancias[vecino]
+               for nodo, vecinos in grafo.items() if distancias[nodo] < float('inf')
+               for vecino, peso in vecinos.items())
+
+def _johnson(grafo, origen):
+    matriz, nodos = distancias_todos_los_pares(grafo, 'johnson')
+    return dict(zip(nodos, matriz[nodos.index(origen)].tolist()))
+
+def _floyd(grafo, origen):
+    matriz, nodos = distancias_todos_los_pares(grafo, 'floyd')
+    return dict(zip(nodos, matriz[nodos.index(origen)].tolist()))
+
+def _muchos_a_muchos(grafo, origen):
+    nodos = list(grafo)
+    return dict(zip(nodos, TablaDistancias(grafo).matriz([origen], nodos)[0].tolist()))
+
+def _algoritmo_nuevo(grafo, origen):
+    from algoritmo_nuevo import AlgoritmoNuevoSSSP
+    return AlgoritmoNuevoSSSP().resolver(grafo, origen)[0]
+
+def _algoritmo_nuevo_simple(grafo, origen):
+    from comparacion_algoritmos import algoritmo_nuevo_simple
+    return algoritmo_nuevo_simple(grafo, origen)[0]
+
+MOTORES = {
+    'dijkstra_dial': (lambda g, o: dijkstra_dial(g, o)[0], {'no_negativos', 'enteros', 'pesos_pequenos'}),
+    'dijkstra_denso': (lambda g, o: dijkstra_denso(g, o)[0], {'no_negativos'}),
+    'spfa': (lambda g, o: spfa(g, o)[0], set()),
+    'delta_stepping': (lambda g, o: delta_stepping(g, o)[0], {'no_negativos'}),
+    'delta_stepping_auto': (lambda g, o: delta_stepping(g, o, dtype_pesos='auto')[0], {'no_negativos'}),
+    'delta_stepping_rcm': (lambda g, o: delta_stepping(reordenar(g, 'rcm'), o)[0], {'no_negativos'}),
+    'dijkstra_lotes': (lambda g, o: dijkstra_lotes(g, o)[0], {'no_negativos'}),
+    'dijkstra_dependiente': (lambda g, o: dijkstra_dependiente(g, o)[0], {'no_negativos'}),
+    'dijkstra_comprimido': (lambda g, o: dijkstra_comprimido(AdyacenciaComprimida.desde_dict(g), o)[0],
+                            {'no_negativos'}),
+    'sssp_por_componentes': (lambda g, o: sssp_por_componentes(g, o)[0], set()),
+    'sssp_dag': (lambda g, o: sssp_dag(g, o)[0], {'aciclico'}),
+    'resolver_auto': (lambda g, o: SelectorMotor().resolver(g, o)[0], set()),
+    'multi_origen': (lambda g, o: dijkstra_multi_origen(g, [o])[0], {'no_negativos'}),
+    'dijkstra_radio': (lambda g, o: dijkstra_radio(g, o, float('inf'))[0], {'no_negativos'}),
+    'muchos_a_muchos': (_muchos_a_muchos, {'no_negativos'}),
+    'dijkstra_disperso': (lambda g, o: dijkstra_original(g, o, disperso=True)[0], {'no_negativos'}),
+    'johnson': (_johnson, {'sin_ciclos_negativos'}),
+    'floyd_warshall': (_floyd, {'sin_ciclos_negativos'}),
+    'no_dirigido': (lambda g, o: dijkstra_original(GrafoNoDirigido.desde_dict(g), o)[0],
+                    {'no_negativos', 'simetrico'}),
+    'algoritmo_nuevo': (_algoritmo_nuevo, {'no_negativos'}),
+    'algoritmo_nuevo_simple': (_algoritmo_nuevo_simple, {'no_negativos'}),
+}
+
+# ============================================================================
+# COMPARACIÓN Y REDUCCIÓN
+# ============================================================================
+
+def distancias_referencia(grafo, origen):
+    """
+    dijkstra_original, o Bellman-Ford ingenuo si hay pesos negativos
+
+    Retorna:
+    Diccionario de distancias, o None si hay un ciclo negativo alcanzable
+    """
+    if any(w < 0 for vecinos in grafo.values() for w in vecinos.values()):
+        distancias = bellman_ford_ingenuo(grafo, origen)
+        return None if _relajacion_pendiente(grafo, distancias) else distancias
+    return dijkstra_original(grafo, origen)[0]
+
+def _comprobar_ciclo(grafo, ciclo):
+    """
+    None si ciclo (nodos en el orden de las aristas) es un ciclo negativo de
+    grafo; si no, el texto del problema
+    """
+    if not ciclo:
+        return "CicloNegativoError sin ciclo"
+    peso = 0
+    for u, v in zip(ciclo, ciclo[1:] + ciclo[:1]):
+        if v not in grafo.get(u, {}):
+            return f"CicloNegativoError con un ciclo que no existe: falta la arista {u!r} -> {v!r}"
+        peso += grafo[u][v]
+    if peso >= 0:
+        return f"CicloNegativoError con un ciclo de peso {peso}: {ciclo!r}"
+    return None
+
+def diferencias(esperado, obtenido, nodos, rtol=1e-9):
+    """
+    Nodos cuya distancia difiere de la referencia
+
+    Dos infinitos del mismo signo son iguales; los valores finitos se comparan
+    con tolerancia relativa rtol (los enteros quedan exactos en la práctica).
+    Un nodo ausente en obtenido cuenta como inalcanzable (resultados dispersos).
+
+    Retorna:
+    Lista de (nodo, esperado, obtenido)
+    """
+    encontradas = []
+    for nodo in nodos:
+        a = esperado[nodo]
+        b = obtenido.get(nodo, float('inf'))
+        if a == b:
+            continue
+        if math.isinf(a) or math.isinf(b) or not math.isclose(a, b, rel_tol=rtol, abs_tol=rtol):
+            encontradas.append((nodo, a, b))
+    return encontradas
+
+def verificar(funcion, grafo, origen, rtol=1e-9):
+    """
+    Corre un motor sobre un caso y lo compara con la referencia
+
+    Retorna:
+    None si coincide; si no, un texto con la primera diferencia o la excepción
+    """
+    esperado = distancias_referencia(grafo, origen)
+    try:
+        obtenido = funcion(grafo, origen)
+    except CicloNegativoError as error:
+        if esperado is not None:
+            return f"CicloNegativoError sin ciclo negativo alcanzable: {error}"
+        return _comprobar_ciclo(grafo, error.ciclo)
+    except Exception as error:
+        return f"{type(error).__name__}: {error}"
+
+    if esperado is None:
+        return "No detectó el ciclo negativo alcanzable desde el origen"
+
+    distintas = diferencias(esperado, obtenido, grafo, rtol)
+    if distintas:
+        nodo, a, b = distintas[0]
+        return f"{len(distintas)} distancias distintas; nodo {nodo!r}: esperado {a}, obtenido {b}"
+    return None
+
+def reducir(grafo, origen, falla, max_evaluaciones=2000):
+    """
+    Achica un caso fallido mientras falla(grafo, origen) siga siendo True:
+    quita nodos (salvo el origen), quita aristas y simplifica pesos (0, 1, mitad)
+
+    Retorna:
+    El grafo más chico encontrado
+    """
+    evaluaciones = 0
+
+    def intentar(candidato):
+        nonlocal evaluaciones
+        evaluaciones += 1
+        try:
+            return falla(candidato, origen)
+        except Exception:
+            # La referencia no aplica al candidato (p. ej. ciclo negativo)
+            return False
+
+    cambio = True
+    while cambio and evaluaciones < max_evaluaciones:
+        cambio = False
+
+        for nodo in list(grafo):
+            if nodo == origen or evaluaciones >= max_evaluaciones:
+                continue
+            candidato = {u: {v: w for v, w in vecinos.items() if v != nodo}
+                         for u, vecinos in grafo.items() if u != nodo}
+            if intentar(candidato):
+                grafo, cambio = candidato, True
+
+        for u in list(grafo):
+            for v in list(grafo[u]):
+                if evaluaciones >= max_evaluaciones:
+                    break
+                candidato = {x: dict(vecinos) for x, vecinos in grafo.items()}
+                del candidato[u][v]
+                if intentar(candidato):
+                    grafo, cambio = candidato, True
+
+        for u in list(grafo):
+            for v, w in list(grafo[u].items()):
+                for simple in (0, 1, int(w / 2)):
+                    if simple == w or evaluaciones >= max_evaluaciones:
+                        continue
+                    candidato = {x: dict(vecinos) for x, vecinos in grafo.items()}
+                    candidato[u][v] = simple
+                    if intentar(candidato):
+                        grafo, cambio = candidato, True
+                        break
+
+    return grafo
+
+# ============================================================================
+# COMPROBACIONES: motores sin tabla SSSP completa, con su propia referencia
+# nombre -> (funcion(grafo, origen, esperado) -> None o texto, requisitos)
+# ============================================================================
+
+def _comprobar_radio(grafo, origen, esperado):
+    # Radio: la mediana de las distancias finitas, para cortar la bola a la mitad
+    finitas = sorted(d for d in esperado.values() if d < float('inf'))
+    radio = finitas[len(finitas) // 2]
+    obtenido = dijkstra_radio(grafo, origen, radio)[0]
+    recortado = {nodo: (d if d <= radio else float('inf')) for nodo, d in esperado.items()}
+    distintas = diferencias(recortado, obtenido, grafo)
+    if distintas:
+        nodo, a, b = distintas[0]
+        return f"radio {radio}: {len(distintas)} distancias distintas; nodo {nodo!r}: esperado {a}, obtenido {b}"
+    return None
+
+def _comprobar_k_cercanos(grafo, origen, esperado):
+    k = max(1, len(grafo) // 3)
+    obtenido = dict(dijkstra_k_cercanos(grafo, origen, k)[0].items())
+    alcanzables = sum(d < float('inf') for d in esperado.values())
+    if len(obtenido) != min(k, alcanzables):
+        return f"k={k}: {len(obtenido)} nodos, se esperaban {min(k, alcanzables)}"
+    for nodo, d in obtenido.items():
+        if not math.isclose(d, esperado[nodo], rel_tol=1e-9, abs_tol=1e-9):
+            return f"k={k}: nodo {nodo!r}: esperado {esperado[nodo]}, obtenido {d}"
+    # Con empates en el k-ésimo lugar cualquiera sirve, pero nadie fuera puede estar más cerca
+    mayor = max(obtenido.values())
+    for nodo, d in esperado.items():
+        if nodo not in obtenido and d < mayor:
+            return f"k={k}: falta el nodo {nodo!r} a distancia {d} < {mayor}"
+    return None
+
+def _caminos_simples(grafo, origen, destino):
+    """
+    Costos de todos los caminos simples de origen a destino (grafos chicos)
+    """
+    costos = []
+    pila = [(origen, 0, (origen,))]
+    while pila:
+        nodo, costo, camino = pila.pop()
+        if nodo == destino:
+            costos.append(costo)
+            continue
+        for vecino, peso in grafo[nodo].items():
+            if vecino not in camino:
+                pila.append((vecino, costo + peso, camino + (vecino,)))
+    return sorted(costos)
+
+def _comprobar_k_caminos(grafo, origen, esperado, k=3):
+    invertido = grafo_invertido(grafo)
+    for destino in grafo:
+        caminos = k_caminos_mas_cortos(grafo, origen, destino, k, invertido)
+        if esperado[destino] == float('inf'):
+            if caminos:
+                return f"destino {destino!r} inalcanzable pero hay {len(caminos)} caminos"
+            continue
+        if not caminos or not math.isclose(caminos[0][0], esperado[destino], rel_tol=1e-9, abs_tol=1e-9):
+            primero = caminos[0][0] if caminos else None
+            return f"destino {destino!r}: primer camino de costo {primero}, distancia {esperado[destino]}"
+
+        anterior = None
+        for costo, camino in caminos:
+            if camino[0] != origen or camino[-1] != destino or len(set(camino)) != len(camino):
+                return f"destino {destino!r}: camino inválido o con ciclos {camino!r}"
+            if any(v not in grafo[u] for u, v in zip(camino, camino[1:])):
+                return f"destino {destino!r}: camino con aristas inexistentes {camino!r}"
+            suma = sum(grafo[u][v] for u, v in zip(camino, camino[1:]))
+            if not math.isclose(suma, costo, rel_tol=1e-9, abs_tol=1e-9):
+                return f"destino {destino!r}: costo {costo} del camino {camino!r}, suma {suma}"
+            if anterior is not None and costo < anterior:
+                return f"destino {destino!r}: costos no crecientes"
+            anterior = costo
+        if len({tuple(camino) for _, camino in caminos}) != len(caminos):
+            return f"destino {destino!r}: caminos repetidos"
+
+        if len(grafo) <= 8:
+            todos = _caminos_simples(grafo, origen, destino)[:k]
+            obtenidos = [costo for costo, _ in caminos]
+            if len(todos) != len(obtenidos) or not all(math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+                                                       for a, b in zip(todos, obtenidos)):
+                return f"destino {destino!r}: costos {obtenidos}, la enumeración da {todos}"
+    return None
+
+def _con_tramos(grafo):
+    """
+    Convierte cada peso w en una función FIFO por tramos reproducible
+    (derivada de la arista y su peso)
+    """
+    convertido = {}
+    for u, vecinos in grafo.items():
+        convertido[u] = {}
+        for v, w in vecinos.items():
+            generador = random.Random(f"{u!r}-{v!r}-{w!r}")
+            if generador.random() < 0.2:
+                convertido[u][v] = w
+                continue
+            puntos = []
+            instante, duracion = generador.uniform(0, 10), float(w)
+            for _ in range(generador.randint(1, 4)):
+                puntos.append((instante, duracion))
+                paso = generador.uniform(0.5, 20)
+                instante += paso
+                # Pendiente >= -1: la llegada instante + duración nunca retrocede
+                duracion = max(0.0, duracion + generador.uniform(-paso, 2 * paso))
+            convertido[u][v] = puntos
+    return convertido
+
+def _comprobar_dependiente(grafo, origen, esperado, salida=5.0):
+    tramos = _con_tramos(grafo)
+    obtenido = dijkstra_dependiente(tramos, origen, salida)[0]
+
+    # Referencia: punto fijo de Bellman-Ford evaluando las funciones con np.interp
+    # (constante fuera de los puntos, como en pesos_dependientes)
+    llegadas = {nodo: float('inf') for nodo in grafo}
+    llegadas[origen] = salida
+    for _ in range(len(grafo)):
+        for u, vecinos in tramos.items():
+            if llegadas[u] == float('inf'):
+                continue
+            for v, funcion in vecinos.items():
+                if isinstance(funcion, list):
+                    tiempos, duraciones = zip(*funcion)
+                    duracion = float(np.interp(llegadas[u], tiempos, duraciones))
+                else:
+                    duracion = funcion
+                if llegadas[u] + duracion < llegadas[v]:
+                    llegadas[v] = llegadas[u] + duracion
+
+    distintas = diferencias(llegadas, obtenido, grafo)
+    if distintas:
+        nodo, a, b = distintas[0]
+        return f"{len(distintas)} llegadas distintas; nodo {nodo!r}: esperado {a}, obtenido {b}"
+    return None
+
+def _no_dominadas(etiquetas):
+    return {e for e in etiquetas
+            if not any(f != e and f[0] <= e[0] and f[1] <= e[1] for f in etiquetas)}
+
+def _comprobar_pareto(grafo, origen, esperado):
+    # Segundo criterio reproducible por arista, independiente del costo
+    bicriterio = {u: {v: (w, random.Random(f"{u!r}-{v!r}").randint(0, 20)) for v, w in vecinos.items()}
+                  for u, vecinos in grafo.items()}
+
+    # Referencia: etiquetado por rondas (Bellman-Ford sobre conjuntos no dominados)
+    referencia = {origen: {(0, 0)}}
+    for _ in range(len(grafo)):
+        cambio = False
+        for u in list(referencia):
+            for v, (costo, tiempo) in bicriterio[u].items():
+                nuevas = {(c + costo, t + tiempo) for c, t in referencia[u]}
+                combinadas = _no_dominadas(referencia.get(v, set()) | nuevas)
+                if combinadas != referencia.get(v):
+                    referencia[v] = combinadas
+                    cambio = True
+        if not cambio:
+            break
+
+    frentes, predecesores = frente_pareto(bicriterio, origen)
+    if set(frentes) != set(referencia):
+        return f"nodos alcanzados distintos: {sorted(map(repr, set(frentes) ^ set(referencia)))}"
+    for nodo, frente in frentes.items():
+        if sorted(frente) != sorted(referencia[nodo]):
+            return f"nodo {nodo!r}: frente {sorted(frente)}, esperado {sorted(referencia[nodo])}"
+        for costo, tiempo in frente:
+            camino = camino_pareto(predecesores, nodo, costo, tiempo)
+            sumas = (sum(bicriterio[u][v][0] for u, v in zip(camino, camino[1:])),
+                     sum(bicriterio[u][v][1] for u, v in zip(camino, camino[1:])))
+            if camino[0] != origen or sumas != (costo, tiempo):
+                return f"nodo {nodo!r}: camino {camino!r} suma {sumas}, etiqueta {(costo, tiempo)}"
+
+    # Con destino sólo cambia la poda: el frente del destino debe ser el mismo
+    destino = random.Random(repr(sorted(map(repr, grafo)))).choice(list(grafo))
+    frentes_destino, _ = frente_pareto(bicriterio, origen, destino=destino)
+    if sorted(frentes_destino.get(destino, [])) != sorted(referencia.get(destino, set())):
+        return f"destino {destino!r}: frente {sorted(frentes_destino.get(destino, []))}"
+    return None
+
+COMPROBACIONES = {
+    'dijkstra_radio_acotado': (_comprobar_radio, {'no_negativos'}),
+    'dijkstra_k_cercanos': (_comprobar_k_cercanos, {'no_negativos'}),
+    'k_caminos': (_comprobar_k_caminos, {'no_negativos'}),
+    'dijkstra_dependiente_tramos': (_comprobar_dependiente, {'no_negativos'}),
+    'frente_pareto': (_comprobar_pareto, {'no_negativos', 'enteros'}),
+}
+
+def _verificador(motor, rtol=1e-9):
+    """
+    Función (grafo, origen) -> None o texto del fallo, y requisitos del motor
+    (de MOTORES o de COMPROBACIONES)
+    """
+    if motor in MOTORES:
+        funcion, requisitos = MOTORES[motor]
+        return (lambda grafo, origen: verificar(funcion, grafo, origen, rtol)), requisitos
+
+    comprobar, requisitos = COMPROBACIONES[motor]
+
+    def verificar_comprobacion(grafo, origen):
+        esperado = distancias_referencia(grafo, origen)
+        try:
+            return comprobar(grafo, origen, esperado)
+        except Exception as error:
+            return f"{type(error).__name__}: {error}"
+
+    return verificar_comprobacion, requisitos
+
+def ejecutar(casos=300, semilla=0, motores=None, familias=None, n_max=30, reducir_fallos=True, rtol=1e-9):
+    """
+    Corre los motores sobre casos aleatorios de todas las familias
+
+    Parámetros:
+    casos: número de grafos (repartidos entre las familias en rotación)
+    semilla: semilla base; cada caso es reproducible con generar_caso
+    motores: nombres de MOTORES o COMPROBACIONES a probar (por defecto todos)
+    familias: nombres de FAMILIAS a usar (por defecto todas)
+    n_max: número máximo de nodos por grafo
+    reducir_fallos: reducir el primer contraejemplo de cada motor
+
+    Retorna:
+    Diccionario {motor: {'casos', 'fallos', 'contraejemplo'}} donde
+    contraejemplo es None o {'familia', 'caso', 'grafo', 'origen', 'detalle'}
+    """
+    motores = list(motores or [*MOTORES, *COMPROBACIONES])
+    familias = list(familias or FAMILIAS)
+    resumen = {motor: {'casos': 0, 'fallos': 0, 'contraejemplo': None} for motor in motores}
+
+    for caso in range(casos):
+        familia = familias[caso % len(familias)]
+        grafo, origen = generar_caso(familia, semilla + caso, n_max)
+        disponibles = propiedades(grafo)
+
+        for motor in motores:
+            comprobar, requisitos = _verificador(motor, rtol)
+            if not requisitos <= disponibles:
+                continue
+            resumen[motor]['casos'] += 1
+            detalle = comprobar(grafo, origen)
+            if detalle is None:
+                continue
+
+            resumen[motor]['fallos'] += 1
+            if resumen[motor]['contraejemplo'] is None:
+                reducido = grafo
+                if reducir_fallos:
+                    def falla(candidato, nodo):
+                        return requisitos <= propiedades(candidato) and comprobar(candidato, nodo)
+                    reducido = reducir(grafo, origen, falla)
+                resumen[motor]['contraejemplo'] = {
+                    'familia': familia, 'caso': semilla + caso, 'grafo': reducido, 'origen': origen,
+                    'detalle': comprobar(reducido, origen),
+                }
+
+    return resumen
+
+def imprimir_resumen(resumen, permitidos=()):
+    """
+    Tabla de motores y contraejemplos; los motores en permitidos se marcan
+    como inexactos en lugar de fallidos
+    """
+    print(f"{'Motor':<28} {'Casos':>7} {'Fallos':>7}  Estado")
+    for motor, datos in resumen.items():
+        if datos['fallos'] == 0:
+            estado = "✅ exacto"
+        elif motor in permitidos:
+            estado = "⚠️ inexacto (permitido)"
+        else:
+            estado = "❌ FALLA"
+        print(f"{motor:<28} {datos['casos']:>7} {datos['fallos']:>7}  {estado}")
+
+    for motor, datos in resumen.items():
+        ejemplo = datos['contraejemplo']
+        if ejemplo is None:
+            continue
+        print(f"\nContraejemplo reducido de {motor} (familia {ejemplo['familia']}, caso {ejemplo['caso']}):")
+        print(f"  grafo = {ejemplo['grafo']!r}")
+        print(f"  origen = {ejemplo['origen']!r}")
+        print(f"  {ejemplo['detalle']}")
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Pruebas diferenciales de los motores SSSP")
+    parser.add_argument('--casos', type=int, default=300)
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--n-max', type=int, default=30, help="número máximo de nodos por grafo")
+    parser.add_argument('--motor', action='append', choices=sorted([*MOTORES, *COMPROBACIONES]),
+                        help="motor a probar (repetible; por defecto todos)")
+    parser.add_argument('--familia', action='append', choices=sorted(FAMILIAS),
+                        help="familia de grafos (repetible; por defecto todas)")
+    parser.add_argument('--sin-reducir', action='store_true', help="no reducir los contraejemplos")
+    parser.add_argument('--permitir-inexactos', action='append', default=[], metavar='MOTOR',
+                        choices=sorted([*MOTORES, *COMPROBACIONES]),
+                        help="reportar los fallos del motor sin que la ejecución falle (repetible)")
+    args = parser.parse_args(argumentos)
+
+    inicio = time.time()
+    resumen = ejecutar(args.casos, args.semilla, args.motor, args.familia, args.n_max,
+                       reducir_fallos=not args.sin_reducir)
+    imprimir_resumen(resumen, args.permitir_inexactos)
+    print(f"\n{args.casos} casos en {time.time() - inicio:.1f} segundos")
+
+    fallidos = [motor for motor, datos in resumen.items()
+                if datos['fallos'] and motor not in args.permitir_inexactos]
+    if fallidos:
+        print(f"❌ Motores con fallos: {', '.join(fallidos)}")
+        return 1
+    if any(resumen[motor]['fallos'] for motor in args.permitir_inexactos if motor in resumen):
+        print("✅ Sin fallos fuera de los motores inexactos permitidos")
+    else:
+        print("✅ Todos los motores coinciden con la referencia")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
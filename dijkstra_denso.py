@@ -0,0 +1,139 @@
+"""
+ALGORITMO DE DIJKSTRA PARA GRAFOS DENSOS
+Versión de libro de texto sin heap sobre una matriz de adyacencia NumPy:
+cada extracción del mínimo es un argmin y cada relajación un np.minimum por filas
+Complejidad: O(n²), preferible a O(m log n) cuando m ≈ n²
+"""
+
+import time
+
+import numpy as np
+
+from perfilado import perfilar
+
+@perfilar
+def matriz_adyacencia(grafo, dtype=np.float64):
+    """
+    Convierte el grafo a matriz de adyacencia densa
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+    dtype: tipo de dato de la matriz
+
+    Retorna:
+    matriz: arreglo n x n con el peso de cada arista e inf donde no hay arista
+    nodos: lista de nodos en el orden de filas/columnas
+    indice: diccionario {nodo: posición}
+    """
+    nodos = list(grafo)
+    indice = {nodo: i for i, nodo in enumerate(nodos)}
+    n = len(nodos)
+
+    matriz = np.full((n, n), np.inf, dtype=dtype)
+    for i, nodo in enumerate(nodos):
+        vecinos = grafo[nodo]
+        if vecinos:
+            columnas = [indice[vecino] for vecino in vecinos]
+            matriz[i, columnas] = list(vecinos.values())
+
+    if n and matriz.min() < 0:
+        raise ValueError("Dijkstra denso requiere pesos no negativos")
+
+    return matriz, nodos, indice
+
+@perfilar
+def dijkstra_matriz(matriz, fuente):
+    """
+    Dijkstra O(n²) vectorizado sobre una matriz de adyacencia
+
+    Parámetros:
+    matriz: arreglo n x n (inf = sin arista), pesos no negativos
+    fuente: índice de la fila de origen
+
+    Retorna:
+    dist: arreglo float64 de distancias (inf = inalcanzable)
+    pred: arreglo int64 de predecesores (-1 = sin predecesor)
+    """
+    n = matriz.shape[0]
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    dist[fuente] = 0
+
+    # Copia de las distancias donde los nodos ya procesados valen inf
+    frontera = dist.copy()
+
+    for _ in range(n):
+        # Extraer el mínimo
+        actual = int(np.argmin(frontera))
+        distancia_actual = frontera[actual]
+        if distancia_actual == np.inf:
+            break
+        frontera[actual] = np.inf
+
+        # Relajar la fila completa. Con pesos no negativos un nodo ya procesado
+        # nunca mejora, así que no hace falta enmascararlos.
+        nueva = matriz[actual] + distancia_actual
+        mejora = nueva < dist
+        pred[mejora] = actual
+        np.minimum(dist, nueva, out=dist)
+        frontera[mejora] = nueva[mejora]
+
+    return dist, pred
+
+@perfilar
+def dijkstra_denso(grafo, origen, matriz=None):
+    """
+    Implementación de Dijkstra para grafos densos con la misma interfaz que dijkstra_original
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+    origen: nodo de inicio
+    matriz: resultado de matriz_adyacencia(grafo) para reutilizarlo entre consultas
+
+    Retorna:
+    distancias: diccionario con la distancia mínima desde origen a cada nodo
+    predecesores: diccionario para reconstruir los caminos
+    """
+    if matriz is None:
+        matriz = matriz_adyacencia(grafo)
+    adyacencia, nodos, indice = matriz
+
+    dist, pred = dijkstra_matriz(adyacencia, indice[origen])
+
+    distancias = {}
+    predecesores = {}
+    for i, nodo in enumerate(nodos):
+        distancias[nodo] = float(dist[i])
+        predecesores[nodo] = nodos[pred[i]] if pred[i] >= 0 else None
+    distancias[origen] = 0
+
+    return distancias, predecesores
+
+def ejecutar_prueba_denso():
+    """
+    Compara Dijkstra denso contra dijkstra_original en un grafo completo aleatorio
+    """
+    import random
+    from dijkstra_original import dijkstra_original
+
+    n = 500
+    grafo = {i: {j: random.randint(1, 100) for j in range(n) if j != i} for i in range(n)}
+
+    inicio = time.time()
+    distancias_heap, _ = dijkstra_original(grafo, 0)
+    tiempo_heap = time.time() - inicio
+
+    matriz = matriz_adyacencia(grafo)
+    inicio = time.time()
+    distancias, _ = dijkstra_denso(grafo, 0, matriz)
+    tiempo_ejecucion = time.time() - inicio
+
+    print(f"GRAFO COMPLETO: n={n}, m={n * (n - 1)}")
+    print(f"Dijkstra original: {tiempo_heap:.6f} segundos")
+    print(f"Dijkstra denso:    {tiempo_ejecucion:.6f} segundos")
+    print(f"Resultados iguales: {distancias == distancias_heap}")
+
+    return tiempo_ejecucion, distancias
+
+if __name__ == "__main__":
+    tiempo_denso, distancias_denso = ejecutar_prueba_denso()
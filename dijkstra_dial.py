@@ -0,0 +1,109 @@
+"""
+ALGORITMO DE DIAL (DIJKSTRA CON CUBETAS)
+Variante de Dijkstra para grafos con pesos enteros pequeños y no negativos
+Complejidad: O(m + n + D), donde:
+- D = distancia máxima alcanzada (acotada por (n - 1) * C)
+- C = peso máximo de una arista
+"""
+
+import time
+
+from perfilado import perfilar
+
+@perfilar
+def dijkstra_dial(grafo, origen):
+    """
+    Implementación del algoritmo de Dial usando un arreglo circular de cubetas
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}} con pesos enteros >= 0
+    origen: nodo de inicio
+
+    Retorna:
+    distancias: diccionario con la distancia mínima desde origen a cada nodo
+    predecesores: diccionario para reconstruir los caminos
+    """
+    # Peso máximo C: basta un arreglo circular de C + 1 cubetas
+    peso_maximo = 0
+    for vecinos in grafo.values():
+        for peso in vecinos.values():
+            if peso < 0 or peso != int(peso):
+                raise ValueError("El algoritmo de Dial requiere pesos enteros no negativos")
+            if peso > peso_maximo:
+                peso_maximo = peso
+    num_cubetas = int(peso_maximo) + 1
+
+    # Inicializar estructuras
+    distancias = {nodo: float('inf') for nodo in grafo}
+    predecesores = {nodo: None for nodo in grafo}
+    distancias[origen] = 0
+
+    cubetas = [[] for _ in range(num_cubetas)]
+    cubetas[0].append(origen)
+    pendientes = 1  # Entradas (posiblemente obsoletas) en las cubetas
+    distancia_actual = 0
+
+    procesados = set()
+
+    while pendientes:
+        cubeta = cubetas[distancia_actual % num_cubetas]
+
+        # Avanzar hasta la siguiente cubeta no vacía
+        if not cubeta:
+            distancia_actual += 1
+            continue
+
+        nodo_actual = cubeta.pop()
+        pendientes -= 1
+
+        # Entrada obsoleta: el nodo ya se procesó con una distancia menor
+        if nodo_actual in procesados or distancias[nodo_actual] != distancia_actual:
+            continue
+
+        procesados.add(nodo_actual)
+
+        # Relajar todas las aristas del nodo actual
+        for vecino, peso in grafo[nodo_actual].items():
+            if vecino in procesados:
+                continue
+
+            nueva_distancia = distancia_actual + int(peso)
+
+            if nueva_distancia < distancias[vecino]:
+                distancias[vecino] = nueva_distancia
+                predecesores[vecino] = nodo_actual
+                cubetas[nueva_distancia % num_cubetas].append(vecino)
+                pendientes += 1
+
+    return distancias, predecesores
+
+def ejecutar_prueba_dial():
+    """
+    Ejecuta una prueba con el grafo de ejemplo del proyecto
+    """
+    from dijkstra_original import imprimir_resultados
+
+    grafo_ejemplo = {
+        'A': {'B': 4, 'C': 2},
+        'B': {'A': 4, 'C': 1, 'D': 5},
+        'C': {'A': 2, 'B': 1, 'D': 8, 'E': 10},
+        'D': {'B': 5, 'C': 8, 'E': 2, 'F': 6},
+        'E': {'C': 10, 'D': 2, 'F': 3},
+        'F': {'D': 6, 'E': 3}
+    }
+
+    origen = 'A'
+
+    inicio = time.time()
+    distancias, predecesores = dijkstra_dial(grafo_ejemplo, origen)
+    tiempo_ejecucion = time.time() - inicio
+
+    imprimir_resultados(distancias, predecesores, origen)
+
+    print("\n" + "=" * 50)
+    print(f"TIEMPO DE EJECUCIÓN (DIAL): {tiempo_ejecucion:.6f} segundos")
+
+    return tiempo_ejecucion, distancias
+
+if __name__ == "__main__":
+    tiempo_dial, distancias_dial = ejecutar_prueba_dial()
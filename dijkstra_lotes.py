@@ -0,0 +1,168 @@
+"""
+DIJKSTRA POR LOTES DE FRONTERA
+Dijkstra exacto que, en lugar de sacar un nodo por vez del heap, fija en cada
+ronda todos los nodos cuya distancia ya no puede mejorar y relaja juntas sus
+aristas de salida con NumPy (np.repeat para los desplazamientos, np.minimum.at
+para la reducción), de modo que el trabajo por arista ocurre en bucles de C.
+
+Un nodo v de la frontera (distancia tentativa finita, no fijado) es definitivo si
+(criterios de Crauser et al.):
+- IN:  dist[v] - min_entrada[v] <= mínimo de la frontera, o
+- OUT: dist[v] <= mín sobre la frontera de (dist[u] + min_salida[u])
+Con pesos no negativos ambos garantizan que ningún camino por nodos aún no
+fijados llega a v con menor costo: el resultado es el mismo que dijkstra_original.
+"""
+
+import time
+
+import numpy as np
+
+from grafo_compacto import GrafoCompacto
+from grafo_no_dirigido import GrafoNoDirigido
+from perfilado import fase, perfilar
+
+def pesos_minimos(compacto):
+    """
+    Peso mínimo de las aristas de salida y de entrada de cada nodo (inf si no tiene)
+    """
+    n = compacto.n
+    pesos = compacto.pesos.astype(np.float64, copy=False)
+    min_salida = np.full(n, np.inf)
+    min_entrada = np.full(n, np.inf)
+    origenes = np.repeat(np.arange(n), compacto.grados())
+    np.minimum.at(min_salida, origenes, pesos)
+    np.minimum.at(min_entrada, compacto.indices, pesos)
+    return min_salida, min_entrada
+
+def dijkstra_lotes_compacto(compacto, fuente, minimos=None):
+    """
+    Dijkstra por lotes sobre un GrafoCompacto
+
+    Parámetros:
+    compacto: GrafoCompacto con pesos no negativos
+    fuente: posición del nodo de origen
+    minimos: resultado de pesos_minimos(compacto), para reutilizarlo entre consultas
+
+    Retorna:
+    dist: arreglo float64 de distancias (inf = inalcanzable)
+    pred: arreglo int64 de predecesores (-1 = sin predecesor)
+    """
+    n = compacto.n
+    min_salida, min_entrada = minimos if minimos is not None else pesos_minimos(compacto)
+
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    fijado = np.zeros(n, dtype=bool)
+    dist[fuente] = 0
+
+    # Frontera: nodos alcanzados y no fijados (sin repetidos)
+    frontera = np.array([fuente], dtype=np.int64)
+
+    while len(frontera):
+        with fase('seleccion'):
+            tentativas = dist[frontera]
+            minimo = tentativas.min()
+            limite_salida = (tentativas + min_salida[frontera]).min()
+            definitivos = (tentativas - min_entrada[frontera] <= minimo) | (tentativas <= limite_salida)
+            lote = frontera[definitivos]
+            frontera = frontera[~definitivos]
+            fijado[lote] = True
+
+        with fase('relajacion'):
+            origenes, posiciones = compacto.aristas_de(lote)
+            destinos = compacto.indices[posiciones]
+            # dist es float64: con pesos compactos la suma se acumula en 64 bits
+            nuevas = dist[origenes] + compacto.pesos[posiciones]
+
+            mejora = ~fijado[destinos] & (nuevas < dist[destinos])
+            if not mejora.any():
+                continue
+            destinos = destinos[mejora]
+            nuevas = nuevas[mejora]
+            origenes = origenes[mejora]
+
+            # Los nodos que pasan de inf a finito entran a la frontera
+            nuevos = destinos[dist[destinos] == np.inf]
+            np.minimum.at(dist, destinos, nuevas)
+
+            # Predecesor: cualquier arista que alcanzó el nuevo mínimo
+            ganadoras = nuevas == dist[destinos]
+            pred[destinos[ganadoras]] = origenes[ganadoras]
+
+            if len(nuevos):
+                frontera = np.concatenate((frontera, np.unique(nuevos)))
+
+    return dist, pred
+
+@perfilar
+def dijkstra_lotes(grafo, origen):
+    """
+    Dijkstra por lotes de frontera con la misma interfaz que dijkstra_original
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}} con pesos no
+           negativos, GrafoCompacto o GrafoNoDirigido
+    origen: nodo de inicio
+
+    Retorna:
+    distancias: diccionario con la distancia mínima desde origen a cada nodo
+    predecesores: diccionario para reconstruir los caminos
+
+    Lanza:
+    ValueError si hay pesos negativos
+    """
+    if isinstance(grafo, GrafoCompacto):
+        compacto = grafo
+    else:
+        with fase('conversion'):
+            compacto = grafo.a_compacto() if isinstance(grafo, GrafoNoDirigido) else GrafoCompacto.desde_dict(grafo)
+
+    if compacto.m and compacto.pesos.min() < 0:
+        raise ValueError("dijkstra_lotes requiere pesos no negativos")
+
+    dist, pred = dijkstra_lotes_compacto(compacto, compacto.indice[origen])
+    distancias, predecesores = compacto.resultado_a_dict(dist, pred)
+    distancias[origen] = 0
+    return distancias, predecesores
+
+def ejecutar_prueba_lotes(repeticiones=3):
+    """
+    Compara dijkstra_lotes con dijkstra_original y delta-stepping sobre
+    GrafoCompacto (sin contar la conversión) en grafos grandes
+    """
+    from delta_stepping import delta_stepping_compacto
+    from dijkstra_original import dijkstra_original
+    from generadores_grafos import grafo_carreteras, grafo_vecinos_aleatorios
+
+    grafos = [
+        ("Vecinos aleatorios 200000n", grafo_vecinos_aleatorios(200000, 5, 15, semilla=0)),
+        ("Carreteras 400x400", grafo_carreteras(400, semilla=0)),
+    ]
+
+    for nombre, grafo in grafos:
+        compacto = GrafoCompacto.desde_dict(grafo)
+        origen = compacto.nodos[0]
+        minimos = pesos_minimos(compacto)
+
+        print(f"\n{nombre}: n={compacto.n}, m={compacto.m}")
+        tiempos = {'dijkstra_original': float('inf'), 'dijkstra_lotes': float('inf'), 'delta_stepping': float('inf')}
+        for _ in range(repeticiones):
+            inicio = time.time()
+            referencia, _ = dijkstra_original(grafo, origen)
+            tiempos['dijkstra_original'] = min(tiempos['dijkstra_original'], time.time() - inicio)
+
+            inicio = time.time()
+            dist, pred = dijkstra_lotes_compacto(compacto, 0, minimos)
+            tiempos['dijkstra_lotes'] = min(tiempos['dijkstra_lotes'], time.time() - inicio)
+
+            inicio = time.time()
+            delta_stepping_compacto(compacto, 0)
+            tiempos['delta_stepping'] = min(tiempos['delta_stepping'], time.time() - inicio)
+
+        distancias, _ = compacto.resultado_a_dict(dist, pred)
+        for motor, tiempo in tiempos.items():
+            print(f"{motor:<18} {tiempo:.4f} segundos")
+        print(f"Iguales: {distancias == referencia}")
+
+if __name__ == "__main__":
+    ejecutar_prueba_lotes()
@@ -9,13 +9,19 @@ Complejidad: O(m log n) usando heap binario, donde:
 import heapq
 import time
 
-def dijkstra_original(grafo, origen):
+from perfilado import perfilar
+from resultado_disperso import DistanciasDispersas, PredecesoresDispersos
+
+@perfilar
+def dijkstra_original(grafo, origen, disperso=False):
     """
     Implementación del algoritmo de Dijkstra original usando min-heap
     
     Parámetros:
     grafo: diccionario de diccionarios {nodo: {vecino: peso}}
     origen: nodo de inicio
+    disperso: si es True, sólo se guardan los nodos alcanzados
+              (DistanciasDispersas / PredecesoresDispersos)
     
     Retorna:
     distancias: diccionario con la distancia mínima desde origen a cada nodo
@@ -23,8 +29,12 @@ def dijkstra_original(grafo, origen):
     """
     
     # Inicializar estructuras
-    distancias = {nodo: float('inf') for nodo in grafo}
-    predecesores = {nodo: None for nodo in grafo}
+    if disperso:
+        distancias = DistanciasDispersas()
+        predecesores = PredecesoresDispersos()
+    else:
+        distancias = {nodo: float('inf') for nodo in grafo}
+        predecesores = {nodo: None for nodo in grafo}
     distancias[origen] = 0
     
     # Heap para nodos no procesados (distancia, nodo)
@@ -59,6 +69,72 @@ def dijkstra_original(grafo, origen):
     
     return distancias, predecesores
 
+def dijkstra_generador(grafo, origen):
+    """
+    Variante de dijkstra_original que entrega cada nodo en cuanto se procesa
+    
+    Los nodos salen en orden de distancia no decreciente. El generador puede
+    pausarse y reanudarse entre nodos, o cancelarse con close(); el trabajo
+    realizado es proporcional a los nodos consumidos.
+    
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+    origen: nodo de inicio
+    
+    Genera:
+    Tuplas (nodo, distancia, predecesor)
+    """
+    # Sólo se guardan los nodos tocados
+    distancias = {origen: 0}
+    predecesores = {origen: None}
+    
+    heap = [(0, origen)]
+    procesados = set()
+    
+    while heap:
+        distancia_actual, nodo_actual = heapq.heappop(heap)
+        
+        if nodo_actual in procesados:
+            continue
+        
+        procesados.add(nodo_actual)
+        yield nodo_actual, distancia_actual, predecesores[nodo_actual]
+        
+        for vecino, peso in grafo[nodo_actual].items():
+            if vecino in procesados:
+                continue
+            
+            nueva_distancia = distancia_actual + peso
+            
+            if nueva_distancia < distancias.get(vecino, float('inf')):
+                distancias[vecino] = nueva_distancia
+                predecesores[vecino] = nodo_actual
+                heapq.heappush(heap, (nueva_distancia, vecino))
+
+def intercalar_busquedas(busquedas):
+    """
+    Avanza varias búsquedas de forma cooperativa, un nodo de cada una por turno
+    
+    Parámetros:
+    busquedas: lista de generadores (por ejemplo de dijkstra_generador)
+    
+    Genera:
+    Tuplas (posición de la búsqueda en la lista, (nodo, distancia, predecesor));
+    las búsquedas que terminan se retiran de la rotación
+    """
+    activas = list(enumerate(busquedas))
+    
+    while activas:
+        siguientes = []
+        for posicion, busqueda in activas:
+            try:
+                resultado = next(busqueda)
+            except StopIteration:
+                continue
+            siguientes.append((posicion, busqueda))
+            yield posicion, resultado
+        activas = siguientes
+
 def reconstruir_camino(predecesores, destino):
     """
     Reconstruye el camino desde el origen hasta el destino
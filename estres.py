@@ -0,0 +1,372 @@
+"""
+PRUEBAS DE ESTRÉS: ESCALABILIDAD CON PRESUPUESTOS DE TIEMPO Y MEMORIA
+Barre n de 10^3 a 10^7 en grafos dispersos, densos, rejillas (carreteras) y de
+ley de potencia. Cada celda (motor, familia, n) corre en un proceso aparte que
+genera su grafo y resuelve una consulta bajo un presupuesto de tiempo y de
+memoria; si lo excede, el proceso se termina y la celda queda marcada. Cuando un
+motor choca con su límite en una familia, los tamaños mayores se omiten: ese
+es su "muro". El resultado se guarda en JSON y se grafica el tiempo contra n
+(con los cruces entre motores y los muros marcados).
+
+Uso:
+    python estres.py --limite-tiempo 60 --limite-memoria 4 --grafico estres_cruces.png
+    python estres.py --tamanos 1000 10000 --familias disperso rejilla --motores dijkstra_original delta_stepping
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import signal
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    # Windows: el presupuesto de memoria no se aplica, sólo se reporta el pico
+    resource = None
+
+from cache_artefactos import huella_maquina
+from generadores_grafos import grafo_carreteras, grafo_ley_potencia, grafo_vecinos_aleatorios
+
+TAMANOS = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+
+FAMILIAS = {
+    'disperso': lambda n, semilla: grafo_vecinos_aleatorios(n, 2, 6, semilla=semilla),
+    # m ~ n^1.5
+    'denso': lambda n, semilla: grafo_vecinos_aleatorios(n, math.isqrt(n), math.isqrt(n), semilla=semilla),
+    'rejilla': lambda n, semilla: grafo_carreteras(math.isqrt(n), semilla=semilla),
+    'ley_potencia': lambda n, semilla: grafo_ley_potencia(n, 3, semilla=semilla),
+}
+
+def _dijkstra_original(grafo, origen):
+    from dijkstra_original import dijkstra_original
+    return dijkstra_original(grafo, origen)
+
+def _algoritmo_nuevo(grafo, origen):
+    from algoritmo_nuevo import AlgoritmoNuevoSSSP
+    return AlgoritmoNuevoSSSP().resolver(grafo, origen)
+
+def _delta_stepping(grafo, origen):
+    from delta_stepping import delta_stepping
+    return delta_stepping(grafo, origen)
+
+def _dijkstra_denso(grafo, origen):
+    from dijkstra_denso import dijkstra_denso
+    return dijkstra_denso(grafo, origen)
+
+def _dijkstra_lotes(grafo, origen):
+    from dijkstra_lotes import dijkstra_lotes
+    return dijkstra_lotes(grafo, origen)
+
+def _dijkstra_comprimido(grafo, origen):
+    from compresion_adyacencia import AdyacenciaComprimida, dijkstra_comprimido
+    return dijkstra_comprimido(AdyacenciaComprimida.desde_dict(grafo), origen)
+
+# Cada motor recibe el diccionario: las conversiones (CSR, matriz, compresión)
+# cuentan dentro de su tiempo y su memoria
+MOTORES = {
+    'dijkstra_original': _dijkstra_original,
+    'algoritmo_nuevo': _algoritmo_nuevo,
+    'delta_stepping': _delta_stepping,
+    'dijkstra_lotes': _dijkstra_lotes,
+    'dijkstra_denso': _dijkstra_denso,
+    'dijkstra_comprimido': _dijkstra_comprimido,
+}
+
+# Estados de una celda
+OK = 'ok'
+TIEMPO = 'tiempo'          # excedió el presupuesto de tiempo al resolver
+MEMORIA = 'memoria'        # excedió el presupuesto de memoria
+GENERACION = 'generacion'  # el grafo no se pudo generar dentro de los límites
+ERROR = 'error'
+OMITIDO = 'omitido'        # un tamaño menor ya chocó con un límite
+
+class _TiempoAgotado(Exception):
+    pass
+
+def _alarma(*_):
+    raise _TiempoAgotado()
+
+def _memoria_pico():
+    """
+    Memoria residente máxima del proceso actual en bytes (None si no se puede medir)
+    """
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KB; macOS, bytes
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+def _ejecutar_celda(motor, familia, n, semilla, limite_tiempo, limite_memoria, conexion):
+    """
+    Cuerpo del proceso hijo: genera el grafo, avisa, resuelve y envía el resultado
+    """
+    if resource is not None and limite_memoria:
+        resource.setrlimit(resource.RLIMIT_AS, (limite_memoria, limite_memoria))
+
+    try:
+        inicio = time.perf_counter()
+        grafo = FAMILIAS[familia](n, semilla)
+        origen = next(iter(grafo))
+        m = sum(len(vecinos) for vecinos in grafo.values())
+        conexion.send({'fase': 'generado', 'nodos': len(grafo), 'aristas': m,
+                       'tiempo_generacion': time.perf_counter() - inicio})
+    except MemoryError:
+        conexion.send({'estado': GENERACION, 'detalle': 'memoria al generar'})
+        return
+
+    try:
+        # El presupuesto de tiempo corre desde aquí; el padre sólo mata al proceso
+        # si la alarma no llega a interrumpirlo (código C largo, Windows)
+        if hasattr(signal, 'setitimer'):
+            signal.signal(signal.SIGALRM, _alarma)
+            signal.setitimer(signal.ITIMER_REAL, limite_tiempo)
+        inicio = time.perf_counter()
+        MOTORES[motor](grafo, origen)
+        tiempo = time.perf_counter() - inicio
+        if hasattr(signal, 'setitimer'):
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        conexion.send({'estado': OK, 'tiempo': tiempo, 'memoria_pico': _memoria_pico()})
+    except _TiempoAgotado:
+        conexion.send({'estado': TIEMPO, 'memoria_pico': _memoria_pico()})
+    except MemoryError:
+        conexion.send({'estado': MEMORIA, 'memoria_pico': _memoria_pico()})
+    except Exception as error:
+        conexion.send({'estado': ERROR, 'detalle': f"{type(error).__name__}: {error}"})
+
+def medir_celda(motor, familia, n, semilla=0, limite_tiempo=60, limite_memoria=4 * 2 ** 30,
+                limite_generacion=600, margen=10):
+    """
+    Mide una celda en un proceso aparte, con presupuestos
+
+    Parámetros:
+    motor: clave en MOTORES
+    familia: clave en FAMILIAS
+    n: número de nodos pedido
+    limite_tiempo: segundos para resolver la consulta (sin contar la generación)
+    limite_memoria: bytes de espacio de direcciones del proceso (generación
+                    incluida); None para no limitar
+    limite_generacion: segundos para generar el grafo
+    margen: segundos extra antes de matar un proceso que no respondió a la alarma
+
+    Retorna:
+    Diccionario con motor, familia, n, estado y, según el caso, nodos,
+    aristas, tiempo_generacion, tiempo, memoria_pico y detalle
+    """
+    celda = {'motor': motor, 'familia': familia, 'n': n}
+    receptor, emisor = multiprocessing.Pipe(duplex=False)
+    proceso = multiprocessing.Process(target=_ejecutar_celda,
+                                      args=(motor, familia, n, semilla, limite_tiempo, limite_memoria, emisor))
+    proceso.start()
+    emisor.close()
+
+    try:
+        for espera in (limite_generacion, limite_tiempo + margen):
+            if not receptor.poll(espera):
+                celda['estado'] = GENERACION if 'tiempo_generacion' not in celda else TIEMPO
+                break
+            mensaje = receptor.recv()
+            celda.update(mensaje)
+            if mensaje.pop('fase', None) is None:
+                break
+        celda.pop('fase', None)
+    except EOFError:
+        # El hijo murió sin responder: el sistema lo mató (típicamente por memoria)
+        proceso.join()
+        if 'tiempo_generacion' not in celda:
+            celda['estado'] = GENERACION
+        else:
+            celda['estado'] = MEMORIA if proceso.exitcode == -getattr(signal, 'SIGKILL', 9) else ERROR
+        celda['detalle'] = f"proceso terminado con código {proceso.exitcode}"
+    finally:
+        if proceso.is_alive():
+            proceso.kill()
+        proceso.join()
+        receptor.close()
+
+    return celda
+
+def barrido(tamanos=TAMANOS, familias=None, motores=None, semilla=0, limite_tiempo=60,
+            limite_memoria=4 * 2 ** 30, limite_generacion=600, detallado=True):
+    """
+    Mide todas las celdas (motor, familia, n) en orden creciente de n
+
+    Cuando un motor excede un presupuesto en una familia, los tamaños mayores
+    de esa familia se marcan como omitidos para ese motor; si lo que falla es
+    la generación del grafo, se omiten para todos los motores.
+
+    Retorna:
+    Diccionario con 'metadatos' y 'celdas' (lista de resultados de medir_celda)
+    """
+    familias = list(familias or FAMILIAS)
+    motores = list(motores or MOTORES)
+    celdas = []
+    muro = {}
+
+    for familia in familias:
+        for n in sorted(tamanos):
+            for motor in motores:
+                if (motor, familia) in muro:
+                    n_muro = muro[(motor, familia)]
+                    if n_muro == n:
+                        # Otro motor no pudo generar este mismo grafo
+                        celdas.append({'motor': motor, 'familia': familia, 'n': n, 'estado': GENERACION,
+                                       'detalle': 'el grafo no se pudo generar dentro de los límites'})
+                    else:
+                        celdas.append({'motor': motor, 'familia': familia, 'n': n, 'estado': OMITIDO,
+                                       'detalle': f"muro en n={n_muro}"})
+                    continue
+
+                celda = medir_celda(motor, familia, n, semilla, limite_tiempo, limite_memoria, limite_generacion)
+                celdas.append(celda)
+                if detallado:
+                    tiempo = f"{celda['tiempo']:.3f}s" if 'tiempo' in celda else '-'
+                    pico = f"{celda['memoria_pico'] / 2 ** 20:.0f} MB" if celda.get('memoria_pico') else '-'
+                    print(f"{familia:<13} n={n:<9} {motor:<20} {celda['estado']:<10} {tiempo:>10} {pico:>9}",
+                          flush=True)
+
+                if celda['estado'] != OK:
+                    muro[(motor, familia)] = n
+                    if celda['estado'] == GENERACION:
+                        for otro in motores:
+                            muro.setdefault((otro, familia), n)
+
+    metadatos = dict(huella_maquina(), fecha=time.strftime('%Y-%m-%dT%H:%M:%S'), semilla=semilla,
+                     limite_tiempo=limite_tiempo, limite_memoria=limite_memoria,
+                     limite_generacion=limite_generacion)
+    return {'metadatos': metadatos, 'celdas': celdas}
+
+def muros(resultados):
+    """
+    Último tamaño resuelto y primer límite alcanzado por (motor, familia)
+
+    Retorna:
+    Diccionario {(motor, familia): (n máximo resuelto o None, (n, estado) o None)}
+    """
+    resumen = {}
+    for celda in resultados['celdas']:
+        clave = (celda['motor'], celda['familia'])
+        maximo, choque = resumen.get(clave, (None, None))
+        if celda['estado'] == OK:
+            maximo = celda['n']
+        elif celda['estado'] != OMITIDO and choque is None:
+            choque = (celda['n'], celda['estado'])
+        resumen[clave] = (maximo, choque)
+    return resumen
+
+def cruces(resultados):
+    """
+    Tamaños entre los que dos motores intercambian el orden de rapidez
+
+    Retorna:
+    Lista de (familia, motor más rápido antes, motor más rápido después, n antes, n después)
+    """
+    tiempos = {}
+    for celda in resultados['celdas']:
+        if celda['estado'] == OK:
+            tiempos.setdefault(celda['familia'], {}).setdefault(celda['motor'], {})[celda['n']] = celda['tiempo']
+
+    encontrados = []
+    for familia, por_motor in tiempos.items():
+        nombres = sorted(por_motor)
+        for i, a in enumerate(nombres):
+            for b in nombres[i + 1:]:
+                comunes = sorted(set(por_motor[a]) & set(por_motor[b]))
+                for n1, n2 in zip(comunes, comunes[1:]):
+                    antes = por_motor[a][n1] < por_motor[b][n1]
+                    despues = por_motor[a][n2] < por_motor[b][n2]
+                    if antes != despues:
+                        rapido_antes, rapido_despues = (a, b) if antes else (b, a)
+                        encontrados.append((familia, rapido_antes, rapido_despues, n1, n2))
+    return encontrados
+
+def graficar_cruces(resultados, ruta=None):
+    """
+    Tiempo contra n (escala log-log) por familia; cada celda que excedió un
+    presupuesto se marca con una x sobre el límite de tiempo
+
+    Parámetros:
+    ruta: si se indica, se guarda la figura en lugar de mostrarla
+    """
+    import matplotlib.pyplot as plt
+
+    familias = list(dict.fromkeys(celda['familia'] for celda in resultados['celdas']))
+    motores = list(dict.fromkeys(celda['motor'] for celda in resultados['celdas']))
+    limite = resultados['metadatos']['limite_tiempo']
+
+    columnas = min(2, len(familias))
+    filas = math.ceil(len(familias) / columnas)
+    figura, ejes = plt.subplots(filas, columnas, figsize=(7 * columnas, 5 * filas), squeeze=False)
+    colores = {motor: f"C{i}" for i, motor in enumerate(motores)}
+
+    for eje, familia in zip(ejes.flat, familias):
+        for motor in motores:
+            celdas = [c for c in resultados['celdas'] if c['familia'] == familia and c['motor'] == motor]
+            resueltas = [c for c in celdas if c['estado'] == OK]
+            if resueltas:
+                eje.plot([c['n'] for c in resueltas], [c['tiempo'] for c in resueltas], 'o-',
+                         color=colores[motor], label=motor)
+            choques = [c for c in celdas if c['estado'] not in (OK, OMITIDO)]
+            if choques:
+                eje.plot([c['n'] for c in choques], [limite] * len(choques), 'x', markersize=12,
+                         markeredgewidth=2, color=colores[motor])
+        eje.axhline(limite, color='gray', linestyle='--', linewidth=1)
+        eje.set_xscale('log')
+        eje.set_yscale('log')
+        eje.set_xlabel('Nodos (n)')
+        eje.set_ylabel('Tiempo (segundos)')
+        eje.set_title(f"{familia} (x = presupuesto excedido)")
+        eje.legend(fontsize=8)
+        eje.grid(True, alpha=0.3, which='both')
+
+    for eje in list(ejes.flat)[len(familias):]:
+        eje.set_visible(False)
+    plt.tight_layout()
+
+    if ruta:
+        plt.savefig(ruta, dpi=120)
+        plt.close(figura)
+    else:
+        plt.show()
+
+def imprimir_resumen(resultados):
+    print(f"\n{'Familia':<13} {'Motor':<20} {'Máximo n resuelto':>18}  Muro")
+    for (motor, familia), (maximo, choque) in sorted(muros(resultados).items(), key=lambda x: (x[0][1], x[0][0])):
+        texto_muro = f"{choque[1]} en n={choque[0]}" if choque else "ninguno"
+        print(f"{familia:<13} {motor:<20} {maximo if maximo else '-':>18}  {texto_muro}")
+
+    encontrados = cruces(resultados)
+    if encontrados:
+        print("\nCruces:")
+        for familia, antes, despues, n1, n2 in encontrados:
+            print(f"  {familia}: {antes} es más rápido en n={n1}, {despues} en n={n2}")
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Pruebas de estrés con presupuestos de tiempo y memoria")
+    parser.add_argument('--tamanos', type=float, nargs='+', default=TAMANOS)
+    parser.add_argument('--familias', nargs='+', choices=sorted(FAMILIAS))
+    parser.add_argument('--motores', nargs='+', choices=sorted(MOTORES))
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--limite-tiempo', type=float, default=60, help="segundos por consulta")
+    parser.add_argument('--limite-memoria', type=float, default=4, help="GB por celda (0 = sin límite)")
+    parser.add_argument('--limite-generacion', type=float, default=600, help="segundos para generar cada grafo")
+    parser.add_argument('--salida', default='resultados_estres.json')
+    parser.add_argument('--grafico', help="guardar el gráfico de tiempos y cruces")
+    args = parser.parse_args(argumentos)
+
+    resultados = barrido([int(n) for n in args.tamanos], args.familias, args.motores, args.semilla,
+                         args.limite_tiempo, int(args.limite_memoria * 2 ** 30) or None, args.limite_generacion)
+    with open(args.salida, 'w', encoding='utf-8') as archivo:
+        json.dump(resultados, archivo, indent=2, ensure_ascii=False)
+    print(f"Resultados guardados en {args.salida}")
+
+    imprimir_resumen(resultados)
+    if args.grafico:
+        graficar_cruces(resultados, args.grafico)
+        print(f"Gráfico guardado en {args.grafico}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
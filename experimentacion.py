@@ -10,9 +10,10 @@ import seaborn as sns
 from datetime import datetime
 import json
 import os
-import random
 from tqdm import tqdm
 import warnings
+from cache_artefactos import CacheArtefactos, hash_grafo
+from alcanzabilidad import nodos_alcanzables
 warnings.filterwarnings('ignore')
 
 # ============================================================================
@@ -62,9 +63,13 @@ def nuevo_algoritmo_simple(grafo, origen):
     distancias = {nodo: float('inf') for nodo in grafo}
     distancias[origen] = 0
     
+    # Sólo los nodos alcanzables pueden activarse (en el orden del grafo)
+    alcanzables = set(nodos_alcanzables(grafo, origen))
+    candidatos = [nodo for nodo in grafo if nodo in alcanzables]
+    
     # Procesar en fases
     for iteracion in range(L):
-        nodos_activos = [nodo for nodo in grafo if distancias[nodo] < float('inf')]
+        nodos_activos = [nodo for nodo in candidatos if distancias[nodo] < float('inf')]
         
         for nodo_actual in nodos_activos:
             for vecino, peso in grafo[nodo_actual].items():
@@ -79,8 +84,15 @@ def nuevo_algoritmo_simple(grafo, origen):
 # 2. FUNCIONES PARA GENERAR GRAFOS
 # ============================================================================
 
-def generar_grafos_prueba():
-    """Genera grafos de prueba simples"""
+def generar_grafos_prueba(cache=None, semilla=0):
+    """Genera grafos de prueba simples
+    
+    Los grafos aleatorios salen de generadores_grafos con semilla fija y se
+    guardan en la caché de artefactos: las siguientes ejecuciones los leen de
+    disco en lugar de volver a generarlos"""
+    
+    if cache is None:
+        cache = CacheArtefactos()
     
     # Grafo 1: Simple de 6 nodos
     grafo1 = {
@@ -93,30 +105,14 @@ def generar_grafos_prueba():
     }
     
     # Grafo 2: Aleatorio de 10 nodos
-    grafo2 = {}
-    for i in range(10):
-        grafo2[i] = {}
-        for j in range(10):
-            if i != j and random.random() < 0.3:
-                grafo2[i][j] = random.randint(1, 20)
+    grafo2 = cache.obtener_grafo('aleatorio', semilla, n=10, densidad=0.3, peso_min=1, peso_max=20)
     
     # Grafo 3: Aleatorio de 20 nodos
-    grafo3 = {}
-    for i in range(20):
-        grafo3[i] = {}
-        for j in range(20):
-            if i != j and random.random() < 0.2:
-                grafo3[i][j] = random.randint(1, 50)
+    grafo3 = cache.obtener_grafo('aleatorio', semilla, n=20, densidad=0.2, peso_min=1, peso_max=50)
     
     # Grafo 4: Aleatorio de 30 nodos
-    grafo4 = {}
-    for i in range(30):
-        grafo4[i] = {}
-        num_vecinos = random.randint(5, 15)
-        vecinos = random.sample(range(30), num_vecinos)
-        for j in vecinos:
-            if i != j:
-                grafo4[i][j] = random.randint(1, 100)
+    grafo4 = cache.obtener_grafo('vecinos_aleatorios', semilla, n=30, min_vecinos=5, max_vecinos=15,
+                                 peso_min=1, peso_max=100)
     
     return [
         ("Grafo_6n", grafo1),
@@ -129,15 +125,22 @@ def generar_grafos_prueba():
 # 3. EJECUTAR EXPERIMENTOS SIMPLES
 # ============================================================================
 
-def ejecutar_experimentos_simples():
-    """Ejecuta experimentos y muestra resultados"""
+def ejecutar_experimentos_simples(cache=None):
+    """Ejecuta experimentos y muestra resultados
+    
+    Con la caché de artefactos, los grafos, las distancias de referencia y los
+    tiempos de los motores cuyo código no cambió se reutilizan de ejecuciones
+    anteriores; sólo se vuelven a medir los motores modificados"""
     
     print("=" * 60)
     print("EXPERIMENTOS SIMPLES: DIJKSTRA vs NUEVO ALGORITMO")
     print("=" * 60)
     
+    if cache is None:
+        cache = CacheArtefactos()
+    
     # Generar grafos
-    grafos = generar_grafos_prueba()
+    grafos = generar_grafos_prueba(cache)
     
     resultados = []
     
@@ -145,17 +148,24 @@ def ejecutar_experimentos_simples():
     for nombre, grafo in grafos:
         print(f"\nProbando {nombre}: {len(grafo)} nodos")
         
-        # Medir Dijkstra
-        inicio = time.time()
-        for _ in range(10):  # 10 ejecuciones para promedio
-            dijkstra_simple(grafo, 0)
-        tiempo_dijkstra = (time.time() - inicio) / 10
+        # Distancias de referencia para verificar a los motores
+        clave = hash_grafo(grafo)
+        referencia = cache.distancias_referencia(grafo, 0, clave_grafo=clave)
+        
+        # Medir Dijkstra (10 ejecuciones para promedio); la comprobación contra
+        # la referencia queda en la caché junto al tiempo
+        medicion_dijkstra = cache.medir_motor(dijkstra_simple, grafo, 0, repeticiones=10,
+                                              clave_grafo=clave, referencia=referencia)
+        tiempo_dijkstra = medicion_dijkstra['tiempo']
         
         # Medir nuevo algoritmo
-        inicio = time.time()
-        for _ in range(10):
-            nuevo_algoritmo_simple(grafo, 0)
-        tiempo_nuevo = (time.time() - inicio) / 10
+        medicion_nuevo = cache.medir_motor(nuevo_algoritmo_simple, grafo, 0, repeticiones=10,
+                                           clave_grafo=clave, referencia=referencia)
+        tiempo_nuevo = medicion_nuevo['tiempo']
+        
+        for medicion in (medicion_dijkstra, medicion_nuevo):
+            if not medicion['coincide']:
+                print(f"  ⚠️ {medicion['motor']} no coincide con la referencia")
         
         # Calcular speedup
         if tiempo_nuevo > 0:
@@ -177,6 +187,8 @@ def ejecutar_experimentos_simples():
         print(f"  Nuevo: {tiempo_nuevo:.6f}s")
         print(f"  Speedup: {speedup:.2f}x")
     
+    print(f"\nCaché de artefactos: {cache.aciertos} aciertos, {cache.fallos} fallos")
+    
     return pd.DataFrame(resultados)
 
 # ============================================================================
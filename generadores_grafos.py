@@ -0,0 +1,112 @@
+"""
+GENERADORES DE GRAFOS CON SEMILLA
+Versiones reproducibles de los grafos aleatorios usados en los experimentos:
+cada generador recibe una semilla y produce siempre el mismo grafo
+{nodo: {vecino: peso}}, lo que permite identificarlo por (generador, parámetros, semilla)
+"""
+
+import random
+
+def grafo_aleatorio(n, densidad, peso_min=1, peso_max=100, semilla=None):
+    """
+    Grafo dirigido donde cada arista i -> j (i != j) existe con probabilidad densidad
+    (mismo esquema que prueba_con_varios_grafos y generar_grafos_prueba)
+    """
+    generador = random.Random(semilla)
+    grafo = {}
+    for i in range(n):
+        grafo[i] = {}
+        for j in range(n):
+            if i != j and generador.random() < densidad:
+                grafo[i][j] = generador.randint(peso_min, peso_max)
+    return grafo
+
+def grafo_vecinos_aleatorios(n, min_vecinos, max_vecinos, peso_min=1, peso_max=100, semilla=None):
+    """
+    Grafo dirigido donde cada nodo elige entre min_vecinos y max_vecinos vecinos al azar
+    """
+    generador = random.Random(semilla)
+    grafo = {}
+    for i in range(n):
+        grafo[i] = {}
+        num_vecinos = generador.randint(min_vecinos, max_vecinos)
+        for j in generador.sample(range(n), min(num_vecinos, n)):
+            if i != j:
+                grafo[i][j] = generador.randint(peso_min, peso_max)
+    return grafo
+
+def _etiquetas_barajadas(n, generador):
+    """
+    Etiquetas 0..n-1 en orden aleatorio: como en los datos reales, la
+    numeración de los nodos no guarda relación con su posición en el grafo
+    """
+    etiquetas = list(range(n))
+    generador.shuffle(etiquetas)
+    return etiquetas
+
+def grafo_carreteras(lado, peso_min=1, peso_max=100, prob_corte=0.1, prob_atajo=0.02, semilla=None):
+    """
+    Red tipo carreteras: cuadrícula lado x lado con calles de doble sentido,
+    algunas calles cortadas y algunos atajos diagonales; grado medio cercano a 4
+    """
+    generador = random.Random(semilla)
+    etiqueta = _etiquetas_barajadas(lado * lado, generador)
+    grafo = {i: {} for i in range(lado * lado)}
+
+    def unir(a, b):
+        peso = generador.randint(peso_min, peso_max)
+        grafo[etiqueta[a]][etiqueta[b]] = peso
+        grafo[etiqueta[b]][etiqueta[a]] = peso
+
+    for fila in range(lado):
+        for columna in range(lado):
+            i = fila * lado + columna
+            if columna + 1 < lado and generador.random() >= prob_corte:
+                unir(i, i + 1)
+            if fila + 1 < lado and generador.random() >= prob_corte:
+                unir(i, i + lado)
+            if fila + 1 < lado and columna + 1 < lado and generador.random() < prob_atajo:
+                unir(i, i + lado + 1)
+    return grafo
+
+def grafo_ley_potencia(n, aristas_por_nodo=3, peso_min=1, peso_max=100, semilla=None):
+    """
+    Grafo de ley de potencia (Barabási-Albert): cada nodo nuevo se une a
+    aristas_por_nodo nodos existentes elegidos con probabilidad proporcional
+    a su grado, en ambos sentidos
+    """
+    generador = random.Random(semilla)
+    etiqueta = _etiquetas_barajadas(n, generador)
+    grafo = {i: {} for i in range(n)}
+
+    # Cada nodo aparece en extremos tantas veces como su grado
+    extremos = list(range(min(aristas_por_nodo, n)))
+    for nuevo in range(len(extremos), n):
+        destinos = set()
+        while len(destinos) < min(aristas_por_nodo, nuevo):
+            destinos.add(generador.choice(extremos))
+        for destino in destinos:
+            peso = generador.randint(peso_min, peso_max)
+            grafo[etiqueta[nuevo]][etiqueta[destino]] = peso
+            grafo[etiqueta[destino]][etiqueta[nuevo]] = peso
+            extremos.extend((nuevo, destino))
+    return grafo
+
+# Registro de generadores por nombre, para identificar grafos en la caché
+GENERADORES = {
+    'aleatorio': grafo_aleatorio,
+    'vecinos_aleatorios': grafo_vecinos_aleatorios,
+    'carreteras': grafo_carreteras,
+    'ley_potencia': grafo_ley_potencia,
+}
+
+def generar(nombre, semilla, **parametros):
+    """
+    Genera un grafo con el generador registrado bajo nombre
+
+    Parámetros:
+    nombre: clave en GENERADORES
+    semilla: semilla del generador aleatorio
+    parametros: argumentos del generador (n, densidad, ...)
+    """
+    return GENERADORES[nombre](semilla=semilla, **parametros)
@@ -0,0 +1,273 @@
+"""
+REPRESENTACIÓN COMPACTA DE GRAFOS (CSR)
+Convierte el diccionario de diccionarios {nodo: {vecino: peso}} a arreglos NumPy
+contiguos (formato CSR: indptr, indices, pesos) para los motores vectorizados
+"""
+
+import numpy as np
+
+# Tipos de peso compactos, del más pequeño al más grande
+TIPOS_PESO = (np.uint16, np.uint32, np.float32, np.float64)
+
+# Nodos por bloque al convertir los pesos de un diccionario a un tipo compacto
+_NODOS_POR_BLOQUE = 4096
+
+def tipo_pesos_minimo(pesos):
+    """
+    El tipo más pequeño de TIPOS_PESO que representa exactamente todos los pesos
+
+    Parámetros:
+    pesos: arreglo float64 de pesos
+    """
+    for dtype in TIPOS_PESO:
+        try:
+            convertir_pesos(pesos, dtype)
+        except ValueError:
+            continue
+        return dtype
+    return np.float64
+
+def convertir_pesos(pesos, dtype, exacto=True):
+    """
+    Convierte el arreglo de pesos a dtype comprobando que quepan
+
+    Parámetros:
+    pesos: arreglo de pesos (cualquier tipo numérico)
+    dtype: np.uint16, np.uint32, np.float32 o np.float64
+    exacto: con float32, exigir que cada peso se represente sin redondeo;
+            con False se acepta el redondeo (ver delta_stepping(..., verificar=True))
+
+    Retorna:
+    Arreglo de pesos de tipo dtype
+
+    Lanza:
+    ValueError si algún peso no cabe en dtype (entero no negativo dentro de
+    rango para uint16/uint32; valor exacto o finito para float32)
+    """
+    dtype = np.dtype(dtype)
+    pesos = np.asarray(pesos)
+
+    if np.issubdtype(dtype, np.integer):
+        limite = np.iinfo(dtype)
+        if len(pesos) and (pesos.min() < limite.min or pesos.max() > limite.max):
+            raise ValueError(f"Pesos fuera del rango de {dtype} [{limite.min}, {limite.max}]: "
+                             f"mínimo {pesos.min()}, máximo {pesos.max()}")
+        convertidos = pesos.astype(dtype)
+        inexactos = np.count_nonzero(convertidos != pesos)
+        if inexactos:
+            raise ValueError(f"{inexactos} pesos no son enteros y no caben en {dtype}")
+        return convertidos
+
+    with np.errstate(over='ignore'):
+        convertidos = pesos.astype(dtype)
+    if len(pesos) and not np.isfinite(convertidos).all() and np.isfinite(pesos).all():
+        raise ValueError(f"Pesos fuera del rango de {dtype}")
+    if exacto:
+        inexactos = np.count_nonzero(convertidos != pesos)
+        if inexactos:
+            raise ValueError(f"{inexactos} pesos no se representan exactamente en {dtype} "
+                             f"(use exacto=False para aceptar el redondeo)")
+    return convertidos
+
+def _si_redondeados(pesos, convertidos):
+    """
+    Los pesos float64 previos si la conversión los redondeó, None si es exacta
+    """
+    if np.array_equal(convertidos, pesos):
+        return None
+    return np.asarray(pesos, dtype=np.float64)
+
+def _convertir_por_bloques(bloques, m, dtype, exacto=True):
+    """
+    Convierte los pesos bloque a bloque directamente al tipo destino, sin
+    armar antes el arreglo float64 completo
+
+    Parámetros:
+    bloques: iterable de arreglos float64 con los m pesos, en orden
+    dtype: tipo destino, o 'auto' para el más pequeño de TIPOS_PESO que sea
+           exacto (si un bloque no cabe, se pasa al tipo siguiente y se
+           comprueba que los bloques anteriores sigan siendo exactos)
+    exacto: ver convertir_pesos
+
+    Retorna:
+    (pesos convertidos, pesos float64 previos o None si no hubo redondeo)
+    """
+    auto = isinstance(dtype, str) and dtype == 'auto'
+    tipos = TIPOS_PESO if auto else (dtype,)
+    # 'auto' sólo admite tipos exactos
+    exacto = exacto or auto
+    k = 0
+    convertidos = np.empty(m, dtype=tipos[0])
+    originales = None
+    inicio = 0
+
+    for bloque in bloques:
+        fin = inicio + len(bloque)
+        while True:
+            try:
+                if np.dtype(tipos[k]) == np.float64:
+                    parte = bloque
+                else:
+                    parte = convertir_pesos(bloque, tipos[k], exacto)
+                if convertidos.dtype != tipos[k]:
+                    previos = convertir_pesos(convertidos[:inicio], tipos[k])
+                    convertidos = np.empty(m, dtype=tipos[k])
+                    convertidos[:inicio] = previos
+                break
+            except ValueError:
+                if k + 1 == len(tipos):
+                    raise
+                k += 1
+
+        convertidos[inicio:fin] = parte
+        # Sólo con exacto=False puede haber redondeo: desde ahí se guardan los originales
+        if originales is None and not np.array_equal(parte, bloque):
+            originales = np.empty(m, dtype=np.float64)
+            originales[:inicio] = convertidos[:inicio]
+        if originales is not None:
+            originales[inicio:fin] = bloque
+        inicio = fin
+
+    return convertidos, originales
+
+class GrafoCompacto:
+    """
+    Grafo dirigido en formato CSR
+
+    Los vecinos del nodo en la posición i son indices[indptr[i]:indptr[i + 1]]
+    con pesos pesos[indptr[i]:indptr[i + 1]]. Si los pesos se redondearon al
+    convertirlos (exacto=False), pesos_originales conserva los float64 previos
+    para verificar los resultados; si no, es None.
+    """
+
+    def __init__(self, nodos, indptr, indices, pesos, pesos_originales=None):
+        self.nodos = nodos
+        self.indice = {nodo: i for i, nodo in enumerate(nodos)}
+        self.indptr = indptr
+        self.indices = indices
+        self.pesos = pesos
+        self.pesos_originales = pesos_originales
+
+    @classmethod
+    def desde_dict(cls, grafo, dtype_pesos=np.float64, exacto=True):
+        """
+        Construye el grafo compacto a partir de {nodo: {vecino: peso}}
+
+        Parámetros:
+        grafo: diccionario de diccionarios
+        dtype_pesos: tipo de dato del arreglo de pesos: np.float64, un tipo
+                     compacto (np.uint16, np.uint32, np.float32, con comprobación
+                     de rango) o 'auto' para el más pequeño que sea exacto
+        exacto: ver convertir_pesos
+
+        Retorna:
+        GrafoCompacto con los nodos en el orden de iteración del diccionario
+        """
+        nodos = list(grafo)
+        indice = {nodo: i for i, nodo in enumerate(nodos)}
+
+        grados = np.fromiter((len(grafo[nodo]) for nodo in nodos), dtype=np.int64, count=len(nodos))
+        indptr = np.zeros(len(nodos) + 1, dtype=np.int64)
+        np.cumsum(grados, out=indptr[1:])
+
+        m = int(indptr[-1])
+        indices = np.fromiter((indice[vecino] for nodo in nodos for vecino in grafo[nodo]),
+                              dtype=np.int64, count=m)
+        if not (isinstance(dtype_pesos, str) and dtype_pesos == 'auto') and np.dtype(dtype_pesos) == np.float64:
+            pesos = np.fromiter((peso for nodo in nodos for peso in grafo[nodo].values()),
+                                dtype=np.float64, count=m)
+            return cls(nodos, indptr, indices, pesos)
+
+        # Tipos compactos: se convierte por bloques de nodos, sin el arreglo
+        # float64 completo; la copia exacta sólo se guarda si hubo redondeo
+        paso = _NODOS_POR_BLOQUE
+        bloques = (np.fromiter((peso for nodo in nodos[a:a + paso] for peso in grafo[nodo].values()),
+                               dtype=np.float64, count=int(indptr[min(a + paso, len(nodos))] - indptr[a]))
+                   for a in range(0, len(nodos), paso))
+        pesos, originales = _convertir_por_bloques(bloques, m, dtype_pesos, exacto)
+        return cls(nodos, indptr, indices, pesos, originales)
+
+    def con_pesos(self, dtype, exacto=True):
+        """
+        Copia del grafo con los pesos en otro tipo (comparte indptr e indices)
+        """
+        convertidos = convertir_pesos(self.pesos, dtype, exacto)
+        originales = self.pesos_originales
+        if originales is None:
+            originales = _si_redondeados(self.pesos, convertidos)
+        return GrafoCompacto(self.nodos, self.indptr, self.indices, convertidos, originales)
+
+    def pesos_exactos(self):
+        """
+        Pesos en float64 antes de cualquier redondeo de la conversión
+        """
+        if self.pesos_originales is not None:
+            return self.pesos_originales
+        return self.pesos.astype(np.float64, copy=False)
+
+    def memoria(self):
+        """
+        Bytes ocupados por los arreglos indptr, indices y pesos
+        """
+        return self.indptr.nbytes + self.indices.nbytes + self.pesos.nbytes
+
+    @property
+    def n(self):
+        return len(self.nodos)
+
+    @property
+    def m(self):
+        return len(self.indices)
+
+    def grados(self):
+        """
+        Grado de salida de cada nodo
+        """
+        return np.diff(self.indptr)
+
+    def aristas_de(self, fuentes):
+        """
+        Reúne todas las aristas salientes de un conjunto de nodos
+
+        Parámetros:
+        fuentes: arreglo de posiciones de nodos
+
+        Retorna:
+        origenes: posición del nodo de origen de cada arista
+        posiciones: posición de cada arista en indices/pesos
+        """
+        inicios = self.indptr[fuentes]
+        cuentas = self.indptr[fuentes + 1] - inicios
+        total = int(cuentas.sum())
+
+        # posiciones = inicio de su nodo + desplazamiento dentro del nodo
+        desplazamientos = np.repeat(inicios - np.cumsum(cuentas) + cuentas, cuentas)
+        posiciones = desplazamientos + np.arange(total)
+        origenes = np.repeat(fuentes, cuentas)
+
+        return origenes, posiciones
+
+    def a_dict(self):
+        """
+        Convierte de vuelta a diccionario de diccionarios
+        """
+        grafo = {}
+        for i, nodo in enumerate(self.nodos):
+            inicio, fin = self.indptr[i], self.indptr[i + 1]
+            grafo[nodo] = {self.nodos[j]: peso for j, peso in
+                           zip(self.indices[inicio:fin].tolist(), self.pesos[inicio:fin].tolist())}
+        return grafo
+
+    def resultado_a_dict(self, dist, pred):
+        """
+        Convierte arreglos de distancias y predecesores a los diccionarios
+        que retorna dijkstra_original
+
+        Parámetros:
+        dist: arreglo de distancias por posición (inf = inalcanzable)
+        pred: arreglo de posiciones de predecesores (-1 = sin predecesor)
+        """
+        nodos = self.nodos
+        distancias = dict(zip(nodos, dist.tolist()))
+        predecesores = {nodo: (nodos[p] if p >= 0 else None) for nodo, p in zip(nodos, pred.tolist())}
+        return distancias, predecesores
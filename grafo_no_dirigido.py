@@ -0,0 +1,278 @@
+"""
+GRAFOS NO DIRIGIDOS CON MEDIO ALMACENAMIENTO
+En un grafo no dirigido el diccionario {nodo: {vecino: peso}} guarda cada arista
+dos veces ('A': {'B': 4} y 'B': {'A': 4}). GrafoNoDirigido la guarda una sola vez
+(en la fila del extremo de menor posición, formato CSR) y sirve ambas
+direcciones a través de una vista simétrica:
+- como Mapping {nodo: {vecino: peso}}, para los motores sobre diccionarios
+- vecinos(i) por posición y a_compacto(), para los motores sobre arreglos
+La simetría se valida al importar desde un diccionario.
+"""
+
+import time
+from collections.abc import Mapping
+
+import numpy as np
+
+from grafo_compacto import GrafoCompacto, _si_redondeados, convertir_pesos, tipo_pesos_minimo
+
+class GrafoAsimetricoError(ValueError):
+    """
+    El diccionario no describe un grafo no dirigido; asimetrias es una lista
+    de (nodo, vecino, peso, peso_inverso) con peso_inverso None si falta la
+    arista de vuelta
+    """
+
+    def __init__(self, asimetrias):
+        self.asimetrias = asimetrias
+        muestra = ", ".join(f"{u}->{v}: {w} / {v}->{u}: {inverso}" for u, v, w, inverso in asimetrias[:5])
+        super().__init__(f"El grafo no es simétrico ({len(asimetrias)} aristas): {muestra}")
+
+def asimetrias(grafo):
+    """
+    Aristas sin su inversa del mismo peso
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+
+    Retorna:
+    Lista de (nodo, vecino, peso, peso_inverso); vacía si el grafo es simétrico
+    """
+    encontradas = []
+    for nodo, vecinos in grafo.items():
+        for vecino, peso in vecinos.items():
+            inverso = grafo.get(vecino, {}).get(nodo)
+            if inverso != peso:
+                encontradas.append((nodo, vecino, peso, inverso))
+    return encontradas
+
+def es_simetrico(grafo):
+    """
+    True si toda arista u -> v tiene su inversa v -> u con el mismo peso
+    """
+    return not asimetrias(grafo)
+
+class GrafoNoDirigido(Mapping):
+    """
+    Grafo no dirigido con cada arista guardada una vez
+
+    La arista {i, j} con i <= j (posiciones) está en la fila i:
+    indices[indptr[i]:indptr[i + 1]] y pesos[indptr[i]:indptr[i + 1]].
+    El índice inverso (indptr_inverso, aristas_inversas) lista, para cada j,
+    las posiciones de las aristas guardadas en filas anteriores que llegan a j;
+    así los pesos no se duplican.
+
+    Como Mapping, grafo[nodo] retorna {vecino: peso} con ambas direcciones,
+    de modo que dijkstra_original, spfa, AlgoritmoNuevoSSSP, etc. funcionan
+    sin cambios. Cada acceso arma el diccionario de vecinos: la vista cambia
+    memoria por tiempo; para muchas consultas sobre diccionarios conviene
+    a_dict(), y los motores sobre arreglos usan a_compacto().
+
+    Como en GrafoCompacto, si los pesos se redondearon al convertirlos
+    (exacto=False), pesos_originales conserva los float64 previos; si no, es None.
+    """
+
+    def __init__(self, nodos, indptr, indices, pesos, pesos_originales=None):
+        self.nodos = nodos
+        self.indice = {nodo: i for i, nodo in enumerate(nodos)}
+        self.indptr = indptr
+        self.indices = indices
+        self.pesos = pesos
+        self.pesos_originales = pesos_originales
+
+        # Índice inverso: aristas (i, j) con i < j agrupadas por j (los lazos sólo en su fila)
+        origenes = np.repeat(np.arange(len(nodos), dtype=indices.dtype), np.diff(indptr))
+        hacia_atras = np.flatnonzero(indices != origenes)
+        orden = np.argsort(indices[hacia_atras], kind='stable')
+        self.aristas_inversas = hacia_atras[orden].astype(indices.dtype)
+        self.indptr_inverso = np.zeros(len(nodos) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(indices[hacia_atras], minlength=len(nodos)), out=self.indptr_inverso[1:])
+
+    @classmethod
+    def desde_dict(cls, grafo, dtype_pesos=np.float64, exacto=True, validar=True):
+        """
+        Construye el grafo a partir de un diccionario simétrico {nodo: {vecino: peso}}
+
+        Parámetros:
+        grafo: diccionario de diccionarios con cada arista en ambas direcciones
+        dtype_pesos: tipo de los pesos, como en GrafoCompacto.desde_dict ('auto' incluido)
+        exacto: ver convertir_pesos
+        validar: comprobar que el diccionario sea simétrico
+
+        Lanza:
+        GrafoAsimetricoError si validar es True y alguna arista no tiene su
+        inversa con el mismo peso
+        """
+        if validar:
+            encontradas = asimetrias(grafo)
+            if encontradas:
+                raise GrafoAsimetricoError(encontradas)
+
+        nodos = list(grafo)
+        indice = {nodo: i for i, nodo in enumerate(nodos)}
+        tipo_indices = np.int32 if len(nodos) < 2 ** 31 else np.int64
+
+        # Sólo la mitad superior: aristas hacia nodos de posición mayor o igual
+        filas = [[(indice[vecino], peso) for vecino, peso in grafo[nodo].items() if indice[vecino] >= i]
+                 for i, nodo in enumerate(nodos)]
+        indptr = np.zeros(len(nodos) + 1, dtype=np.int64)
+        np.cumsum([len(fila) for fila in filas], out=indptr[1:])
+
+        m = int(indptr[-1])
+        indices = np.fromiter((j for fila in filas for j, _ in fila), dtype=tipo_indices, count=m)
+        pesos = np.fromiter((peso for fila in filas for _, peso in fila), dtype=np.float64, count=m)
+        if isinstance(dtype_pesos, str) and dtype_pesos == 'auto':
+            dtype_pesos = tipo_pesos_minimo(pesos)
+        if np.dtype(dtype_pesos) == np.float64:
+            return cls(nodos, indptr, indices, pesos)
+
+        convertidos = convertir_pesos(pesos, dtype_pesos, exacto)
+        return cls(nodos, indptr, indices, convertidos, _si_redondeados(pesos, convertidos))
+
+    @property
+    def n(self):
+        return len(self.nodos)
+
+    @property
+    def m(self):
+        """
+        Número de aristas no dirigidas (cada una contada una vez)
+        """
+        return len(self.indices)
+
+    def grados(self):
+        """
+        Grado de cada nodo (un lazo cuenta una vez, como en el diccionario)
+        """
+        return np.diff(self.indptr) + np.diff(self.indptr_inverso)
+
+    def vecinos(self, i):
+        """
+        Vecinos del nodo en la posición i en ambas direcciones
+
+        Retorna:
+        (posiciones de los vecinos, pesos)
+        """
+        inicio, fin = self.indptr[i], self.indptr[i + 1]
+        inicio_inverso, fin_inverso = self.indptr_inverso[i], self.indptr_inverso[i + 1]
+        aristas = self.aristas_inversas[inicio_inverso:fin_inverso]
+        # La fila de cada arista inversa es su nodo de origen
+        origenes = np.searchsorted(self.indptr, aristas, side='right') - 1
+        return (np.concatenate((origenes, self.indices[inicio:fin])),
+                np.concatenate((self.pesos[aristas], self.pesos[inicio:fin])))
+
+    def memoria(self):
+        """
+        Bytes ocupados por los arreglos (incluido el índice inverso)
+        """
+        return (self.indptr.nbytes + self.indices.nbytes + self.pesos.nbytes
+                + self.indptr_inverso.nbytes + self.aristas_inversas.nbytes)
+
+    def a_compacto(self):
+        """
+        GrafoCompacto dirigido con las dos direcciones de cada arista, para los
+        motores sobre arreglos (delta_stepping, reordenamiento, compresión);
+        los pesos originales, si los hay, se permutan igual que los pesos
+        """
+        n = self.n
+        origenes = np.repeat(np.arange(n, dtype=np.int64), np.diff(self.indptr))
+        inversas = origenes != self.indices
+        fuentes = np.concatenate((origenes, self.indices[inversas].astype(np.int64)))
+        destinos = np.concatenate((self.indices.astype(np.int64), origenes[inversas]))
+        pesos = np.concatenate((self.pesos, self.pesos[inversas]))
+
+        orden = np.argsort(fuentes, kind='stable')
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(fuentes, minlength=n), out=indptr[1:])
+
+        originales = self.pesos_originales
+        if originales is not None:
+            originales = np.concatenate((originales, originales[inversas]))[orden]
+        return GrafoCompacto(self.nodos, indptr, destinos[orden], pesos[orden], originales)
+
+    def a_dict(self):
+        """
+        Convierte de vuelta al diccionario con ambas direcciones
+        """
+        return {nodo: self[nodo] for nodo in self.nodos}
+
+    # Vista simétrica: Mapping {nodo: {vecino: peso}}
+
+    def __getitem__(self, nodo):
+        # Se llama una vez por nodo explorado: pocas operaciones NumPy por llamada
+        i = self.indice[nodo]
+        etiqueta = self.nodos.__getitem__
+        inicio, fin = self.indptr[i:i + 2].tolist()
+        inicio_inverso, fin_inverso = self.indptr_inverso[i:i + 2].tolist()
+
+        if fin_inverso > inicio_inverso:
+            aristas = self.aristas_inversas[inicio_inverso:fin_inverso]
+            origenes = np.searchsorted(self.indptr, aristas, side='right') - 1
+            vecinos = dict(zip(map(etiqueta, origenes.tolist()), self.pesos[aristas].tolist()))
+        else:
+            vecinos = {}
+        vecinos.update(zip(map(etiqueta, self.indices[inicio:fin].tolist()), self.pesos[inicio:fin].tolist()))
+        return vecinos
+
+    def __iter__(self):
+        return iter(self.nodos)
+
+    def __len__(self):
+        return len(self.nodos)
+
+    def __contains__(self, nodo):
+        return nodo in self.indice
+
+def ejecutar_prueba_no_dirigido():
+    """
+    Compara memoria y resultados del grafo no dirigido contra el diccionario
+    y el GrafoCompacto dirigido en una red tipo carreteras
+    """
+    from bellman_ford_spfa import spfa
+    from compresion_adyacencia import memoria_dict
+    from delta_stepping import delta_stepping
+    from dijkstra_original import dijkstra_original
+    from generadores_grafos import grafo_carreteras
+
+    grafo_ejemplo = {
+        'A': {'B': 4, 'C': 2},
+        'B': {'A': 4, 'C': 1, 'D': 5},
+        'C': {'A': 2, 'B': 1, 'D': 8, 'E': 10},
+        'D': {'B': 5, 'C': 8, 'E': 2, 'F': 6},
+        'E': {'C': 10, 'D': 2, 'F': 3},
+        'F': {'D': 6, 'E': 3}
+    }
+    no_dirigido = GrafoNoDirigido.desde_dict(grafo_ejemplo)
+    print(f"Grafo de ejemplo: {no_dirigido.m} aristas guardadas (el diccionario guarda "
+          f"{sum(len(v) for v in grafo_ejemplo.values())})")
+    print(f"Mismas distancias desde A: {dijkstra_original(no_dirigido, 'A')[0] == dijkstra_original(grafo_ejemplo, 'A')[0]}")
+
+    try:
+        GrafoNoDirigido.desde_dict({'A': {'B': 4}, 'B': {'A': 5}})
+    except GrafoAsimetricoError as error:
+        print(f"Validación: {error}")
+
+    grafo = grafo_carreteras(300, semilla=0)
+    origen = next(iter(grafo))
+
+    inicio = time.time()
+    no_dirigido = GrafoNoDirigido.desde_dict(grafo, dtype_pesos='auto')
+    tiempo_importar = time.time() - inicio
+    compacto = GrafoCompacto.desde_dict(grafo, dtype_pesos='auto')
+
+    print(f"\nCARRETERAS 300x300: n={no_dirigido.n}, aristas no dirigidas={no_dirigido.m}")
+    print(f"Importación con validación: {tiempo_importar:.3f} segundos")
+    print(f"Memoria diccionario:        {memoria_dict(grafo) / 2**20:8.2f} MiB")
+    print(f"Memoria GrafoCompacto:      {compacto.memoria() / 2**20:8.2f} MiB")
+    print(f"Memoria GrafoNoDirigido:    {no_dirigido.memoria() / 2**20:8.2f} MiB")
+
+    referencia, _ = dijkstra_original(grafo, origen)
+    for nombre, motor in [("dijkstra_original", lambda: dijkstra_original(no_dirigido, origen)),
+                          ("spfa", lambda: spfa(no_dirigido, origen)),
+                          ("delta_stepping", lambda: delta_stepping(no_dirigido, origen))]:
+        inicio = time.time()
+        distancias, _ = motor()
+        print(f"{nombre:<18} {time.time() - inicio:.3f} segundos, iguales: {distancias == referencia}")
+
+if __name__ == "__main__":
+    ejecutar_prueba_no_dirigido()
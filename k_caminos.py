@@ -0,0 +1,195 @@
+"""
+K CAMINOS MÁS CORTOS SIN CICLOS (ALGORITMO DE YEN)
+Optimizaciones sobre el Yen básico:
+- árbol inverso de caminos más cortos hacia el destino (un Dijkstra sobre el
+  grafo invertido), usado como heurística exacta de A* en cada búsqueda de
+  desvío y como atajo cuando el camino del árbol no toca aristas ni nodos vetados
+- desvíos sólo a partir del punto en que cada camino se separó de su padre (Lawler)
+- heap perezoso de candidatos con descarte de duplicados y terminación al
+  completar k caminos
+"""
+
+import heapq
+import time
+
+from dijkstra_original import dijkstra_original
+from perfilado import perfilar
+
+def grafo_invertido(grafo):
+    """
+    Invierte todas las aristas: {v: {u: peso}} por cada arista u -> v
+    """
+    invertido = {nodo: {} for nodo in grafo}
+    for nodo, vecinos in grafo.items():
+        for vecino, peso in vecinos.items():
+            invertido[vecino][nodo] = peso
+    return invertido
+
+def _camino_del_arbol(siguiente, nodo, destino, vetados, aristas_vetadas):
+    """
+    Sigue el árbol inverso desde nodo hasta destino; retorna None si el
+    camino pasa por un nodo o arista vetados
+    """
+    camino = [nodo]
+    while nodo != destino:
+        proximo = siguiente[nodo]
+        if proximo in vetados or (nodo, proximo) in aristas_vetadas:
+            return None
+        camino.append(proximo)
+        nodo = proximo
+    return camino
+
+def _a_estrella(grafo, inicio, destino, h, vetados, aristas_vetadas):
+    """
+    A* de inicio a destino evitando nodos y aristas vetados
+
+    h es la distancia exacta al destino en el grafo completo; al vetar
+    aristas las distancias sólo crecen, por lo que h sigue siendo consistente.
+
+    Retorna:
+    (costo, camino) o None si destino es inalcanzable
+    """
+    costo = {inicio: 0}
+    predecesor = {inicio: None}
+    heap = [(h[inicio], inicio)]
+    cerrados = set()
+
+    while heap:
+        _, nodo_actual = heapq.heappop(heap)
+        if nodo_actual in cerrados:
+            continue
+        if nodo_actual == destino:
+            camino = []
+            while nodo_actual is not None:
+                camino.append(nodo_actual)
+                nodo_actual = predecesor[nodo_actual]
+            camino.reverse()
+            return costo[destino], camino
+        cerrados.add(nodo_actual)
+
+        for vecino, peso in grafo[nodo_actual].items():
+            if vecino in vetados or vecino in cerrados or (nodo_actual, vecino) in aristas_vetadas:
+                continue
+            if h[vecino] == float('inf'):
+                continue
+            nuevo_costo = costo[nodo_actual] + peso
+            if nuevo_costo < costo.get(vecino, float('inf')):
+                costo[vecino] = nuevo_costo
+                predecesor[vecino] = nodo_actual
+                heapq.heappush(heap, (nuevo_costo + h[vecino], vecino))
+
+    return None
+
+@perfilar
+def k_caminos_mas_cortos(grafo, origen, destino, k, invertido=None):
+    """
+    Los k caminos sin ciclos más cortos de origen a destino (Yen)
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}, pesos no negativos
+    origen: nodo de inicio
+    destino: nodo final
+    k: número de caminos
+    invertido: grafo_invertido(grafo) precalculado, para consultas repetidas
+
+    Retorna:
+    Lista de hasta k tuplas (costo, camino) en orden de costo creciente
+    """
+    if invertido is None:
+        invertido = grafo_invertido(grafo)
+
+    # Árbol inverso: h(v) = distancia de v al destino, siguiente[v] = próximo salto
+    h, siguiente = dijkstra_original(invertido, destino)
+    if h[origen] == float('inf'):
+        return []
+
+    primero = _camino_del_arbol(siguiente, origen, destino, set(), set())
+    encontrados = [(h[origen], primero)]
+    desvio = [0]  # Índice desde el que cada camino se separó de su padre
+
+    candidatos = []  # heap de (costo, camino, índice de desvío)
+    vistos = {tuple(primero)}
+
+    while len(encontrados) < k:
+        _, anterior = encontrados[-1]
+        costo_raiz = 0
+
+        for i in range(len(anterior) - 1):
+            nodo_desvio = anterior[i]
+            raiz = anterior[:i + 1]
+
+            if i >= desvio[-1]:
+                # Vetar la siguiente arista de cada camino con la misma raíz
+                aristas_vetadas = set()
+                for _, camino in encontrados:
+                    if len(camino) > i + 1 and camino[:i + 1] == raiz:
+                        aristas_vetadas.add((camino[i], camino[i + 1]))
+                vetados = set(raiz[:-1])
+
+                # Atajo: el camino del árbol ya es óptimo si no toca nada vetado
+                camino_desvio = _camino_del_arbol(siguiente, nodo_desvio, destino, vetados, aristas_vetadas)
+                if camino_desvio is not None:
+                    desvio_encontrado = (h[nodo_desvio], camino_desvio)
+                else:
+                    desvio_encontrado = _a_estrella(grafo, nodo_desvio, destino, h, vetados, aristas_vetadas)
+
+                if desvio_encontrado is not None:
+                    costo_desvio, camino_desvio = desvio_encontrado
+                    camino_total = raiz[:-1] + camino_desvio
+                    clave = tuple(camino_total)
+                    if clave not in vistos:
+                        vistos.add(clave)
+                        heapq.heappush(candidatos, (costo_raiz + costo_desvio, camino_total, i))
+
+            costo_raiz += grafo[nodo_desvio][anterior[i + 1]]
+
+        if not candidatos:
+            break
+
+        costo, camino, indice_desvio = heapq.heappop(candidatos)
+        encontrados.append((costo, camino))
+        desvio.append(indice_desvio)
+
+    return encontrados
+
+def ejecutar_prueba_k_caminos():
+    """
+    Muestra los 10 caminos más cortos en el grafo de ejemplo y mide el
+    costo relativo a una sola consulta en un grafo mayor
+    """
+    import random
+
+    grafo_ejemplo = {
+        'A': {'B': 4, 'C': 2},
+        'B': {'A': 4, 'C': 1, 'D': 5},
+        'C': {'A': 2, 'B': 1, 'D': 8, 'E': 10},
+        'D': {'B': 5, 'C': 8, 'E': 2, 'F': 6},
+        'E': {'C': 10, 'D': 2, 'F': 3},
+        'F': {'D': 6, 'E': 3}
+    }
+
+    print("K CAMINOS MÁS CORTOS DE A a F")
+    for costo, camino in k_caminos_mas_cortos(grafo_ejemplo, 'A', 'F', 10):
+        print(f"  {costo}: {camino}")
+
+    n = 5000
+    grafo = {i: {} for i in range(n)}
+    for i in range(n):
+        for j in random.sample(range(n), 5):
+            if i != j:
+                grafo[i][j] = random.randint(1, 100)
+
+    inicio = time.time()
+    dijkstra_original(grafo, 0)
+    tiempo_una = time.time() - inicio
+
+    inicio = time.time()
+    caminos = k_caminos_mas_cortos(grafo, 0, n - 1, 10)
+    tiempo_k = time.time() - inicio
+
+    print(f"\nGrafo aleatorio n={n}: una consulta {tiempo_una:.4f}s, "
+          f"k=10 caminos {tiempo_k:.4f}s ({tiempo_k / tiempo_una:.1f}x)")
+    print(f"Costos: {[costo for costo, _ in caminos]}")
+
+if __name__ == "__main__":
+    ejecutar_prueba_k_caminos()
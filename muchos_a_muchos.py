@@ -0,0 +1,197 @@
+"""
+MATRICES DE DISTANCIAS ENTRE CONJUNTOS (MUCHOS A MUCHOS)
+Distancias S x T sin resolver SSSP completo por origen:
+- una búsqueda por origen (dijkstra_generador) que se detiene en cuanto todos
+  los destinos de T están procesados
+- si T es más chico que S, las búsquedas se hacen desde T sobre el grafo
+  inverso (o sobre el mismo grafo si es no dirigido)
+- las búsquedas quedan pausadas: una consulta posterior desde el mismo origen
+  reanuda la búsqueda donde quedó en lugar de empezar de nuevo
+No hay jerarquía de nodos (contraction hierarchies) en este repositorio, así
+que no se implementa la variante por cubetas sobre la jerarquía.
+"""
+
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from dijkstra_original import dijkstra_generador
+from grafo_no_dirigido import GrafoNoDirigido
+from k_caminos import grafo_invertido
+from perfilado import perfilar
+
+class TablaDistancias:
+    """
+    Consultas de distancias muchos a muchos sobre un grafo, reutilizando las
+    búsquedas entre consultas
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}} (pesos no
+           negativos) o GrafoNoDirigido
+    max_busquedas: número máximo de búsquedas pausadas que se conservan (se
+                   descartan las usadas hace más tiempo); None = sin límite
+
+    Lanza:
+    ValueError si max_busquedas es menor que 1
+    """
+
+    def __init__(self, grafo, max_busquedas=None):
+        if max_busquedas is not None and max_busquedas < 1:
+            raise ValueError(f"max_busquedas debe ser al menos 1 (se recibió {max_busquedas})")
+        self.grafo = grafo
+        self.max_busquedas = max_busquedas
+        self.simetrico = isinstance(grafo, GrafoNoDirigido)
+        self._inverso = None
+        # (sentido, origen) -> [generador o None si terminó, {nodo: distancia final}]
+        self._busquedas = OrderedDict()
+        self.nodos_procesados = 0
+
+    def _grafo_en(self, sentido):
+        if sentido == 'adelante' or self.simetrico:
+            return self.grafo
+        if self._inverso is None:
+            self._inverso = grafo_invertido(self.grafo)
+        return self._inverso
+
+    def _busqueda(self, sentido, origen):
+        """
+        Estado de la búsqueda desde origen, creándola si no existe
+        """
+        clave = (sentido, origen)
+        estado = self._busquedas.get(clave)
+        if estado is None:
+            # Liberar lugar antes de insertar: nunca se descarta la búsqueda que se retorna
+            if self.max_busquedas is not None:
+                while len(self._busquedas) >= self.max_busquedas:
+                    _, (generador, _) = self._busquedas.popitem(last=False)
+                    if generador is not None:
+                        generador.close()
+            estado = [dijkstra_generador(self._grafo_en(sentido), origen), {}]
+            self._busquedas[clave] = estado
+        else:
+            self._busquedas.move_to_end(clave)
+        return estado
+
+    def _fila(self, sentido, origen, objetivos):
+        """
+        Distancias desde origen a cada nodo de objetivos, avanzando la búsqueda
+        sólo hasta procesarlos a todos
+        """
+        estado = self._busqueda(sentido, origen)
+        procesados = estado[1]
+        pendientes = {nodo for nodo in objetivos if nodo not in procesados}
+
+        generador = estado[0]
+        if pendientes and generador is not None:
+            for nodo, distancia, _ in generador:
+                procesados[nodo] = distancia
+                self.nodos_procesados += 1
+                pendientes.discard(nodo)
+                if not pendientes:
+                    break
+            else:
+                # Búsqueda agotada: el resto de los objetivos es inalcanzable
+                estado[0] = None
+
+        inf = float('inf')
+        return [procesados.get(nodo, inf) for nodo in objetivos]
+
+    def distancia(self, origen, destino):
+        """
+        Distancia mínima de origen a destino (inf si es inalcanzable)
+        """
+        return self._fila('adelante', origen, [destino])[0]
+
+    @perfilar(nombre='muchos_a_muchos')
+    def matriz(self, origenes, destinos, dtype=np.float64, sentido='auto'):
+        """
+        Matriz de distancias entre dos conjuntos de nodos
+
+        Parámetros:
+        origenes: lista de nodos S (filas)
+        destinos: lista de nodos T (columnas)
+        dtype: tipo de la matriz (np.float32 reduce la memoria a la mitad)
+        sentido: 'adelante' (una búsqueda por origen), 'atras' (una por destino,
+                 sobre el grafo inverso) o 'auto' (desde el conjunto más chico)
+
+        Retorna:
+        Arreglo |S| x |T| con matriz[i, j] = distancia de origenes[i] a
+        destinos[j] (inf = inalcanzable)
+        """
+        # Los nodos repetidos se resuelven una vez
+        filas = list(dict.fromkeys(origenes))
+        columnas = list(dict.fromkeys(destinos))
+
+        if sentido == 'auto':
+            sentido = 'atras' if len(columnas) < len(filas) else 'adelante'
+        if sentido == 'adelante':
+            unica = np.array([self._fila(sentido, s, columnas) for s in filas], dtype=dtype)
+        elif sentido == 'atras':
+            unica = np.array([self._fila(sentido, t, filas) for t in columnas], dtype=dtype).T
+        else:
+            raise ValueError(f"Sentido desconocido: {sentido} (opciones: 'adelante', 'atras', 'auto')")
+        unica = unica.reshape(len(filas), len(columnas))
+
+        if len(filas) == len(origenes) and len(columnas) == len(destinos):
+            return np.ascontiguousarray(unica)
+        posicion_fila = {nodo: i for i, nodo in enumerate(filas)}
+        posicion_columna = {nodo: j for j, nodo in enumerate(columnas)}
+        return unica[np.ix_([posicion_fila[s] for s in origenes], [posicion_columna[t] for t in destinos])]
+
+def matriz_distancias(grafo, origenes, destinos, dtype=np.float64, sentido='auto'):
+    """
+    Matriz |S| x |T| de distancias mínimas con una búsqueda con parada
+    temprana por nodo del conjunto más chico (ver TablaDistancias.matriz)
+    """
+    return TablaDistancias(grafo).matriz(origenes, destinos, dtype, sentido)
+
+def ejecutar_prueba_muchos_a_muchos():
+    """
+    Compara la matriz S x T con |S| llamadas completas a dijkstra_original
+    en una red tipo carreteras
+    """
+    import random
+    from busqueda_acotada import dijkstra_radio
+    from dijkstra_original import dijkstra_original
+    from generadores_grafos import grafo_carreteras
+
+    grafo = grafo_carreteras(200, semilla=0)
+    nodos = list(grafo)
+    generador = random.Random(0)
+    # Consultas locales (p. ej. depósitos y clientes de una misma zona)
+    zona, _ = dijkstra_radio(grafo, nodos[len(nodos) // 2], 2000)
+    zona = sorted(zona, key=str)
+    origenes = generador.sample(zona, 20)
+    destinos = generador.sample(zona, 10)
+
+    inicio = time.time()
+    referencia = []
+    for s in origenes:
+        distancias, _ = dijkstra_original(grafo, s)
+        referencia.append([distancias[t] for t in destinos])
+    referencia = np.array(referencia)
+    tiempo_completo = time.time() - inicio
+
+    print(f"CARRETERAS 200x200: n={len(nodos)}, |S|={len(origenes)}, |T|={len(destinos)}")
+    print(f"|S| x dijkstra_original:    {tiempo_completo:.4f} segundos")
+
+    for sentido in ('adelante', 'atras'):
+        tabla = TablaDistancias(grafo)
+        inicio = time.time()
+        matriz = tabla.matriz(origenes, destinos, sentido=sentido)
+        print(f"matriz (sentido={sentido:<8}): {time.time() - inicio:.4f} segundos, "
+              f"{tabla.nodos_procesados} nodos procesados, iguales: {np.array_equal(matriz, referencia)}")
+
+    # Nuevos destinos: las búsquedas pausadas se reanudan donde quedaron
+    otros = generador.sample(zona, 10)
+    tabla = TablaDistancias(grafo)
+    tabla.matriz(origenes, destinos, sentido='adelante')
+    procesados = tabla.nodos_procesados
+    inicio = time.time()
+    tabla.matriz(origenes, otros, sentido='adelante')
+    print(f"Segunda consulta reanudando:  {time.time() - inicio:.4f} segundos, "
+          f"{tabla.nodos_procesados - procesados} nodos procesados más")
+
+if __name__ == "__main__":
+    ejecutar_prueba_muchos_a_muchos()
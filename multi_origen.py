@@ -0,0 +1,130 @@
+"""
+DIJKSTRA MULTI-ORIGEN (SUPER-ORIGEN) Y CONSULTAS DE INSTALACIÓN MÁS CERCANA
+Equivale a un Dijkstra desde un super-origen virtual unido a cada origen con
+peso igual a su desplazamiento: en una sola pasada O(m log n) se obtiene, para
+cada nodo, la distancia a la instalación más cercana y cuál es (partición de
+Voronoi del grafo)
+"""
+
+import heapq
+import time
+
+from perfilado import perfilar
+
+@perfilar
+def dijkstra_multi_origen(grafo, origenes, desplazamientos=None):
+    """
+    Dijkstra sembrando el heap con todos los orígenes a la vez
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+    origenes: iterable de nodos de inicio (instalaciones)
+    desplazamientos: diccionario opcional {origen: distancia inicial}, por
+                     ejemplo un costo fijo por instalación (por defecto 0)
+
+    Retorna:
+    distancias: diccionario con la distancia al origen más cercano
+    propietarios: diccionario con el origen más cercano (None si inalcanzable)
+    predecesores: diccionario para reconstruir los caminos
+    """
+    if desplazamientos is None:
+        desplazamientos = {}
+
+    # Inicializar estructuras
+    distancias = {nodo: float('inf') for nodo in grafo}
+    propietarios = {nodo: None for nodo in grafo}
+    predecesores = {nodo: None for nodo in grafo}
+
+    heap = []
+    for origen in origenes:
+        distancia_inicial = desplazamientos.get(origen, 0)
+        if distancia_inicial < distancias[origen]:
+            distancias[origen] = distancia_inicial
+            propietarios[origen] = origen
+            heap.append((distancia_inicial, origen))
+    heapq.heapify(heap)
+
+    procesados = set()
+
+    while heap:
+        distancia_actual, nodo_actual = heapq.heappop(heap)
+
+        if nodo_actual in procesados:
+            continue
+
+        procesados.add(nodo_actual)
+        propietario = propietarios[nodo_actual]
+
+        for vecino, peso in grafo[nodo_actual].items():
+            if vecino in procesados:
+                continue
+
+            nueva_distancia = distancia_actual + peso
+
+            if nueva_distancia < distancias[vecino]:
+                distancias[vecino] = nueva_distancia
+                propietarios[vecino] = propietario
+                predecesores[vecino] = nodo_actual
+                heapq.heappush(heap, (nueva_distancia, vecino))
+
+    return distancias, propietarios, predecesores
+
+def particion_voronoi(grafo, origenes, desplazamientos=None):
+    """
+    Agrupa los nodos por su instalación más cercana
+
+    Retorna:
+    Diccionario {origen: [nodos asignados]}; los nodos inalcanzables no aparecen
+    """
+    # Se recorre dos veces: un generador se agotaría en la primera
+    origenes = list(origenes)
+    _, propietarios, _ = dijkstra_multi_origen(grafo, origenes, desplazamientos)
+
+    regiones = {origen: [] for origen in origenes}
+    for nodo, propietario in propietarios.items():
+        if propietario is not None:
+            regiones[propietario].append(nodo)
+
+    return regiones
+
+def ejecutar_prueba_multi_origen():
+    """
+    Compara una pasada multi-origen con un Dijkstra por instalación
+    """
+    import random
+    from dijkstra_original import dijkstra_original
+
+    n = 5000
+    grafo = {i: {} for i in range(n)}
+    for i in range(n):
+        for j in random.sample(range(n), 5):
+            if i != j:
+                grafo[i][j] = random.randint(1, 100)
+
+    instalaciones = random.sample(range(n), 50)
+
+    inicio = time.time()
+    minimo = {nodo: float('inf') for nodo in grafo}
+    for instalacion in instalaciones:
+        distancias, _ = dijkstra_original(grafo, instalacion)
+        for nodo, distancia in distancias.items():
+            minimo[nodo] = min(minimo[nodo], distancia)
+    tiempo_ingenuo = time.time() - inicio
+
+    inicio = time.time()
+    distancias, propietarios, _ = dijkstra_multi_origen(grafo, instalaciones)
+    tiempo_multi = time.time() - inicio
+
+    print(f"GRAFO ALEATORIO n={n}, {len(instalaciones)} instalaciones")
+    print(f"Un Dijkstra por instalación: {tiempo_ingenuo:.4f} segundos")
+    print(f"Dijkstra multi-origen:       {tiempo_multi:.4f} segundos")
+    print(f"Resultados iguales: {distancias == minimo}")
+
+    regiones = particion_voronoi(grafo, instalaciones)
+    tamanos = sorted(len(nodos) for nodos in regiones.values())
+    print(f"Tamaño de regiones: mín={tamanos[0]}, máx={tamanos[-1]}")
+
+    return tiempo_multi, distancias
+
+if __name__ == "__main__":
+    tiempo_multi, distancias_multi = ejecutar_prueba_multi_origen()
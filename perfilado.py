@@ -0,0 +1,250 @@
+"""
+PERFILADO POR FASES DE LOS MOTORES
+Superficie opcional para saber en qué se va el tiempo de un motor:
+- Perfilador: context manager que, mientras está activo, acumula tiempo de
+  pared y número de llamadas por fase (y opcionalmente corre cProfile)
+- fase(nombre): bloque medido dentro de un motor
+- perfilar: decorador que mide una función completa como una fase
+Sin un Perfilador activo, fase() y perfilar sólo cuestan una consulta a una
+variable de contexto.
+"""
+
+import cProfile
+import functools
+import io
+import pstats
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+
+# Perfilador activo en el contexto actual (hilo / tarea asyncio)
+_activo = ContextVar('perfilador_activo', default=None)
+
+_NULO = nullcontext()
+
+class _Fase:
+    """
+    Bloque medido: acumula su tiempo en el perfilador bajo la ruta
+    padre/nombre de las fases anidadas
+    """
+
+    __slots__ = ('perfilador', 'nombre', 'ruta', 'inicio')
+
+    def __init__(self, perfilador, nombre):
+        self.perfilador = perfilador
+        self.nombre = nombre
+
+    def __enter__(self):
+        perfilador = self.perfilador
+        padre = perfilador._ruta[-1] if perfilador._ruta else None
+        self.ruta = f"{padre}/{self.nombre}" if padre else self.nombre
+        perfilador._ruta.append(self.ruta)
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        duracion = time.perf_counter() - self.inicio
+        perfilador = self.perfilador
+        perfilador._ruta.pop()
+        registro = perfilador.fases.get(self.ruta)
+        if registro is None:
+            perfilador.fases[self.ruta] = [duracion, 1]
+        else:
+            registro[0] += duracion
+            registro[1] += 1
+        return False
+
+def fase(nombre):
+    """
+    Context manager que mide un bloque como la fase nombre del perfilador
+    activo; si no hay ninguno, no hace nada
+
+    Ejemplo:
+        with fase('ordenar_nivel'):
+            cola.sort()
+    """
+    perfilador = _activo.get()
+    if perfilador is None:
+        return _NULO
+    return _Fase(perfilador, nombre)
+
+def perfilar(funcion=None, nombre=None):
+    """
+    Decorador: mide cada llamada a la función como una fase (por defecto con
+    el nombre de la función). Se usa como @perfilar o @perfilar(nombre='...')
+    """
+    if funcion is None:
+        return lambda f: perfilar(f, nombre)
+
+    etiqueta = nombre or funcion.__name__
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        perfilador = _activo.get()
+        if perfilador is None:
+            return funcion(*args, **kwargs)
+        with _Fase(perfilador, etiqueta):
+            return funcion(*args, **kwargs)
+
+    return envoltura
+
+class Perfilador:
+    """
+    Recolector de tiempos por fase
+
+    Uso:
+        with Perfilador(cprofile=True) as perfilador:
+            AlgoritmoNuevoSSSP().resolver(grafo, 0)
+        perfilador.imprimir()
+        print(perfilador.estadisticas_cprofile(15))
+
+    Parámetros:
+    cprofile: si es True, también corre cProfile durante el bloque, para
+              bajar al nivel de funciones individuales
+    """
+
+    def __init__(self, cprofile=False):
+        self.fases = {}  # ruta de la fase -> [tiempo total, llamadas]
+        self.total = 0.0
+        self._ruta = []
+        self._perfil = cProfile.Profile() if cprofile else None
+        self._token = None
+
+    def __enter__(self):
+        self._token = _activo.set(self)
+        self._inicio = time.perf_counter()
+        if self._perfil is not None:
+            self._perfil.enable()
+        return self
+
+    def __exit__(self, *_):
+        if self._perfil is not None:
+            self._perfil.disable()
+        self.total += time.perf_counter() - self._inicio
+        _activo.reset(self._token)
+        return False
+
+    def desglose(self):
+        """
+        Tiempos por fase
+
+        Retorna:
+        Diccionario {ruta: {'tiempo', 'exclusivo', 'llamadas', 'fraccion'}},
+        donde exclusivo descuenta el tiempo de las subfases directas y fraccion
+        es la parte del tiempo total del bloque perfilado
+        """
+        exclusivo = {ruta: tiempo for ruta, (tiempo, _) in self.fases.items()}
+        for ruta, (tiempo, _) in self.fases.items():
+            padre = ruta.rpartition('/')[0]
+            if padre in exclusivo:
+                exclusivo[padre] -= tiempo
+
+        return {
+            ruta: {
+                'tiempo': tiempo,
+                'exclusivo': exclusivo[ruta],
+                'llamadas': llamadas,
+                'fraccion': tiempo / self.total if self.total > 0 else 0.0,
+            }
+            for ruta, (tiempo, llamadas) in self.fases.items()
+        }
+
+    def imprimir(self):
+        """
+        Imprime la tabla de fases ordenada por ruta (las subfases bajo su fase)
+        """
+        print(f"{'Fase':<45} {'Tiempo (s)':>12} {'Llamadas':>10} {'%':>7}")
+        for ruta, datos in sorted(self.desglose().items()):
+            sangria = '  ' * ruta.count('/')
+            nombre = sangria + ruta.rsplit('/', 1)[-1]
+            print(f"{nombre:<45} {datos['tiempo']:>12.6f} {datos['llamadas']:>10} "
+                  f"{datos['fraccion']:>7.1%}")
+        print(f"{'TOTAL':<45} {self.total:>12.6f}")
+
+    def estadisticas_cprofile(self, limite=20, orden='cumulative'):
+        """
+        Las funciones más costosas según cProfile, como texto
+        """
+        if self._perfil is None:
+            raise ValueError("El perfilador se creó sin cprofile=True")
+        salida = io.StringIO()
+        pstats.Stats(self._perfil, stream=salida).sort_stats(orden).print_stats(limite)
+        return salida.getvalue()
+
+    def guardar_cprofile(self, ruta):
+        """
+        Guarda el perfil de cProfile (.prof) para abrirlo con pstats, snakeviz
+        o gprof2dot
+        """
+        if self._perfil is None:
+            raise ValueError("El perfilador se creó sin cprofile=True")
+        self._perfil.dump_stats(ruta)
+
+def perfilar_llamada(funcion, *args, cprofile=False, **kwargs):
+    """
+    Ejecuta funcion(*args, **kwargs) bajo un Perfilador nuevo
+
+    Retorna:
+    (resultado, perfilador)
+    """
+    with Perfilador(cprofile=cprofile) as perfilador:
+        resultado = funcion(*args, **kwargs)
+    return resultado, perfilador
+
+def graficar_desglose(desgloses, titulo="Desglose del tiempo por fase", ruta=None):
+    """
+    Gráfico de barras apiladas con el tiempo exclusivo de cada fase por motor
+
+    Parámetros:
+    desgloses: diccionario etiqueta -> Perfilador.desglose()
+    ruta: si se indica, se guarda la figura en lugar de mostrarla
+    """
+    import matplotlib.pyplot as plt
+
+    etiquetas = list(desgloses)
+    # Tiempo exclusivo: las subfases no se cuentan dos veces al apilar
+    fases = sorted({ruta for desglose in desgloses.values() for ruta in desglose})
+
+    plt.figure(figsize=(10, 6))
+    base = [0.0] * len(etiquetas)
+    for nombre_fase in fases:
+        tiempos = [desgloses[etiqueta].get(nombre_fase, {}).get('exclusivo', 0.0) for etiqueta in etiquetas]
+        plt.bar(etiquetas, tiempos, bottom=base, label=nombre_fase, alpha=0.8)
+        base = [b + t for b, t in zip(base, tiempos)]
+
+    plt.ylabel('Tiempo (segundos)')
+    plt.title(titulo)
+    plt.xticks(rotation=30, ha='right')
+    plt.legend(fontsize=8)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+
+    if ruta:
+        plt.savefig(ruta, dpi=120)
+        plt.close()
+    else:
+        plt.show()
+
+def ejecutar_prueba_perfilado():
+    """
+    Desglosa el tiempo de AlgoritmoNuevoSSSP y dijkstra_original en un grafo aleatorio
+    """
+    from algoritmo_nuevo import AlgoritmoNuevoSSSP
+    from dijkstra_original import dijkstra_original
+    from generadores_grafos import grafo_vecinos_aleatorios
+
+    grafo = grafo_vecinos_aleatorios(3000, 3, 8, semilla=0)
+
+    _, perfilador = perfilar_llamada(AlgoritmoNuevoSSSP().resolver, grafo, 0, cprofile=True)
+    print("ALGORITMO NUEVO")
+    perfilador.imprimir()
+    print(perfilador.estadisticas_cprofile(8))
+
+    _, perfilador = perfilar_llamada(dijkstra_original, grafo, 0)
+    print("DIJKSTRA ORIGINAL")
+    perfilador.imprimir()
+
+if __name__ == "__main__":
+    # Los motores importan el módulo perfilado, no __main__: usar esa misma copia
+    import perfilado
+    perfilado.ejecutar_prueba_perfilado()
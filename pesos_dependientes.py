@@ -0,0 +1,321 @@
+"""
+PESOS DEPENDIENTES DEL TIEMPO Y MULTICRITERIO
+Extensiones del formato {nodo: {vecino: peso}}:
+- Dependiente del tiempo: el peso puede ser una función lineal por tramos
+  [(instante, duración), ...] (constante antes del primer punto y después
+  del último). Las funciones deben ser FIFO (salir más tarde nunca hace llegar
+  antes), condición bajo la cual Dijkstra sobre instantes de llegada es exacto.
+  GrafoDependiente guarda todos los puntos en dos arreglos planos con un
+  desplazamiento por arista, en lugar de una lista de tuplas por arista.
+- Bicriterio: el peso es un par (costo, tiempo); frente_pareto calcula por
+  etiquetas (Martins) el frente de Pareto de cada nodo, descartando las
+  etiquetas dominadas.
+"""
+
+import heapq
+import time
+from array import array
+from bisect import bisect_right
+
+import numpy as np
+
+from perfilado import perfilar
+
+class GrafoDependiente:
+    """
+    Grafo dirigido con duraciones dependientes del instante de salida
+
+    Las aristas están en formato CSR (indptr, indices, por posición). Los
+    puntos de la función de la arista e son (tiempos[k], duraciones[k]) para k
+    en [inicio_tramos[e], inicio_tramos[e + 1]), con tiempos crecientes. Los
+    arreglos son array('d') / array('q'): 8 bytes por valor y acceso escalar
+    rápido desde Python.
+    """
+
+    def __init__(self, nodos, indptr, indices, inicio_tramos, tiempos, duraciones):
+        self.nodos = nodos
+        self.indice = {nodo: i for i, nodo in enumerate(nodos)}
+        self.indptr = indptr
+        self.indices = indices
+        self.inicio_tramos = inicio_tramos
+        self.tiempos = tiempos
+        self.duraciones = duraciones
+
+    @classmethod
+    def desde_dict(cls, grafo):
+        """
+        Construye el grafo desde {nodo: {vecino: peso}}
+
+        Parámetros:
+        grafo: cada peso es un número (duración constante) o una lista de
+               puntos (instante, duración) de la función lineal por tramos
+
+        Lanza:
+        ValueError si hay duraciones negativas, instantes no crecientes o
+        alguna función no es FIFO (pendiente menor que -1 en algún tramo)
+        """
+        nodos = list(grafo)
+        indice = {nodo: i for i, nodo in enumerate(nodos)}
+
+        indptr = [0]
+        indices = []
+        inicio_tramos = [0]
+        tiempos = []
+        duraciones = []
+        for nodo in nodos:
+            for vecino, peso in grafo[nodo].items():
+                indices.append(indice[vecino])
+                puntos = peso if isinstance(peso, (list, tuple)) else [(0.0, peso)]
+                if not puntos:
+                    raise ValueError(f"Arista {nodo} -> {vecino} sin puntos")
+                for instante, duracion in puntos:
+                    tiempos.append(instante)
+                    duraciones.append(duracion)
+                inicio_tramos.append(len(tiempos))
+            indptr.append(len(indices))
+
+        validar_fifo(np.array(tiempos, dtype=np.float64), np.array(duraciones, dtype=np.float64),
+                     np.array(inicio_tramos, dtype=np.int64))
+
+        return cls(nodos, array('q', indptr), array('q', indices), array('q', inicio_tramos),
+                   array('d', tiempos), array('d', duraciones))
+
+    @property
+    def n(self):
+        return len(self.nodos)
+
+    @property
+    def m(self):
+        return len(self.indices)
+
+    def duracion(self, arista, instante):
+        """
+        Duración de la arista (posición en indices) saliendo en instante
+        """
+        return _evaluar(self.tiempos, self.duraciones, self.inicio_tramos[arista],
+                        self.inicio_tramos[arista + 1], instante)
+
+    def memoria(self):
+        """
+        Bytes ocupados por los arreglos
+        """
+        return sum(a.itemsize * len(a) for a in (self.indptr, self.indices, self.inicio_tramos,
+                                                  self.tiempos, self.duraciones))
+
+def validar_fifo(tiempos, duraciones, inicio_tramos):
+    """
+    Comprueba con NumPy que cada función sea válida y FIFO: instantes
+    crecientes, duraciones no negativas y t1 + d1 <= t2 + d2 entre puntos
+    consecutivos de la misma arista
+
+    Lanza:
+    ValueError con el número de tramos que no cumplen
+    """
+    if len(duraciones) and duraciones.min() < 0:
+        raise ValueError(f"{int((duraciones < 0).sum())} duraciones negativas")
+
+    # Pares de puntos consecutivos que pertenecen a la misma arista
+    consecutivos = np.ones(max(len(tiempos) - 1, 0), dtype=bool)
+    finales = inicio_tramos[1:-1] - 1
+    consecutivos[finales[finales < len(consecutivos)]] = False
+
+    no_crecientes = (np.diff(tiempos) <= 0) & consecutivos
+    if no_crecientes.any():
+        raise ValueError(f"{int(no_crecientes.sum())} tramos con instantes no crecientes")
+
+    llegadas = tiempos + duraciones
+    no_fifo = (np.diff(llegadas) < 0) & consecutivos
+    if no_fifo.any():
+        raise ValueError(f"{int(no_fifo.sum())} tramos no son FIFO (salir más tarde haría llegar antes)")
+
+def _evaluar(tiempos, duraciones, inicio, fin, instante):
+    """
+    Valor de la función lineal por tramos con puntos [inicio, fin) en instante
+    """
+    k = bisect_right(tiempos, instante, inicio, fin) - 1
+    if k < inicio:
+        return duraciones[inicio]
+    if k >= fin - 1:
+        return duraciones[fin - 1]
+    t0 = tiempos[k]
+    d0 = duraciones[k]
+    return d0 + (duraciones[k + 1] - d0) * (instante - t0) / (tiempos[k + 1] - t0)
+
+@perfilar
+def dijkstra_dependiente(grafo, origen, salida=0):
+    """
+    Instantes de llegada más tempranos saliendo de origen en el instante salida
+
+    Misma estructura que dijkstra_original, con la duración de cada arista
+    evaluada en el instante de llegada a su nodo de origen (exacto con FIFO).
+
+    Parámetros:
+    grafo: GrafoDependiente, o diccionario que se convierte con desde_dict
+    origen: nodo de inicio
+    salida: instante de salida
+
+    Retorna:
+    llegadas: diccionario con el instante de llegada más temprano a cada nodo
+              (inf = inalcanzable)
+    predecesores: diccionario para reconstruir los caminos
+    """
+    if not isinstance(grafo, GrafoDependiente):
+        grafo = GrafoDependiente.desde_dict(grafo)
+
+    n = grafo.n
+    indptr = grafo.indptr
+    indices = grafo.indices
+    inicio_tramos = grafo.inicio_tramos
+    tiempos = grafo.tiempos
+    duraciones = grafo.duraciones
+
+    fuente = grafo.indice[origen]
+    llegada = [float('inf')] * n
+    pred = [-1] * n
+    procesado = [False] * n
+    llegada[fuente] = salida
+    heap = [(salida, fuente)]
+
+    while heap:
+        instante, u = heapq.heappop(heap)
+        if procesado[u]:
+            continue
+        procesado[u] = True
+
+        for arista in range(indptr[u], indptr[u + 1]):
+            v = indices[arista]
+            if procesado[v]:
+                continue
+            inicio = inicio_tramos[arista]
+            fin = inicio_tramos[arista + 1]
+            if fin - inicio == 1:
+                nueva = instante + duraciones[inicio]
+            else:
+                nueva = instante + _evaluar(tiempos, duraciones, inicio, fin, instante)
+            if nueva < llegada[v]:
+                llegada[v] = nueva
+                pred[v] = u
+                heapq.heappush(heap, (nueva, v))
+
+    nodos = grafo.nodos
+    llegadas = dict(zip(nodos, llegada))
+    predecesores = {nodo: (nodos[p] if p >= 0 else None) for nodo, p in zip(nodos, pred)}
+    return llegadas, predecesores
+
+@perfilar
+def frente_pareto(grafo, origen, destino=None):
+    """
+    Caminos no dominados por (costo, tiempo) desde origen (Martins)
+
+    Las etiquetas salen del heap en orden lexicográfico (costo, tiempo): una
+    etiqueta que llega a un nodo está dominada si y sólo si su tiempo no es
+    menor que el de la última etiqueta fijada en ese nodo, así que la poda es O(1).
+
+    Parámetros:
+    grafo: diccionario {nodo: {vecino: (costo, tiempo)}} con valores no negativos
+    origen: nodo de inicio
+    destino: si se indica, sólo interesa su frente; se descartan además las
+             etiquetas dominadas por las ya fijadas en destino
+
+    Retorna:
+    frentes: diccionario {nodo: [(costo, tiempo), ...]} ordenado por costo
+             creciente (y tiempo decreciente); los inalcanzables no aparecen
+    predecesores: diccionario {(nodo, costo, tiempo): (nodo, costo, tiempo)}
+                  para reconstruir cada camino con camino_pareto
+    """
+    frentes = {}
+    # Menor tiempo fijado en cada nodo: el de su última etiqueta
+    mejor_tiempo = {}
+    predecesores = {(origen, 0, 0): None}
+    heap = [(0, 0, origen)]
+
+    while heap:
+        costo, tiempo, nodo = heapq.heappop(heap)
+        if tiempo >= mejor_tiempo.get(nodo, float('inf')):
+            continue
+        mejor_tiempo[nodo] = tiempo
+        frentes.setdefault(nodo, []).append((costo, tiempo))
+        if nodo == destino:
+            continue
+
+        limite_destino = mejor_tiempo.get(destino, float('inf'))
+        for vecino, (costo_arista, tiempo_arista) in grafo[nodo].items():
+            nuevo_tiempo = tiempo + tiempo_arista
+            # Dominada por una etiqueta ya fijada en el vecino o en el destino
+            if nuevo_tiempo >= mejor_tiempo.get(vecino, float('inf')) or nuevo_tiempo >= limite_destino:
+                continue
+            nuevo_costo = costo + costo_arista
+            etiqueta = (vecino, nuevo_costo, nuevo_tiempo)
+            if etiqueta not in predecesores:
+                predecesores[etiqueta] = (nodo, costo, tiempo)
+                heapq.heappush(heap, (nuevo_costo, nuevo_tiempo, vecino))
+
+    return frentes, predecesores
+
+def camino_pareto(predecesores, nodo, costo, tiempo):
+    """
+    Camino de la etiqueta (costo, tiempo) de nodo, desde el origen
+    """
+    camino = []
+    etiqueta = (nodo, costo, tiempo)
+    while etiqueta is not None:
+        camino.append(etiqueta[0])
+        etiqueta = predecesores[etiqueta]
+    camino.reverse()
+    return camino
+
+def ejecutar_prueba_dependiente():
+    """
+    Hora punta en una rejilla: dijkstra_dependiente contra dijkstra_original
+    con duraciones constantes, y el frente costo / tiempo entre peaje y ruta libre
+    """
+    import random
+    from dijkstra_original import dijkstra_original, reconstruir_camino
+
+    generador = random.Random(0)
+    lado = 150
+    libre = {}
+    dependiente = {}
+    for i in range(lado * lado):
+        fila, columna = divmod(i, lado)
+        libre[i] = {}
+        dependiente[i] = {}
+        for j in ([i + 1] if columna + 1 < lado else []) + ([i + lado] if fila + 1 < lado else []):
+            base = generador.randint(1, 10)
+            libre[i][j] = base
+            # Hora punta entre 100 y 200: la duración se triplica (pendientes > -1: FIFO)
+            dependiente[i][j] = [(100, base), (130, 3 * base), (170, 3 * base), (200, base)]
+
+    inicio = time.time()
+    td = GrafoDependiente.desde_dict(dependiente)
+    tiempo_conversion = time.time() - inicio
+    print(f"REJILLA {lado}x{lado}: n={td.n}, m={td.m}, puntos={len(td.tiempos)}, "
+          f"{td.memoria() / 1e6:.2f} MB, conversión {tiempo_conversion:.3f} s")
+
+    inicio = time.time()
+    referencia, _ = dijkstra_original(libre, 0)
+    print(f"dijkstra_original:                 {time.time() - inicio:.4f} segundos")
+    for salida in (0, 120, 300):
+        inicio = time.time()
+        llegadas, predecesores = dijkstra_dependiente(td, 0, salida)
+        tiempo = time.time() - inicio
+        destino = lado * lado - 1
+        print(f"dijkstra_dependiente (salida={salida:>3}): {tiempo:.4f} segundos, llegada al extremo "
+              f"{llegadas[destino]:.1f} (sin tráfico {salida + referencia[destino]}), "
+              f"{len(reconstruir_camino(predecesores, destino))} nodos")
+
+    # Bicriterio: autopista con peaje rápida contra caminos libres lentos
+    grafo = {
+        'A': {'B': (0, 30), 'P': (12, 5)},
+        'B': {'C': (0, 30), 'D': (4, 10)},
+        'P': {'D': (10, 5)},
+        'C': {'D': (0, 20)},
+        'D': {},
+    }
+    frentes, predecesores = frente_pareto(grafo, 'A', destino='D')
+    print("\nFrente de Pareto A -> D (costo, tiempo):")
+    for costo, tiempo in frentes['D']:
+        print(f"  costo={costo:>3}, tiempo={tiempo:>3}: {camino_pareto(predecesores, 'D', costo, tiempo)}")
+
+if __name__ == "__main__":
+    ejecutar_prueba_dependiente()
\ No newline at end of file
@@ -0,0 +1,291 @@
+"""
+SEGUIMIENTO DE REGRESIONES DE RENDIMIENTO
+Mide los motores sobre una matriz fija de grafos (con semilla), guarda las
+muestras en JSON junto con la huella de la máquina, la versión de Python y el
+commit de git, y compara una ejecución contra una línea base con la prueba
+U de Mann-Whitney por celda (grafo, motor).
+
+Uso:
+    python regresiones.py medir --salida base.json
+    python regresiones.py comparar base.json actual.json --umbral 0.10
+El comando comparar termina con código 1 si alguna celda empeoró.
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from algoritmo_nuevo import AlgoritmoNuevoSSSP
+from cache_artefactos import CacheArtefactos, huella_maquina
+from dijkstra_original import dijkstra_original
+from perfilado import Perfilador, graficar_desglose
+
+# Matriz de grafos: (nombre, generador, parámetros)
+GRAFOS_REFERENCIA = [
+    ("aleatorio_100n", 'aleatorio', {'n': 100, 'densidad': 0.1}),
+    ("aleatorio_500n", 'aleatorio', {'n': 500, 'densidad': 0.02}),
+    ("vecinos_2000n", 'vecinos_aleatorios', {'n': 2000, 'min_vecinos': 3, 'max_vecinos': 8}),
+]
+
+def motores_referencia():
+    """
+    Motores que se siguen entre versiones: nombre -> función (grafo, origen)
+    """
+    return {
+        'dijkstra_original': dijkstra_original,
+        'algoritmo_nuevo': AlgoritmoNuevoSSSP().resolver,
+    }
+
+def commit_actual():
+    """
+    Hash del commit de git actual (con '+' si hay cambios sin confirmar), o None
+    """
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                                text=True, check=True, cwd=directorio).stdout.strip()
+        cambios = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                 capture_output=True, text=True, check=True,
+                                 cwd=directorio).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ('+' if cambios else '')
+
+def medir(motores=None, grafos=None, repeticiones=15, semilla=0, origen=0, cache=None,
+          fases=False):
+    """
+    Mide cada motor sobre cada grafo
+
+    Parámetros:
+    motores: diccionario nombre -> función (por defecto motores_referencia())
+    grafos: lista de (nombre, generador, parámetros) (por defecto GRAFOS_REFERENCIA)
+    repeticiones: muestras de tiempo por celda (tras una ejecución de calentamiento)
+    fases: si es True, cada celda incluye además el desglose por fase
+           (perfilado.Perfilador) de una ejecución adicional, fuera de las muestras
+
+    Retorna:
+    Diccionario con 'metadatos' y 'celdas' (lista de {grafo, motor, muestras})
+    """
+    if motores is None:
+        motores = motores_referencia()
+    if grafos is None:
+        grafos = GRAFOS_REFERENCIA
+    if cache is None:
+        cache = CacheArtefactos()
+
+    celdas = []
+    for nombre_grafo, generador, parametros in grafos:
+        grafo = cache.obtener_grafo(generador, semilla, **parametros)
+        for nombre_motor, motor in motores.items():
+            motor(grafo, origen)  # Calentamiento
+            muestras = []
+            # Sin el recolector de basura, como timeit: menos ruido entre muestras.
+            # Se restaura aunque el motor lance una excepción
+            gc.collect()
+            gc_activo = gc.isenabled()
+            gc.disable()
+            try:
+                for _ in range(repeticiones):
+                    inicio = time.perf_counter()
+                    motor(grafo, origen)
+                    muestras.append(time.perf_counter() - inicio)
+            finally:
+                if gc_activo:
+                    gc.enable()
+            celda = {'grafo': nombre_grafo, 'motor': nombre_motor, 'muestras': muestras}
+
+            if fases:
+                with Perfilador() as perfilador:
+                    motor(grafo, origen)
+                celda['fases'] = perfilador.desglose()
+
+            celdas.append(celda)
+            print(f"  {nombre_grafo:<16} {nombre_motor:<20} mediana {np.median(muestras):.6f}s")
+
+    return {
+        'metadatos': {
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'commit': commit_actual(),
+            'semilla': semilla,
+            'repeticiones': repeticiones,
+            **huella_maquina(),
+        },
+        'celdas': celdas,
+    }
+
+def guardar(resultados, ruta):
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump(resultados, archivo, indent=2)
+
+def cargar(ruta):
+    with open(ruta, encoding='utf-8') as archivo:
+        return json.load(archivo)
+
+def mann_whitney(base, actual):
+    """
+    Prueba U de Mann-Whitney unilateral (¿actual tarda más que base?) con
+    aproximación normal y corrección por empates
+
+    Retorna:
+    Valor p
+    """
+    n1, n2 = len(base), len(actual)
+    valores = np.concatenate([base, actual])
+    orden = valores.argsort(kind='mergesort')
+
+    # Rangos promedio (los empates comparten rango)
+    rangos = np.empty(len(valores))
+    ordenados = valores[orden]
+    inicio = 0
+    for fin in range(1, len(valores) + 1):
+        if fin == len(valores) or ordenados[fin] != ordenados[inicio]:
+            rangos[orden[inicio:fin]] = (inicio + fin + 1) / 2
+            inicio = fin
+
+    u = rangos[n1:].sum() - n2 * (n2 + 1) / 2
+    _, cuentas = np.unique(valores, return_counts=True)
+    n = n1 + n2
+    varianza = n1 * n2 / 12 * ((n + 1) - (cuentas ** 3 - cuentas).sum() / (n * (n - 1)))
+    if varianza <= 0:
+        return 1.0
+
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(varianza)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def comparar(base, actual, umbral=0.10, alfa=0.01):
+    """
+    Compara dos ejecuciones celda por celda
+
+    Una celda es regresión si la mediana empeora más que umbral (fracción) y la
+    prueba de Mann-Whitney es significativa al nivel alfa; mejora en el caso simétrico.
+    Las celdas que sólo están en actual son 'nueva'; las que sólo están en base,
+    'faltante' (actual None).
+
+    Retorna:
+    Lista de diccionarios {grafo, motor, base, actual, cambio, p, estado}
+    """
+    celdas_base = {(c['grafo'], c['motor']): c['muestras'] for c in base['celdas']}
+    filas = []
+
+    for celda in actual['celdas']:
+        clave = (celda['grafo'], celda['motor'])
+        muestras = np.array(celda['muestras'])
+        fila = {'grafo': clave[0], 'motor': clave[1], 'actual': float(np.median(muestras))}
+
+        if clave not in celdas_base:
+            fila.update(base=None, cambio=None, p=None, estado='nueva')
+            filas.append(fila)
+            continue
+
+        muestras_base = np.array(celdas_base[clave])
+        mediana_base = float(np.median(muestras_base))
+        cambio = fila['actual'] / mediana_base - 1
+
+        p_peor = mann_whitney(muestras_base, muestras)
+        p_mejor = mann_whitney(muestras, muestras_base)
+        if cambio > umbral and p_peor < alfa:
+            estado, p = 'regresión', p_peor
+        elif cambio < -umbral and p_mejor < alfa:
+            estado, p = 'mejora', p_mejor
+        else:
+            estado, p = 'sin cambio', min(p_peor, p_mejor)
+
+        fila.update(base=mediana_base, cambio=cambio, p=p, estado=estado)
+        filas.append(fila)
+
+    medidas = {(c['grafo'], c['motor']) for c in actual['celdas']}
+    for (grafo, motor), muestras_base in celdas_base.items():
+        if (grafo, motor) not in medidas:
+            filas.append({'grafo': grafo, 'motor': motor, 'base': float(np.median(muestras_base)),
+                          'actual': None, 'cambio': None, 'p': None, 'estado': 'faltante'})
+
+    return filas
+
+def imprimir_comparacion(base, actual, filas):
+    """
+    Imprime la tabla de comparación y avisa si las máquinas difieren
+    """
+    meta_base, meta_actual = base['metadatos'], actual['metadatos']
+    print(f"Base:   commit {meta_base.get('commit')} ({meta_base.get('fecha')})")
+    print(f"Actual: commit {meta_actual.get('commit')} ({meta_actual.get('fecha')})")
+    for campo in ('maquina', 'procesador', 'python'):
+        if meta_base.get(campo) != meta_actual.get(campo):
+            print(f"⚠️ {campo} distinto: {meta_base.get(campo)} vs {meta_actual.get(campo)}")
+
+    print(f"\n{'Grafo':<16} {'Motor':<20} {'Base':>10} {'Actual':>10} {'Cambio':>8} {'p':>8}  Estado")
+    for fila in filas:
+        if fila['base'] is None:
+            print(f"{fila['grafo']:<16} {fila['motor']:<20} {'-':>10} {fila['actual']:>10.6f}"
+                  f" {'-':>8} {'-':>8}  {fila['estado']}")
+            continue
+        if fila['actual'] is None:
+            print(f"{fila['grafo']:<16} {fila['motor']:<20} {fila['base']:>10.6f} {'-':>10}"
+                  f" {'-':>8} {'-':>8}  {fila['estado']} ⚠️")
+            continue
+        marca = '❌' if fila['estado'] == 'regresión' else ('✅' if fila['estado'] == 'mejora' else '')
+        print(f"{fila['grafo']:<16} {fila['motor']:<20} {fila['base']:>10.6f} {fila['actual']:>10.6f}"
+              f" {fila['cambio']:>+8.1%} {fila['p']:>8.4f}  {fila['estado']} {marca}")
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Seguimiento de regresiones de rendimiento")
+    comandos = parser.add_subparsers(dest='comando', required=True)
+
+    medir_cmd = comandos.add_parser('medir', help="mide los motores y guarda los resultados")
+    medir_cmd.add_argument('--salida', default='resultados_rendimiento.json')
+    medir_cmd.add_argument('--repeticiones', type=int, default=15)
+    medir_cmd.add_argument('--semilla', type=int, default=0)
+    medir_cmd.add_argument('--fases', action='store_true',
+                           help="incluir el desglose del tiempo por fase de cada celda")
+    medir_cmd.add_argument('--grafico', help="guardar el gráfico del desglose por fase (con --fases)")
+
+    comparar_cmd = comandos.add_parser('comparar', help="compara contra una línea base")
+    comparar_cmd.add_argument('base')
+    comparar_cmd.add_argument('actual', nargs='?',
+                              help="resultados a comparar (por defecto se mide ahora)")
+    comparar_cmd.add_argument('--umbral', type=float, default=0.10,
+                              help="empeoramiento relativo de la mediana tolerado")
+    comparar_cmd.add_argument('--alfa', type=float, default=0.01)
+    comparar_cmd.add_argument('--repeticiones', type=int, default=15)
+
+    args = parser.parse_args(argumentos)
+
+    if args.comando == 'medir':
+        resultados = medir(repeticiones=args.repeticiones, semilla=args.semilla, fases=args.fases)
+        guardar(resultados, args.salida)
+        print(f"Resultados guardados en {args.salida}")
+        if args.fases and args.grafico:
+            graficar_desglose({f"{c['motor']}\n{c['grafo']}": c['fases'] for c in resultados['celdas']},
+                              ruta=args.grafico)
+            print(f"Gráfico del desglose guardado en {args.grafico}")
+        return 0
+
+    base = cargar(args.base)
+    if args.actual:
+        actual = cargar(args.actual)
+    else:
+        actual = medir(repeticiones=args.repeticiones, semilla=base['metadatos'].get('semilla', 0))
+
+    filas = comparar(base, actual, args.umbral, args.alfa)
+    imprimir_comparacion(base, actual, filas)
+
+    faltantes = [fila for fila in filas if fila['estado'] == 'faltante']
+    if faltantes:
+        print(f"\n⚠️ {len(faltantes)} celda(s) de la base sin medir en la ejecución actual")
+
+    regresiones = [fila for fila in filas if fila['estado'] == 'regresión']
+    if regresiones:
+        print(f"\n❌ {len(regresiones)} regresión(es) de rendimiento")
+        return 1
+    print("\n✅ Sin regresiones")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+REORDENAMIENTO DE NODOS PARA LOCALIDAD DE MEMORIA
+En grafos grandes la relajación está dominada por accesos aleatorios a las
+distancias de los vecinos. Renumerar los nodos para que los vecinos queden
+cerca en memoria (orden BFS, Cuthill-McKee inverso o cubetas por grado)
+reduce fallos de caché en los motores sobre arreglos (GrafoCompacto).
+La permutación se aplica al grafo compacto conservando las etiquetas
+originales, así que resultado_a_dict devuelve los resultados sin más cambios.
+"""
+
+import time
+from collections import deque
+
+import numpy as np
+
+from grafo_compacto import GrafoCompacto
+
+def _vecinos_no_dirigidos(compacto):
+    """
+    Lista de adyacencia simétrica (aristas de salida y de entrada) por posición
+    """
+    origenes = np.repeat(np.arange(compacto.n), compacto.grados())
+    vecinos = [[] for _ in range(compacto.n)]
+    for u, v in zip(origenes.tolist(), compacto.indices.tolist()):
+        if u != v:
+            vecinos[u].append(v)
+            vecinos[v].append(u)
+    return vecinos
+
+def orden_bfs(compacto, inicio=0):
+    """
+    Nodos en orden de recorrido en anchura (ignorando la dirección de las
+    aristas), empezando por inicio y luego por cada componente no visitada
+
+    Retorna:
+    Arreglo orden donde orden[k] es la posición original del k-ésimo nodo
+    """
+    vecinos = _vecinos_no_dirigidos(compacto)
+    visitado = np.zeros(compacto.n, dtype=bool)
+    orden = []
+
+    for semilla in [inicio] + list(range(compacto.n)):
+        if visitado[semilla]:
+            continue
+        visitado[semilla] = True
+        cola = deque([semilla])
+        while cola:
+            nodo = cola.popleft()
+            orden.append(nodo)
+            for vecino in vecinos[nodo]:
+                if not visitado[vecino]:
+                    visitado[vecino] = True
+                    cola.append(vecino)
+
+    return np.array(orden, dtype=np.int64)
+
+def orden_cuthill_mckee(compacto, inverso=True):
+    """
+    Orden de Cuthill-McKee (inverso por defecto): BFS desde un nodo de grado
+    mínimo de cada componente, visitando los vecinos de menor a mayor grado;
+    reduce el ancho de banda de la matriz de adyacencia
+
+    Retorna:
+    Arreglo orden donde orden[k] es la posición original del k-ésimo nodo
+    """
+    vecinos = _vecinos_no_dirigidos(compacto)
+    grado = np.array([len(v) for v in vecinos], dtype=np.int64)
+    for lista in vecinos:
+        lista.sort(key=grado.__getitem__)
+
+    visitado = np.zeros(compacto.n, dtype=bool)
+    orden = []
+
+    # Cada componente empieza por su nodo de menor grado
+    for semilla in np.argsort(grado, kind='stable').tolist():
+        if visitado[semilla]:
+            continue
+        visitado[semilla] = True
+        cola = deque([semilla])
+        while cola:
+            nodo = cola.popleft()
+            orden.append(nodo)
+            for vecino in vecinos[nodo]:
+                if not visitado[vecino]:
+                    visitado[vecino] = True
+                    cola.append(vecino)
+
+    orden = np.array(orden, dtype=np.int64)
+    return orden[::-1].copy() if inverso else orden
+
+def orden_grado(compacto, descendente=True):
+    """
+    Nodos agrupados por grado (los de mayor grado primero por defecto), para
+    que los nodos más consultados compartan líneas de caché
+
+    Retorna:
+    Arreglo orden donde orden[k] es la posición original del k-ésimo nodo
+    """
+    grados = compacto.grados() + np.bincount(compacto.indices, minlength=compacto.n)
+    clave = -grados if descendente else grados
+    return np.argsort(clave, kind='stable')
+
+ORDENES = {
+    'bfs': orden_bfs,
+    'rcm': orden_cuthill_mckee,
+    'grado': orden_grado,
+}
+
+def permutar(compacto, orden):
+    """
+    Aplica una permutación de nodos a un GrafoCompacto
+
+    Parámetros:
+    compacto: GrafoCompacto original
+    orden: orden[k] = posición original del nodo que pasa a la posición k
+
+    Retorna:
+    GrafoCompacto con los nodos (y sus etiquetas) en el nuevo orden
+    """
+    n = compacto.n
+    nueva_posicion = np.empty(n, dtype=np.int64)
+    nueva_posicion[orden] = np.arange(n)
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(compacto.grados()[orden], out=indptr[1:])
+
+    # Aristas en el orden de sus nuevos nodos de origen
+    _, posiciones = compacto.aristas_de(orden)
+    indices = nueva_posicion[compacto.indices[posiciones]]
+    pesos = compacto.pesos[posiciones]
+    originales = compacto.pesos_originales
+    if originales is not None:
+        originales = originales[posiciones]
+
+    nodos = [compacto.nodos[i] for i in orden.tolist()]
+    return GrafoCompacto(nodos, indptr, indices.astype(compacto.indices.dtype, copy=False), pesos, originales)
+
+def reordenar(grafo, metodo='rcm'):
+    """
+    Renumera un grafo para mejorar la localidad de memoria
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}} o GrafoCompacto
+    metodo: 'bfs', 'rcm' o 'grado'
+
+    Retorna:
+    GrafoCompacto reordenado; conserva las etiquetas originales, así que los
+    motores sobre GrafoCompacto (delta_stepping, resultado_a_dict) devuelven
+    los resultados con los nodos originales
+    """
+    if metodo not in ORDENES:
+        raise ValueError(f"Método de reordenamiento desconocido: {metodo} (opciones: {sorted(ORDENES)})")
+    compacto = grafo if isinstance(grafo, GrafoCompacto) else GrafoCompacto.desde_dict(grafo)
+    return permutar(compacto, ORDENES[metodo](compacto))
+
+def dict_por_posicion(compacto):
+    """
+    Diccionario {posición: {posición: peso}} del grafo compacto, para los
+    motores sobre diccionarios (las etiquetas pasan a ser las posiciones)
+
+    Los resultados se traducen de vuelta con a_etiquetas(resultado, compacto.nodos).
+    """
+    posiciones = GrafoCompacto(list(range(compacto.n)), compacto.indptr, compacto.indices, compacto.pesos)
+    return posiciones.a_dict()
+
+def a_etiquetas(resultado, nodos):
+    """
+    Traduce {posición: valor} a {etiqueta original: valor}; los valores que
+    son posiciones de nodos (predecesores) también se traducen
+    """
+    distancias, predecesores = resultado
+    distancias = {nodos[i]: d for i, d in distancias.items()}
+    predecesores = {nodos[i]: (nodos[p] if p is not None else None) for i, p in predecesores.items()}
+    return distancias, predecesores
+
+def distancia_media_vecinos(compacto):
+    """
+    Distancia media |i - j| entre las posiciones de los extremos de cada
+    arista: una medida de la localidad del orden actual
+    """
+    origenes = np.repeat(np.arange(compacto.n), compacto.grados())
+    return float(np.abs(origenes - compacto.indices).mean()) if compacto.m else 0.0
+
+def ejecutar_prueba_reordenamiento(repeticiones=3):
+    """
+    Mide el efecto de cada orden sobre dijkstra_original y delta-stepping en
+    una red tipo carreteras y en un grafo de ley de potencia (mejor tiempo
+    de varias repeticiones)
+    """
+    from delta_stepping import delta_stepping_compacto
+    from dijkstra_original import dijkstra_original
+    from generadores_grafos import grafo_carreteras, grafo_ley_potencia
+
+    grafos = [
+        ("Carreteras 300x300", grafo_carreteras(300, semilla=0)),
+        ("Ley de potencia 100000n", grafo_ley_potencia(100000, semilla=0)),
+    ]
+
+    for nombre, grafo in grafos:
+        compacto = GrafoCompacto.desde_dict(grafo)
+        origen = compacto.nodos[0]
+        referencia, _ = dijkstra_original(grafo, origen)
+        print(f"\n{nombre}: n={compacto.n}, m={compacto.m}")
+        print(f"{'Orden':<10} {'Reordenar':>10} {'Dist. vecinos':>14} {'dijkstra':>10} {'delta':>10}  Iguales")
+
+        for metodo in ['original'] + list(ORDENES):
+            inicio = time.time()
+            reordenado = compacto if metodo == 'original' else reordenar(compacto, metodo)
+            tiempo_orden = time.time() - inicio
+
+            fuente = reordenado.indice[origen]
+            por_posicion = dict_por_posicion(reordenado)
+            tiempo_dijkstra = tiempo_delta = float('inf')
+            for _ in range(repeticiones):
+                inicio = time.time()
+                resultado = dijkstra_original(por_posicion, fuente)
+                tiempo_dijkstra = min(tiempo_dijkstra, time.time() - inicio)
+
+                inicio = time.time()
+                dist, pred = delta_stepping_compacto(reordenado, fuente)
+                tiempo_delta = min(tiempo_delta, time.time() - inicio)
+
+            distancias_dijkstra, _ = a_etiquetas(resultado, reordenado.nodos)
+            distancias_delta, _ = reordenado.resultado_a_dict(dist, pred)
+            iguales = distancias_dijkstra == referencia and distancias_delta == referencia
+
+            print(f"{metodo:<10} {tiempo_orden:>9.3f}s {distancia_media_vecinos(reordenado):>14.1f} "
+                  f"{tiempo_dijkstra:>9.3f}s {tiempo_delta:>9.3f}s  {iguales}")
+
+if __name__ == "__main__":
+    ejecutar_prueba_reordenamiento()
@@ -0,0 +1,65 @@
+"""
+RESULTADOS SSSP DISPERSOS
+Diccionarios que sólo guardan los nodos alcanzados: un nodo ausente se lee como
+inalcanzable (distancia inf, predecesor None). Así una consulta sobre un grafo
+enorme y desconectado paga sólo por lo que alcanza, no O(n) de inicialización.
+"""
+
+class DistanciasDispersas(dict):
+    """
+    {nodo: distancia} donde los nodos ausentes valen float('inf')
+
+    Sólo iteración, len e 'in' se limitan a los nodos alcanzados; el acceso
+    por índice se comporta como el diccionario completo de dijkstra_original.
+    """
+
+    def __missing__(self, nodo):
+        return float('inf')
+
+    def a_arreglo(self, nodos, dtype=None):
+        """
+        Convierte a un arreglo NumPy denso alineado con la lista nodos
+
+        Parámetros:
+        nodos: lista de nodos que define el orden del arreglo
+        dtype: tipo de dato (por defecto float64)
+
+        Retorna:
+        Arreglo con inf en los nodos no alcanzados
+        """
+        import numpy as np
+
+        arreglo = np.full(len(nodos), np.inf, dtype=dtype or np.float64)
+        for i, nodo in enumerate(nodos):
+            distancia = dict.get(self, nodo)
+            if distancia is not None:
+                arreglo[i] = distancia
+        return arreglo
+
+    def a_dict(self, nodos):
+        """
+        Diccionario completo con inf en los nodos no alcanzados
+        """
+        return {nodo: self[nodo] for nodo in nodos}
+
+class PredecesoresDispersos(dict):
+    """
+    {nodo: predecesor} donde los nodos ausentes valen None
+    """
+
+    def __missing__(self, nodo):
+        return None
+
+    def a_arreglo(self, nodos):
+        """
+        Convierte a un arreglo NumPy de posiciones (-1 = sin predecesor)
+        alineado con la lista nodos
+        """
+        import numpy as np
+
+        indice = {nodo: i for i, nodo in enumerate(nodos)}
+        arreglo = np.full(len(nodos), -1, dtype=np.int64)
+        for nodo, predecesor in self.items():
+            if predecesor is not None:
+                arreglo[indice[nodo]] = indice[predecesor]
+        return arreglo
@@ -0,0 +1,386 @@
+"""
+SELECCIÓN AUTOMÁTICA DE MOTOR SSSP
+Elige el algoritmo más rápido para cada grafo a partir de estadísticas baratas
+(n, m, rango de pesos, integralidad, sesgo de grados, aciclicidad) y un modelo de costo calibrado
+"""
+
+import math
+import random
+import time
+
+import numpy as np
+
+from dijkstra_original import dijkstra_original
+from dijkstra_dial import dijkstra_dial
+from dijkstra_denso import dijkstra_denso, matriz_adyacencia
+from bellman_ford_spfa import spfa
+from caminos_dag import orden_topologico, sssp_dag
+
+# Motores disponibles: nombre -> función(grafo, origen) -> (distancias, predecesores)
+MOTORES = {
+    'heap': dijkstra_original,
+    'dial': dijkstra_dial,
+    'denso': dijkstra_denso,
+    'spfa': spfa,
+    'dag': sssp_dag,
+}
+
+# Modelo de costo lineal: segundos = suma(coeficiente_i * término_i).
+# Los términos de cada motor están en _terminos_costo; los coeficientes se
+# obtuvieron con SelectorMotor.calibrar en la máquina de referencia.
+COEFICIENTES_POR_DEFECTO = {
+    'heap': (5.7e-8, 1.4e-7),
+    'dial': (2.2e-7, 5.4e-6),
+    'denso': (1.4e-7, 1.0e-9, 1.35e-5),
+    'spfa': (2.0e-7,),
+    'dag': (1.8e-7, 1.0e-7),
+}
+
+def estadisticas_grafo(grafo):
+    """
+    Calcula en una sola pasada las estadísticas que usa el modelo de costo
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+
+    Retorna:
+    Diccionario con n, m, densidad, peso_min, peso_max, enteros,
+    grado_medio, grado_max, sesgo_grado (grado máximo / grado medio) y
+    aciclico (algoritmo de Kahn, una pasada adicional)
+    """
+    return _estadisticas_y_orden(grafo)[0]
+
+def _estadisticas_y_orden(grafo):
+    """
+    Estadísticas del grafo y su orden topológico (None si tiene ciclos), que
+    sale de la misma pasada de Kahn con la que se detecta la aciclicidad
+    """
+    n = len(grafo)
+    m = 0
+    grado_max = 0
+    peso_min = float('inf')
+    peso_max = float('-inf')
+    enteros = True
+
+    for vecinos in grafo.values():
+        grado = len(vecinos)
+        m += grado
+        if grado > grado_max:
+            grado_max = grado
+        for peso in vecinos.values():
+            if peso < peso_min:
+                peso_min = peso
+            if peso > peso_max:
+                peso_max = peso
+            if enteros and peso != int(peso):
+                enteros = False
+
+    if m == 0:
+        peso_min = peso_max = 0
+
+    grado_medio = m / n if n else 0
+    orden = orden_topologico(grafo)
+
+    estadisticas = {
+        'nodos': n,
+        'aristas': m,
+        'densidad': m / (n * (n - 1)) if n > 1 else 0,
+        'peso_min': peso_min,
+        'peso_max': peso_max,
+        'enteros': enteros,
+        'grado_medio': grado_medio,
+        'grado_max': grado_max,
+        'sesgo_grado': grado_max / grado_medio if grado_medio > 0 else 0,
+        'aciclico': orden is not None,
+    }
+    return estadisticas, orden
+
+def _terminos_costo(estadisticas, consultas=1, matriz_lista=False, orden_listo=False):
+    """
+    Términos del modelo de costo de cada motor aplicable
+
+    Parámetros:
+    estadisticas: resultado de estadisticas_grafo
+    consultas: consultas hechas sobre el mismo grafo, entre las que se
+               amortiza la construcción de la matriz densa
+    matriz_lista: True si la matriz de adyacencia densa ya está construida
+    orden_listo: True si el orden topológico del grafo ya está calculado
+
+    Retorna:
+    Diccionario {motor: tupla de términos}, alineada con los coeficientes
+    """
+    n = estadisticas['nodos']
+    m = estadisticas['aristas']
+    terminos = {}
+
+    # Grafo acíclico: una pasada en orden topológico (Kahn, si no está calculado)
+    if estadisticas.get('aciclico', False):
+        terminos['dag'] = (0 if orden_listo else (n + m) / consultas, n + m)
+
+    # Con pesos negativos sólo SPFA (y la pasada topológica en grafos acíclicos) es correcto
+    if estadisticas['peso_min'] < 0:
+        terminos['spfa'] = (n + m,)
+        return terminos
+
+    # Heap binario: recorrer las m aristas más ~n·ln(m/n) inserciones de O(log n)
+    inserciones = n * (1 + math.log(1 + m / max(n, 1)))
+    terminos['heap'] = (m, inserciones * math.log2(n + 1))
+
+    # Barrido denso vectorizado: construir la matriz cuesta O(m) en Python,
+    # luego n iteraciones de O(n) en C, cada una con un costo fijo de NumPy
+    terminos['denso'] = (0 if matriz_lista else m / consultas, n * n, n)
+
+    # Dial: O(n + m + D); D se estima como peso máximo por diámetro esperado.
+    # Un sesgo de grados alto (hubs) acorta el diámetro.
+    if estadisticas['enteros']:
+        grado = max(estadisticas['grado_medio'], 2)
+        diametro = math.log(n + 1) / math.log(grado) + 1
+        diametro /= max(1.0, math.log2(1 + estadisticas['sesgo_grado']))
+        terminos['dial'] = (n + m, estadisticas['peso_max'] * min(diametro, n))
+
+    return terminos
+
+def _minimos_cuadrados_no_negativos(filas, tiempos):
+    """
+    Ajusta coeficientes >= 0 descartando iterativamente los términos negativos
+    """
+    A = np.array(filas, dtype=np.float64)
+    b = np.array(tiempos, dtype=np.float64)
+    activos = list(range(A.shape[1]))
+    coeficientes = np.zeros(A.shape[1])
+
+    while activos:
+        solucion, *_ = np.linalg.lstsq(A[:, activos], b, rcond=None)
+        if (solucion >= 0).all():
+            coeficientes[activos] = solucion
+            break
+        activos = [j for j, c in zip(activos, solucion) if c > 0]
+
+    return tuple(float(c) for c in coeficientes)
+
+class PreparacionGrafo:
+    """
+    Datos de un grafo que el selector reutiliza entre consultas: las
+    estadísticas, el orden topológico (de la misma pasada) y, tras la primera
+    consulta densa, la matriz de adyacencia
+
+    Igual que Condensacion, la construye explícitamente quien va a repetir
+    consultas sobre un grafo que no cambia; si el grafo se modifica hay que
+    construir otra.
+    """
+
+    def __init__(self, grafo):
+        self.grafo = grafo
+        self.estadisticas, self.orden = _estadisticas_y_orden(grafo)
+        self.matriz = None
+        self.consultas = 0
+
+class SelectorMotor:
+    """
+    Selecciona el motor SSSP con menor costo estimado y registra cada decisión
+    """
+
+    def __init__(self, coeficientes=None, max_registro=1000):
+        self.coeficientes = dict(COEFICIENTES_POR_DEFECTO)
+        if coeficientes:
+            self.coeficientes.update(coeficientes)
+        self.max_registro = max_registro
+        self.decisiones = []
+
+    def estimar_costos(self, estadisticas, consultas=1, matriz_lista=False, orden_listo=False):
+        """
+        Retorna {motor: segundos estimados} para los motores aplicables
+        """
+        return {
+            motor: sum(c * t for c, t in zip(self.coeficientes[motor], terminos))
+            for motor, terminos in _terminos_costo(estadisticas, consultas, matriz_lista, orden_listo).items()
+        }
+
+    def elegir(self, estadisticas, consultas=1, matriz_lista=False, orden_listo=False):
+        """
+        Elige el motor de menor costo estimado
+
+        Retorna:
+        motor: nombre del motor elegido
+        costos: diccionario con el costo estimado de cada candidato
+        """
+        costos = self.estimar_costos(estadisticas, consultas, matriz_lista, orden_listo)
+        if not costos:
+            raise ValueError("Ningún motor disponible admite este grafo")
+        motor = min(costos, key=costos.get)
+        return motor, costos
+
+    def resolver(self, grafo, origen, preparacion=None):
+        """
+        Resuelve SSSP con el motor elegido automáticamente
+
+        Parámetros:
+        grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+        origen: nodo de inicio
+        preparacion: PreparacionGrafo de este grafo para reutilizar
+                     estadísticas, orden y matriz entre consultas; si no se
+                     da, todo se calcula de nuevo en cada llamada
+
+        Retorna:
+        distancias, predecesores (igual que dijkstra_original)
+
+        Lanza:
+        ValueError: si la preparación corresponde a otro grafo
+        """
+        if preparacion is None:
+            preparacion = PreparacionGrafo(grafo)
+        elif preparacion.grafo is not grafo:
+            raise ValueError("La preparación corresponde a otro grafo")
+        estadisticas = preparacion.estadisticas
+        preparacion.consultas += 1
+        motor, costos = self.elegir(estadisticas, preparacion.consultas,
+                                    preparacion.matriz is not None, preparacion.orden is not None)
+
+        inicio = time.perf_counter()
+        if motor == 'denso':
+            # Consultas repetidas con la misma preparación reutilizan la matriz
+            if preparacion.matriz is None:
+                preparacion.matriz = matriz_adyacencia(grafo)
+            distancias, predecesores = dijkstra_denso(grafo, origen, preparacion.matriz)
+        elif motor == 'dag':
+            # ... y el orden topológico
+            distancias, predecesores = sssp_dag(grafo, origen, orden=preparacion.orden)
+        else:
+            distancias, predecesores = MOTORES[motor](grafo, origen)
+        tiempo = time.perf_counter() - inicio
+
+        self._registrar({
+            'motor': motor,
+            'origen': origen,
+            'costos_estimados': costos,
+            'tiempo_real': tiempo,
+            'estadisticas': estadisticas,
+        })
+
+        return distancias, predecesores
+
+    def _registrar(self, decision):
+        """
+        Guarda una decisión para auditoría, descartando las más antiguas
+        """
+        self.decisiones.append(decision)
+        if len(self.decisiones) > self.max_registro:
+            del self.decisiones[:len(self.decisiones) - self.max_registro]
+
+    def calibrar(self, tamanos=(50, 200, 500, 1000), densidades=(0.01, 0.05, 0.3), repeticiones=3, semilla=0):
+        """
+        Ajusta los coeficientes midiendo cada motor sobre grafos aleatorios
+
+        Los coeficientes de cada motor se obtienen por mínimos cuadrados no
+        negativos entre los términos de _terminos_costo y el mejor tiempo medido.
+
+        Retorna:
+        Diccionario con los coeficientes calibrados
+        """
+        generador = random.Random(semilla)
+        filas = {motor: [] for motor in MOTORES}
+        tiempos = {motor: [] for motor in MOTORES}
+
+        def medir(funcion):
+            mejor = float('inf')
+            for _ in range(repeticiones):
+                inicio = time.perf_counter()
+                funcion()
+                mejor = min(mejor, time.perf_counter() - inicio)
+            return mejor
+
+        for n in tamanos:
+            for densidad in densidades:
+                grafo = {}
+                for i in range(n):
+                    grafo[i] = {}
+                    for j in range(n):
+                        if i != j and generador.random() < densidad:
+                            grafo[i][j] = generador.randint(1, 100)
+
+                estadisticas = estadisticas_grafo(grafo)
+                terminos = _terminos_costo(estadisticas)
+                for motor in ('heap', 'dial'):
+                    if motor in terminos:
+                        filas[motor].append(terminos[motor])
+                        tiempos[motor].append(medir(lambda: MOTORES[motor](grafo, 0)))
+
+                # Denso: se mide por separado con y sin construcción de la matriz
+                matriz = matriz_adyacencia(grafo)
+                filas['denso'].append(terminos['denso'])
+                tiempos['denso'].append(medir(lambda: dijkstra_denso(grafo, 0)))
+                filas['denso'].append(_terminos_costo(estadisticas, matriz_lista=True)['denso'])
+                tiempos['denso'].append(medir(lambda: dijkstra_denso(grafo, 0, matriz)))
+
+                # DAG: la versión acíclica del grafo (sólo aristas i -> j con i < j),
+                # con y sin el cálculo del orden topológico
+                dag = {i: {j: w for j, w in vecinos.items() if j > i} for i, vecinos in grafo.items()}
+                estadisticas_dag = estadisticas_grafo(dag)
+                orden = orden_topologico(dag)
+                filas['dag'].append(_terminos_costo(estadisticas_dag)['dag'])
+                tiempos['dag'].append(medir(lambda: sssp_dag(dag, 0)))
+                filas['dag'].append(_terminos_costo(estadisticas_dag, orden_listo=True)['dag'])
+                tiempos['dag'].append(medir(lambda: sssp_dag(dag, 0, orden=orden)))
+
+                # SPFA: el mismo grafo reponderado con potenciales aleatorios,
+                # w(i, j) + p(i) - p(j); aparecen aristas negativas pero cada
+                # ciclo conserva su peso, así que no hay ciclos negativos
+                potencial = [generador.randint(0, 100) for _ in range(n)]
+                negativo = {i: {j: w + potencial[i] - potencial[j] for j, w in vecinos.items()}
+                            for i, vecinos in grafo.items()}
+                terminos_negativo = _terminos_costo(estadisticas_grafo(negativo))
+                if 'spfa' in terminos_negativo:
+                    filas['spfa'].append(terminos_negativo['spfa'])
+                    tiempos['spfa'].append(medir(lambda: spfa(negativo, 0)))
+
+        for motor in MOTORES:
+            if filas[motor]:
+                self.coeficientes[motor] = _minimos_cuadrados_no_negativos(filas[motor], tiempos[motor])
+
+        return dict(self.coeficientes)
+
+# Selector compartido por resolver_auto (sólo guarda coeficientes y decisiones)
+_selector_global = SelectorMotor()
+
+def resolver_auto(grafo, origen, preparacion=None, selector=None):
+    """
+    Punto de entrada 'auto': elige el motor y resuelve SSSP
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+    origen: nodo de inicio
+    preparacion: PreparacionGrafo para consultas repetidas (opcional)
+    selector: SelectorMotor a usar; por defecto el selector global
+
+    Retorna:
+    distancias, predecesores
+    """
+    if selector is None:
+        selector = _selector_global
+    return selector.resolver(grafo, origen, preparacion)
+
+def ultimas_decisiones(cantidad=10, selector=None):
+    """
+    Retorna las últimas decisiones registradas para auditoría
+    """
+    if selector is None:
+        selector = _selector_global
+    return selector.decisiones[-cantidad:]
+
+if __name__ == "__main__":
+    selector = SelectorMotor()
+    print("Calibrando modelo de costo...")
+    for motor, coeficientes in selector.calibrar().items():
+        print(f"  {motor}: " + ", ".join(f"{c:.3e}" for c in coeficientes))
+
+    for n, densidad, aciclico in [(10, 0.3, False), (200, 0.05, False), (300, 0.9, False), (2000, 0.005, True)]:
+        grafo = {i: {j: random.randint(1, 100) for j in range(n)
+                     if j != i and (j > i or not aciclico) and random.random() < densidad}
+                 for i in range(n)}
+        # Varias consultas: en grafos densos la construcción de la matriz se amortiza
+        preparacion = PreparacionGrafo(grafo)
+        for origen in range(6):
+            selector.resolver(grafo, origen, preparacion)
+            decision = selector.decisiones[-1]
+            print(f"n={n}, densidad={densidad}, origen={origen}: motor={decision['motor']}, "
+                  f"tiempo={decision['tiempo_real']:.6f}s")
@@ -0,0 +1,263 @@
+"""
+SERVIDOR ASÍNCRONO DE CONSULTAS DE CAMINO MÁS CORTO
+Servidor local (TCP en localhost o socket Unix) basado en asyncio que:
+- mantiene el grafo residente en cada proceso trabajador
+- fusiona consultas concurrentes con el mismo origen en un solo cálculo
+  y conserva los resultados de los orígenes más recientes (LRU)
+- ejecuta los cálculos en un pool de procesos para no bloquear el bucle de eventos
+- expone percentiles de latencia
+
+Protocolo: una línea JSON por consulta y una línea JSON por respuesta
+  {"origen": "A", "destino": "F"}  ->  {"distancia": 13, "camino": ["A", ...]}
+  {"comando": "estadisticas"}      ->  {"consultas": ..., "p50": ..., ...}
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from dijkstra_original import dijkstra_original, reconstruir_camino
+
+# Estado de cada proceso trabajador (se carga una vez en el inicializador)
+_grafo_trabajador = None
+_motor_trabajador = None
+
+def _inicializar_trabajador(grafo, motor):
+    global _grafo_trabajador, _motor_trabajador
+    _grafo_trabajador = grafo
+    _motor_trabajador = motor
+
+def _resolver_en_trabajador(origen):
+    return _motor_trabajador(_grafo_trabajador, origen)
+
+def percentiles(valores, cuantiles=(50, 90, 99)):
+    """
+    Percentiles por el método del rango más cercano
+
+    Retorna:
+    Diccionario {'p50': ..., 'p90': ..., 'p99': ...} (None si no hay valores)
+    """
+    ordenados = sorted(valores)
+    resultado = {}
+    for q in cuantiles:
+        if ordenados:
+            posicion = max(0, min(len(ordenados) - 1, int(round(q / 100 * len(ordenados))) - 1))
+            resultado[f'p{q}'] = ordenados[posicion]
+        else:
+            resultado[f'p{q}'] = None
+    return resultado
+
+class ServidorConsultas:
+    """
+    Servidor de consultas (origen, destino) sobre un grafo residente
+    """
+
+    def __init__(self, grafo, motor=dijkstra_original, procesos=None, max_resultados=64,
+                 max_latencias=10000):
+        """
+        Parámetros:
+        grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+        motor: función(grafo, origen) -> (distancias, predecesores) a nivel de módulo
+        procesos: tamaño del pool (por defecto, número de CPUs)
+        max_resultados: resultados por origen que se conservan (0 = ninguno)
+        max_latencias: cantidad de latencias recientes para los percentiles
+        """
+        self.grafo = grafo
+        self.pool = ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar_trabajador,
+                                        initargs=(grafo, motor))
+        self.en_curso = {}  # origen -> Future con (distancias, predecesores)
+        self.resultados = OrderedDict()  # origen -> (distancias, predecesores)
+        self.max_resultados = max_resultados
+        self.latencias = deque(maxlen=max_latencias)
+        self.consultas = 0
+        self.calculos = 0
+        self.servidor = None
+
+    async def iniciar(self, host='127.0.0.1', puerto=0, ruta_unix=None):
+        """
+        Comienza a aceptar conexiones; con puerto=0 el sistema elige uno libre
+
+        Retorna:
+        Dirección de escucha: (host, puerto) o la ruta del socket Unix
+        """
+        if ruta_unix is not None:
+            self.servidor = await asyncio.start_unix_server(self._atender, path=ruta_unix)
+            return ruta_unix
+        self.servidor = await asyncio.start_server(self._atender, host, puerto)
+        return self.servidor.sockets[0].getsockname()[:2]
+
+    async def detener(self):
+        if self.servidor is not None:
+            self.servidor.close()
+            await self.servidor.wait_closed()
+        # Esperar a los trabajadores en un hilo aparte, sin bloquear el bucle de eventos
+        await asyncio.get_running_loop().run_in_executor(None, self.pool.shutdown, True)
+
+    async def resolver(self, origen):
+        """
+        Resuelve desde origen; si ya hay un cálculo en curso para ese origen
+        se espera el mismo resultado en vez de lanzar otro
+        """
+        if origen in self.resultados:
+            self.resultados.move_to_end(origen)
+            return self.resultados[origen]
+
+        futuro = self.en_curso.get(origen)
+        if futuro is None:
+            bucle = asyncio.get_running_loop()
+            futuro = bucle.run_in_executor(self.pool, _resolver_en_trabajador, origen)
+            self.en_curso[origen] = futuro
+            self.calculos += 1
+            futuro.add_done_callback(lambda f: self._terminar(origen, f))
+        return await asyncio.shield(futuro)
+
+    def _terminar(self, origen, futuro):
+        """
+        Retira el cálculo de los pendientes y guarda su resultado
+        """
+        self.en_curso.pop(origen, None)
+        if self.max_resultados and not futuro.cancelled() and futuro.exception() is None:
+            self.resultados[origen] = futuro.result()
+            if len(self.resultados) > self.max_resultados:
+                self.resultados.popitem(last=False)
+
+    async def consultar(self, origen, destino):
+        """
+        Distancia y camino de origen a destino
+        """
+        if origen not in self.grafo or destino not in self.grafo:
+            return {'error': 'nodo desconocido'}
+
+        distancias, predecesores = await self.resolver(origen)
+        distancia = distancias[destino]
+        if distancia == float('inf'):
+            return {'distancia': None, 'camino': []}
+        return {'distancia': distancia, 'camino': reconstruir_camino(predecesores, destino)}
+
+    def estadisticas(self):
+        """
+        Contadores y percentiles de latencia (en segundos)
+        """
+        datos = {
+            'consultas': self.consultas,
+            'calculos': self.calculos,
+            'en_curso': len(self.en_curso),
+        }
+        datos.update(percentiles(self.latencias))
+        return datos
+
+    async def _atender(self, lector, escritor):
+        """
+        Atiende una conexión: una consulta JSON por línea
+        """
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+
+                inicio = time.perf_counter()
+                try:
+                    consulta = json.loads(linea)
+                    if not isinstance(consulta, dict):
+                        raise TypeError("la consulta debe ser un objeto JSON")
+                    if consulta.get('comando') == 'estadisticas':
+                        respuesta = self.estadisticas()
+                    else:
+                        self.consultas += 1
+                        respuesta = await self.consultar(consulta['origen'], consulta['destino'])
+                        self.latencias.append(time.perf_counter() - inicio)
+                except (ValueError, KeyError, TypeError) as error:
+                    respuesta = {'error': str(error)}
+                except Exception as error:
+                    # Falla del trabajador (BrokenProcessPool, excepción del motor):
+                    # se responde a esta consulta y la conexión sigue atendida
+                    respuesta = {'error': f"{type(error).__name__}: {error}"}
+
+                escritor.write(json.dumps(respuesta).encode() + b'\n')
+                await escritor.drain()
+        except ConnectionResetError:
+            # Cliente desconectado
+            pass
+        finally:
+            # Al detener el servidor, CancelledError se propaga tras cerrar la conexión
+            escritor.close()
+
+async def generar_carga(direccion, pares, conexiones=8):
+    """
+    Cliente generador de carga: reparte las consultas entre varias conexiones
+    concurrentes y mide la latencia vista por el cliente
+
+    Parámetros:
+    direccion: (host, puerto) o ruta de socket Unix
+    pares: lista de (origen, destino)
+    conexiones: número de conexiones simultáneas
+
+    Retorna:
+    Diccionario con número de consultas, tiempo total, consultas/segundo y percentiles
+    """
+    latencias = []
+
+    async def cliente(lote):
+        if isinstance(direccion, str):
+            lector, escritor = await asyncio.open_unix_connection(direccion)
+        else:
+            lector, escritor = await asyncio.open_connection(*direccion)
+        for origen, destino in lote:
+            inicio = time.perf_counter()
+            escritor.write(json.dumps({'origen': origen, 'destino': destino}).encode() + b'\n')
+            await escritor.drain()
+            await lector.readline()
+            latencias.append(time.perf_counter() - inicio)
+        escritor.close()
+        await escritor.wait_closed()
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente(pares[i::conexiones]) for i in range(conexiones)))
+    total = time.perf_counter() - inicio
+
+    resultado = {
+        'consultas': len(pares),
+        'tiempo_total': total,
+        'consultas_por_segundo': len(pares) / total if total > 0 else 0,
+    }
+    resultado.update(percentiles(latencias))
+    return resultado
+
+async def _demostracion():
+    """
+    Levanta el servidor con un grafo aleatorio y lo somete a carga con
+    muchos orígenes repetidos; sin caché de resultados para mostrar sólo
+    la fusión de consultas concurrentes
+    """
+    import random
+
+    n = 5000
+    grafo = {i: {} for i in range(n)}
+    for i in range(n):
+        for j in random.sample(range(n), 5):
+            if i != j:
+                grafo[i][j] = random.randint(1, 100)
+
+    servidor = ServidorConsultas(grafo, max_resultados=0)
+    direccion = await servidor.iniciar()
+    print(f"Servidor escuchando en {direccion}")
+
+    origenes = random.sample(range(n), 20)
+    pares = [(random.choice(origenes), random.randrange(n)) for _ in range(2000)]
+    carga = await generar_carga(direccion, pares, conexiones=32)
+
+    print(f"Cliente: {carga['consultas']} consultas en {carga['tiempo_total']:.3f}s "
+          f"({carga['consultas_por_segundo']:.0f}/s), p50={carga['p50'] * 1000:.2f}ms, "
+          f"p99={carga['p99'] * 1000:.2f}ms")
+    estadisticas = servidor.estadisticas()
+    print(f"Servidor: {estadisticas['consultas']} consultas, {estadisticas['calculos']} cálculos, "
+          f"p50={estadisticas['p50'] * 1000:.2f}ms, p90={estadisticas['p90'] * 1000:.2f}ms, "
+          f"p99={estadisticas['p99'] * 1000:.2f}ms")
+
+    await servidor.detener()
+
+if __name__ == "__main__":
+    asyncio.run(_demostracion())
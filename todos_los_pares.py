@@ -0,0 +1,213 @@
+"""
+CAMINOS MÁS CORTOS ENTRE TODOS LOS PARES (APSP)
+- Floyd-Warshall por bloques con NumPy: O(n³) en C, recorriendo la matriz por
+  franjas de filas que caben en caché
+- Johnson para grafos dispersos: repesado con SPFA (Bellman-Ford) y un Dijkstra por
+  origen sobre arreglos compactos, O(n·m log n)
+La matriz resultado puede escribirse en un archivo .npy mapeado en memoria
+para grafos cuya matriz no cabe en RAM.
+"""
+
+import heapq
+import time
+
+import numpy as np
+
+from bellman_ford_spfa import potenciales_johnson
+from perfilado import perfilar
+
+def _reservar_matriz(n, dtype, archivo):
+    """
+    Reserva la matriz n x n en memoria o como archivo .npy mapeado en memoria
+    """
+    if archivo is None:
+        return np.empty((n, n), dtype=dtype)
+    return np.lib.format.open_memmap(archivo, mode='w+', dtype=dtype, shape=(n, n))
+
+@perfilar
+def floyd_warshall_bloques(matriz, tam_bloque=64, en_sitio=False, dtype=None):
+    """
+    Floyd-Warshall por bloques sobre una matriz de adyacencia
+
+    Para cada bloque de pivotes kb se cierra primero el panel de filas kb
+    (filas finales para ese bloque) y luego cada franja de tam_bloque filas
+    aplica los pivotes del bloque mientras permanece en caché.
+
+    Parámetros:
+    matriz: arreglo n x n con pesos (inf = sin arista); puede ser un memmap
+    tam_bloque: número de filas y pivotes por bloque
+    en_sitio: si es True y el dtype coincide, se sobrescribe matriz
+    dtype: np.float32 o np.float64 (por defecto, el de la matriz)
+
+    Retorna:
+    Matriz n x n de distancias mínimas
+    """
+    dtype = np.dtype(dtype or matriz.dtype)
+    if en_sitio and matriz.dtype == dtype:
+        D = matriz
+    else:
+        D = matriz.astype(dtype, copy=True)
+
+    n = D.shape[0]
+    np.fill_diagonal(D, np.minimum(np.diagonal(D), 0))
+
+    for inicio_k in range(0, n, tam_bloque):
+        fin_k = min(inicio_k + tam_bloque, n)
+
+        # Fases 1 y 2: bloque diagonal y panel de filas del bloque de pivotes
+        panel = D[inicio_k:fin_k]
+        for k in range(inicio_k, fin_k):
+            np.minimum(panel, panel[:, k, None] + D[k], out=panel)
+
+        # Fase 3: el resto de franjas de filas usa el panel ya cerrado
+        for inicio_i in range(0, n, tam_bloque):
+            if inicio_i == inicio_k:
+                continue
+            franja = D[inicio_i:inicio_i + tam_bloque]
+            for k in range(inicio_k, fin_k):
+                np.minimum(franja, franja[:, k, None] + D[k], out=franja)
+
+    if (np.diagonal(D) < 0).any():
+        raise ValueError("El grafo contiene un ciclo negativo")
+
+    return D
+
+def _arreglos_compactos(grafo):
+    """
+    Convierte el grafo a listas de adyacencia indexadas por posición
+    """
+    nodos = list(grafo)
+    indice = {nodo: i for i, nodo in enumerate(nodos)}
+    adyacencia = [[(indice[vecino], peso) for vecino, peso in grafo[nodo].items()] for nodo in nodos]
+    return nodos, indice, adyacencia
+
+def _dijkstra_indices(adyacencia, fuente, dist):
+    """
+    Dijkstra con heap sobre listas de adyacencia; escribe en la lista dist
+    """
+    dist[fuente] = 0
+    heap = [(0, fuente)]
+    procesado = [False] * len(adyacencia)
+
+    while heap:
+        distancia_actual, u = heapq.heappop(heap)
+        if procesado[u]:
+            continue
+        procesado[u] = True
+
+        for v, peso in adyacencia[u]:
+            nueva_distancia = distancia_actual + peso
+            if nueva_distancia < dist[v]:
+                dist[v] = nueva_distancia
+                heapq.heappush(heap, (nueva_distancia, v))
+
+@perfilar
+def johnson(grafo, dtype=np.float64, archivo=None):
+    """
+    APSP de Johnson: repesado con potenciales y un Dijkstra por origen
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+    dtype: tipo de dato de la matriz resultado
+    archivo: ruta .npy opcional donde escribir la matriz mapeada en memoria
+
+    Retorna:
+    matriz: arreglo n x n de distancias (inf = inalcanzable)
+    nodos: lista de nodos en el orden de filas/columnas
+    """
+    nodos, _, adyacencia = _arreglos_compactos(grafo)
+    n = len(nodos)
+
+    # Repesado w'(u, v) = w(u, v) + h(u) - h(v) >= 0
+    potenciales = potenciales_johnson(grafo)
+    h = [potenciales[nodo] for nodo in nodos]
+    repesada = [[(v, peso + h[u] - h[v]) for v, peso in adyacencia[u]] for u in range(n)]
+    h = np.array(h, dtype=np.float64)
+
+    salida = _reservar_matriz(n, dtype, archivo)
+    for u in range(n):
+        dist = [float('inf')] * n
+        _dijkstra_indices(repesada, u, dist)
+        # Deshacer el repesado: d(u, v) = d'(u, v) - h(u) + h(v)
+        salida[u] = np.array(dist, dtype=np.float64) - h[u] + h
+
+    if archivo is not None:
+        salida.flush()
+
+    return salida, nodos
+
+def distancias_todos_los_pares(grafo, metodo='auto', dtype=np.float64, archivo=None, tam_bloque=64):
+    """
+    Matriz completa de distancias mínimas entre todos los pares de nodos
+
+    Parámetros:
+    grafo: diccionario de diccionarios {nodo: {vecino: peso}}
+    metodo: 'floyd', 'johnson' o 'auto' (según la densidad del grafo)
+    dtype: np.float32 para reducir a la mitad la memoria, o np.float64
+    archivo: ruta .npy opcional; la matriz se escribe mapeada en memoria
+    tam_bloque: tamaño de bloque para Floyd-Warshall
+
+    Retorna:
+    matriz: arreglo n x n de distancias (inf = inalcanzable)
+    nodos: lista de nodos en el orden de filas/columnas
+    """
+    n = len(grafo)
+    m = sum(len(vecinos) for vecinos in grafo.values())
+
+    if metodo == 'auto':
+        # Floyd-Warshall hace n³ operaciones en C; Johnson ~n·m en Python,
+        # unas 300 veces más caras cada una
+        metodo = 'floyd' if n * n < 300 * m else 'johnson'
+
+    if metodo == 'johnson':
+        return johnson(grafo, dtype, archivo)
+
+    if metodo != 'floyd':
+        raise ValueError(f"Método APSP desconocido: {metodo}")
+
+    nodos = list(grafo)
+    indice = {nodo: i for i, nodo in enumerate(nodos)}
+    matriz = _reservar_matriz(n, dtype, archivo)
+    matriz[:] = np.inf
+    for i, nodo in enumerate(nodos):
+        vecinos = grafo[nodo]
+        if vecinos:
+            matriz[i, [indice[vecino] for vecino in vecinos]] = list(vecinos.values())
+
+    floyd_warshall_bloques(matriz, tam_bloque, en_sitio=True)
+
+    if archivo is not None:
+        matriz.flush()
+
+    return matriz, nodos
+
+def ejecutar_prueba_apsp():
+    """
+    Compara Floyd-Warshall por bloques y Johnson contra n llamadas a dijkstra_original
+    """
+    import random
+    from dijkstra_original import dijkstra_original
+
+    n = 300
+    grafo = {i: {j: random.randint(1, 100) for j in range(n) if j != i and random.random() < 0.05}
+             for i in range(n)}
+
+    inicio = time.time()
+    referencia = []
+    for u in grafo:
+        distancias, _ = dijkstra_original(grafo, u)
+        referencia.append([distancias[v] for v in grafo])
+    referencia = np.array(referencia, dtype=np.float64)
+    tiempo_dijkstra = time.time() - inicio
+
+    print(f"APSP con n={n}, m={sum(len(v) for v in grafo.values())}")
+    print(f"n x dijkstra_original: {tiempo_dijkstra:.4f} segundos")
+
+    for metodo in ('floyd', 'johnson'):
+        inicio = time.time()
+        matriz, _ = distancias_todos_los_pares(grafo, metodo)
+        tiempo = time.time() - inicio
+        print(f"{metodo}: {tiempo:.4f} segundos, iguales: {np.array_equal(matriz, referencia)}")
+
+if __name__ == "__main__":
+    ejecutar_prueba_apsp()